@@ -0,0 +1,105 @@
+import itertools
+import queue
+import threading
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from SolverInstrumentation import AnalysisCancelled, SolverInstrumentation
+
+
+class AnalysisQueue(QThread):
+    """
+    Runs analyses one after another on a worker thread so the GUI stays responsive.
+    Every submitted model is copied first, so the tables can be edited while it is solved.
+    Signals are delivered to the GUI thread; each carries the job id returned by submit().
+    Cancelling a running analysis takes effect at its next phase boundary.
+    Jobs with the same solver options reuse one FrameSolver through reanalyze(), so
+    re-running after a small edit only redoes the work that edit requires.
+    """
+
+    phaseStarted = pyqtSignal(int, str)
+    phaseFinished = pyqtSignal(int, str, float)
+    analysisFinished = pyqtSignal(int, object, object)  # job id, solved model copy, FrameResults
+    analysisFailed = pyqtSignal(int, object)  # job id, exception
+    analysisCancelled = pyqtSignal(int)
+    queueChanged = pyqtSignal(int)  # analyses waiting or running
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = queue.Queue()
+        self.ids = itertools.count(1)
+        self.pending = {}  # job id -> cancel event, for queued and running jobs
+        self.lock = threading.Lock()
+        self.solver = None  # solver of the last successful job, used only on the worker thread
+        self.solver_options = None
+
+    def submit(self, model_data, **solver_options):
+        job_id = next(self.ids)
+        cancel_event = threading.Event()
+        with self.lock:
+            self.pending[job_id] = cancel_event
+        self.jobs.put((job_id, model_data.copy(), solver_options, cancel_event))
+        self.queueChanged.emit(len(self.pending))
+
+        if not self.isRunning():
+            self.start()
+        return job_id
+
+    def cancel(self, job_id=None):
+        # Cancels one job, or every queued and running job when job_id is None
+        with self.lock:
+            events = list(self.pending.values()) if job_id is None else [self.pending.get(job_id)]
+        for event in events:
+            if event is not None:
+                event.set()
+
+    def stop(self):
+        # Cancels everything and waits for the worker thread to exit
+        self.cancel()
+        self.jobs.put(None)
+        self.wait()
+
+    def run(self):
+        # Imported on the worker thread, so opening the editor does not load the solver and SciPy
+        from FrameSolver import FrameSolver
+
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            job_id, model, solver_options, cancel_event = job
+            if cancel_event.is_set():
+                # Cancelled while queued; the cached solver is untouched
+                with self.lock:
+                    self.pending.pop(job_id, None)
+                self.analysisCancelled.emit(job_id)
+                self.queueChanged.emit(len(self.pending))
+                continue
+
+            def progress(name, record):
+                if record is None:
+                    self.phaseStarted.emit(job_id, name)
+                else:
+                    self.phaseFinished.emit(job_id, name, record.seconds)
+
+            instrumentation = SolverInstrumentation(progress=progress, cancel_event=cancel_event)
+            try:
+                if self.solver is not None and solver_options == self.solver_options:
+                    self.solver.instrumentation = instrumentation
+                    results = self.solver.reanalyze(model)
+                else:
+                    self.solver = FrameSolver(model, instrumentation=instrumentation, **solver_options)
+                    self.solver_options = solver_options
+                    results = self.solver.run()
+            except AnalysisCancelled:
+                self.solver = None  # an interrupted update can leave the cached state half applied
+                self.analysisCancelled.emit(job_id)
+            except Exception as e:
+                self.solver = None
+                self.analysisFailed.emit(job_id, e)
+            else:
+                self.analysisFinished.emit(job_id, model, results)
+            finally:
+                with self.lock:
+                    self.pending.pop(job_id, None)
+                self.queueChanged.emit(len(self.pending))
@@ -0,0 +1,160 @@
+"""
+Command-line batch runner: solves many frame model files in parallel.
+
+    python BatchRunner.py models/ "more/*.npz" --output-dir results --workers 8
+
+One results file (<model>.results.npz) is written per model as soon as it is
+solved. Models are named by their path relative to the deepest directory holding
+all inputs, extension included, so in/a/m.json and in/b/m.npz are written as
+a/m.json.results.npz and b/m.npz.results.npz. A summary table with per-model timing and the aggregate
+throughput is printed and saved as summary.csv in the output directory.
+"""
+import argparse
+import csv
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from FrameSolver import FrameSolver
+from ModelIO import MODEL_PATTERNS, is_model_path, load_model, save_results
+
+
+SUMMARY_FIELDS = ["model", "status", "nodes", "elements", "equations", "seconds", "output", "error"]
+
+
+def collect_model_files(inputs, patterns=MODEL_PATTERNS):
+    # Expands directories and glob patterns into a sorted list of unique model files
+    files = []
+    for entry in inputs:
+        if os.path.isdir(entry) and not entry.rstrip("/\\").lower().endswith(".frame"):
+            for pattern in patterns:
+                files.extend(glob.glob(os.path.join(entry, pattern)))
+        else:
+            files.extend(glob.glob(entry))
+    return sorted(set(os.path.abspath(f) for f in files if is_model_path(f)))
+
+
+def model_names(files):
+    # Names unique within the batch: the path below the deepest directory holding all files, extension kept
+    paths = [os.path.abspath(f.rstrip("/\\")) for f in files]
+    if not paths:
+        return []
+    root = os.path.commonpath([os.path.dirname(p) for p in paths])
+    return [os.path.relpath(p, root).replace(os.sep, "/") for p in paths]
+
+
+def summary_row(name, status="ok", error=""):
+    return {"model": name, "status": status, "nodes": "", "elements": "", "equations": "",
+            "seconds": 0.0, "output": "", "error": error}
+
+
+def solve_model_file(path, output_dir, method="sparse", reorder=False, name=None):
+    """
+    Loads, solves and saves one model. Runs inside a worker process.
+    name is the model's name in the batch (see model_names), the file name by default.
+    Any failure is reported in the returned summary row instead of being raised,
+    so one bad model never stops the batch.
+    """
+    name = name or os.path.basename(path.rstrip("/\\"))
+    row = summary_row(name)
+
+    start = time.perf_counter()
+    try:
+        model = load_model(path)
+        solver = FrameSolver(model, method=method, reorder=reorder)
+        results = solver.run()
+
+        output = os.path.join(output_dir, f"{name}.results.npz")
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        save_results(results, output, model.load_combinations)
+
+        row.update(nodes=model.node_coordinates.shape[0],
+                   elements=model.element_connectivity.shape[0],
+                   equations=results.num_eq,
+                   output=output)
+    except Exception as e:
+        row.update(status="failed", error=f"{type(e).__name__}: {e}")
+
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+
+def run_batch(files, output_dir, workers=None, method="sparse", reorder=False):
+    # Solves all files on a process pool, printing each row as its model finishes
+    os.makedirs(output_dir, exist_ok=True)
+    rows = []
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(solve_model_file, path, output_dir, method, reorder, name): name
+                   for path, name in zip(files, model_names(files))}
+        for future in as_completed(futures):
+            # A crashed worker breaks the pool and fails every model it had not finished, not the batch
+            try:
+                row = future.result()
+            except Exception as e:
+                row = summary_row(futures[future], "failed", f"{type(e).__name__}: {e}")
+            rows.append(row)
+            print(format_row(row), flush=True)
+    wall_time = time.perf_counter() - start
+
+    rows.sort(key=lambda r: r["model"])
+    write_summary(rows, os.path.join(output_dir, "summary.csv"))
+    return rows, wall_time
+
+
+def format_row(row):
+    status = row["status"] if row["status"] == "ok" else f"FAILED ({row['error']})"
+    return (f"{row['model']:<30} {str(row['nodes']):>8} {str(row['elements']):>9} "
+            f"{str(row['equations']):>10} {row['seconds']:>9.3f}s  {status}")
+
+
+def write_summary(rows, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({**row, "seconds": f"{row['seconds']:.6f}"})
+
+
+def print_summary(rows, wall_time):
+    solved = sum(1 for row in rows if row["status"] == "ok")
+    failed = len(rows) - solved
+    solve_time = sum(row["seconds"] for row in rows)
+    throughput = len(rows) / wall_time if wall_time > 0 else 0.0
+
+    print()
+    print(f"{'Model':<30} {'Nodes':>8} {'Elements':>9} {'Equations':>10} {'Time':>10}  Status")
+    for row in rows:
+        print(format_row(row))
+    print()
+    print(f"Models: {len(rows)} ({solved} solved, {failed} failed)")
+    print(f"Wall time: {wall_time:.3f} s, summed model time: {solve_time:.3f} s")
+    print(f"Throughput: {throughput:.2f} models/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve frame model files in parallel.")
+    parser.add_argument("inputs", nargs="+", help="model files, directories or glob patterns")
+    parser.add_argument("-o", "--output-dir", default="results", help="directory for result files and summary.csv")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--pattern", nargs="+", default=list(MODEL_PATTERNS),
+                        help="file patterns used inside directories")
+    parser.add_argument("--method", choices=FrameSolver.METHODS, default="sparse", help="linear solver")
+    parser.add_argument("--reorder", action="store_true", help="renumber equations with reverse Cuthill-McKee")
+    args = parser.parse_args(argv)
+
+    files = collect_model_files(args.inputs, args.pattern)
+    if not files:
+        parser.error("no model files found")
+
+    print(f"Solving {len(files)} models with {args.workers or os.cpu_count()} workers")
+    rows, wall_time = run_batch(files, args.output_dir, args.workers, args.method, args.reorder)
+    print_summary(rows, wall_time)
+
+    return 0 if all(row["status"] == "ok" for row in rows) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
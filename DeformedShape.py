@@ -0,0 +1,62 @@
+"""
+Deformed shape of a frame for drawing, from the nodal displacements of one load case.
+
+    shape = DeformedShape(model.node_coordinates, model.element_connectivity, results.nodal_displacements[0])
+    line.set_data(*shape.points(shape.auto_scale(0.1 * model_size)))
+
+Every member is interpolated between its end displacements with the linear axial and
+cubic Hermite transverse shape functions, for all members in one batched product. The
+displacement at each drawn station is computed once; a new scale is then a single
+multiply-add, so an interactive scale control only has to replace the line data.
+Deflections from loads on the span itself are not included; for members without
+member loads the interpolation is exact.
+"""
+import numpy as np
+
+from ElementKernels import ElementKernels
+from InternalForces import POINT_BUDGET, STATIONS, display_stations, station_positions
+from MemberLoads import shape_functions
+
+
+class DeformedShape:
+    """
+    base:    (n_elem * (n_stations + 1), 2) undeformed points of all members, NaN between members
+    offsets: displacements of the same points in global axes, 0 at the NaN gaps
+    """
+
+    def __init__(self, coords, connectivity, nodal_displacements, stations=STATIONS, budget=POINT_BUDGET):
+        coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+        connectivity = np.asarray(connectivity, dtype=np.int64).reshape(-1, 2)
+        n1, n2 = connectivity[:, 0] - 1, connectivity[:, 1] - 1
+        d = np.asarray(nodal_displacements, dtype=float).reshape(-1, 3)
+
+        xi = station_positions(stations)
+        xi = xi[display_stations(connectivity.shape[0], xi.shape[0], budget)]
+        L, c, s = ElementKernels.element_geometry(coords, n1, n2)
+
+        # End displacements in local axes, then axial u and transverse v at every station
+        T = ElementKernels.transformation_matrices(c, s)
+        d_local = np.einsum('eij,ej->ei', T, np.hstack((d[n1], d[n2])))
+        N = shape_functions(np.broadcast_to(xi, (L.shape[0], xi.shape[0])), L[:, None])  # (n_elem, n_stations, 6)
+        u = N[:, :, 0] * d_local[:, 0, None] + N[:, :, 3] * d_local[:, 3, None]
+        v = np.einsum('esk,ek->es', N[:, :, [1, 2, 4, 5]], d_local[:, [1, 2, 4, 5]])
+
+        n_elem, n_stations = u.shape
+        base = np.full((n_elem, n_stations + 1, 2), np.nan)
+        base[:, :-1] = coords[n1][:, None, :] + xi[None, :, None] * (coords[n2] - coords[n1])[:, None, :]
+        offsets = np.zeros((n_elem, n_stations + 1, 2))
+        offsets[:, :-1, 0] = u * c[:, None] - v * s[:, None]
+        offsets[:, :-1, 1] = u * s[:, None] + v * c[:, None]
+
+        self.base = base.reshape(-1, 2)
+        self.offsets = offsets.reshape(-1, 2)
+        self.largest = float(np.hypot(self.offsets[:, 0], self.offsets[:, 1]).max(initial=0.0))
+
+    def auto_scale(self, size):
+        # Scale that draws the largest displacement as size (model units); 0 when nothing moves
+        return size / self.largest if self.largest > 0 else 0.0
+
+    def points(self, scale):
+        # x and y of the deformed members at the given displacement scale, for Line2D.set_data
+        points = self.base + scale * self.offsets
+        return points[:, 0], points[:, 1]
@@ -0,0 +1,105 @@
+import numpy as np
+
+
+class ElementKernels:
+    """
+    Batched element kernels for 2D Euler-Bernoulli frame members.
+    Lengths, direction cosines, local stiffness matrices and transformation
+    matrices are computed for all elements at once and stored as stacks,
+    e.g. k_local and T have shape (n_elem, 6, 6).
+    """
+
+    def __init__(self, coords, connectivity, properties):
+        connectivity = np.asarray(connectivity, dtype=int)
+        properties = np.asarray(properties, dtype=float).reshape(-1, 3)
+
+        self.n1 = connectivity[:, 0] - 1  # zero-based start nodes
+        self.n2 = connectivity[:, 1] - 1  # zero-based end nodes
+
+        self.L, self.c, self.s = self.element_geometry(coords, self.n1, self.n2)
+        A, I, E = properties[:, 0], properties[:, 1], properties[:, 2]
+
+        self.k_local = self.local_stiffness_matrices(E, A, I, self.L)
+        self.T = self.transformation_matrices(self.c, self.s)
+        self._kT = None  # k_local @ T, built on first force recovery
+
+    @property
+    def count(self):
+        return self.L.shape[0]
+
+    @staticmethod
+    def element_geometry(coords, n1, n2):
+        delta = np.asarray(coords, dtype=float)[n2] - np.asarray(coords, dtype=float)[n1]
+        L = np.hypot(delta[:, 0], delta[:, 1])
+        return L, delta[:, 0] / L, delta[:, 1] / L
+
+    @staticmethod
+    def local_stiffness_matrices(E, A, I, L):
+        EA_L = E * A / L
+        EI_L = E * I / L
+        EI_L2 = E * I / L**2
+        EI_L3 = E * I / L**3
+
+        k = np.zeros((L.shape[0], 6, 6))
+        k[:, 0, 0] = k[:, 3, 3] = EA_L
+        k[:, 0, 3] = k[:, 3, 0] = -EA_L
+        k[:, 1, 1] = k[:, 4, 4] = 12 * EI_L3
+        k[:, 1, 4] = k[:, 4, 1] = -12 * EI_L3
+        k[:, 1, 2] = k[:, 2, 1] = k[:, 1, 5] = k[:, 5, 1] = 6 * EI_L2
+        k[:, 2, 4] = k[:, 4, 2] = k[:, 4, 5] = k[:, 5, 4] = -6 * EI_L2
+        k[:, 2, 2] = k[:, 5, 5] = 4 * EI_L
+        k[:, 2, 5] = k[:, 5, 2] = 2 * EI_L
+        return k
+
+    @staticmethod
+    def transformation_matrices(c, s):
+        T = np.zeros((c.shape[0], 6, 6))
+        T[:, 0, 0] = T[:, 3, 3] = c
+        T[:, 0, 1] = T[:, 3, 4] = s
+        T[:, 1, 0] = T[:, 4, 3] = -s
+        T[:, 1, 1] = T[:, 4, 4] = c
+        T[:, 2, 2] = T[:, 5, 5] = 1
+        return T
+
+    def global_stiffness_matrices(self, indices=None):
+        # k_global = T^T k_local T for every element, or only for the given element indices
+        if indices is None:
+            return np.einsum('eji,ejk,ekl->eil', self.T, self.k_local, self.T, optimize=True)
+        T = self.T[indices]
+        return np.einsum('eji,ejk,ekl->eil', T, self.k_local[indices], T, optimize=True)
+
+    def set_properties(self, indices, properties):
+        # Recomputes k_local (and the cached k_local @ T) of the given elements for new [A, I, E] rows
+        properties = np.asarray(properties, dtype=float).reshape(-1, 3)
+        A, I, E = properties[:, 0], properties[:, 1], properties[:, 2]
+        self.k_local[indices] = self.local_stiffness_matrices(E, A, I, self.L[indices])
+        if self._kT is not None:
+            self._kT[indices] = np.matmul(self.k_local[indices], self.T[indices])
+
+    def local_end_forces(self, d_global):
+        """
+        d_global: (..., n_elem, 6) element end displacements in global axes,
+        optionally with leading axes such as load cases.
+        Returns end forces in local axes with the same shape, f = k_local T d,
+        computed as one batched product with the cached k_local @ T stack.
+        """
+        if self._kT is None:
+            self._kT = np.matmul(self.k_local, self.T)
+        return np.einsum('eij,...ej->...ei', self._kT, d_global)
+
+    def global_stiffness_product(self, d_global):
+        """
+        d_global: (n_elem, 6, n_cols) end displacements in global axes.
+        Returns k_global d = T^T (k_local T) d for every element, same shape,
+        without forming the k_global stack.
+        """
+        if self._kT is None:
+            self._kT = np.matmul(self.k_local, self.T)
+        return np.matmul(self.T.transpose(0, 2, 1), np.matmul(self._kT, d_global))
+
+    def global_end_forces(self, f_local):
+        """
+        f_local: (..., n_elem, 6) end forces in local axes.
+        Returns the same forces in global axes, f_global = T^T f_local.
+        """
+        return np.einsum('eji,...ej->...ei', self.T, f_local)
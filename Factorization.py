@@ -0,0 +1,96 @@
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve, cholesky_banded, cho_solve_banded, lu_factor, lu_solve
+from scipy.sparse.linalg import splu
+
+
+class Factorization:
+    """
+    Factorization of the global stiffness matrix, computed once and reused
+    for any number of right-hand sides.
+
+    sparse: SuperLU factorization of the CSR matrix
+    dense:  Cholesky factorization of the full matrix
+    banded: Cholesky factorization of the LAPACK upper band storage
+    """
+
+    def __init__(self, K_global, method):
+        self.method = method
+        self.size = K_global.shape[1]
+
+        if method == "sparse":
+            self._factor = splu(K_global.tocsc())
+        elif method == "banded":
+            self._factor = cholesky_banded(K_global, lower=False)
+        elif method == "dense":
+            self._factor = cho_factor(K_global, lower=False)
+        else:
+            raise ValueError(f"Cannot factorize for solver method '{method}'")
+
+    @property
+    def nnz(self):
+        # Stored entries of the factor(s)
+        if self.method == "sparse":
+            return self._factor.L.nnz + self._factor.U.nnz
+        elif self.method == "banded":
+            return self._factor.size
+        return self._factor[0].size
+
+    def solve(self, F):
+        """
+        Solves K U = F for a (num_eq,) vector or a (num_eq, n_cases) block of right-hand sides.
+        """
+        F = np.asarray(F, dtype=float)
+        if self.method == "sparse":
+            return self._factor.solve(F)
+        elif self.method == "banded":
+            return cho_solve_banded((self._factor, False), F)
+        return cho_solve(self._factor, F)
+
+
+class UpdatedFactorization:
+    """
+    Solves (K + dK) U = F with an existing Factorization of K, where dK is nonzero only
+    in the rows and columns listed in dofs (zero-based). Uses the Woodbury identity
+
+        (K + P C P^T)^-1 = K^-1 - Z (I + C Z_d)^-1 C P^T K^-1,   Z = K^-1 P,  Z_d = P^T Z
+
+    with C = dK[dofs, dofs]. C is usually singular (element stiffness changes have
+    rigid-body modes), which this form allows. Building it costs one solve with K per
+    equation in dofs that previous (an earlier update of the same base) did not cover;
+    every solve then costs one solve with K plus a small dense one.
+    """
+
+    def __init__(self, base, dofs, delta, previous=None):
+        self.base = base
+        self.method = base.method
+        self.size = base.size
+        self.dofs = np.asarray(dofs, dtype=int)
+        self.delta = np.asarray(delta, dtype=float)
+
+        self.Z = np.zeros((self.size, self.dofs.shape[0]))
+        known = np.zeros(self.dofs.shape[0], dtype=bool)
+        if previous is not None and previous.base is base:
+            known = np.isin(self.dofs, previous.dofs)
+            self.Z[:, known] = previous.Z[:, np.searchsorted(previous.dofs, self.dofs[known])]
+
+        new = np.flatnonzero(~known)
+        if new.size:
+            columns = np.zeros((self.size, new.size))
+            columns[self.dofs[new], np.arange(new.size)] = 1.0
+            self.Z[:, new] = base.solve(columns).reshape(self.size, -1)
+        self._capacitance = lu_factor(np.eye(self.dofs.shape[0]) + self.delta @ self.Z[self.dofs])
+
+    @property
+    def rank(self):
+        return self.dofs.shape[0]
+
+    @property
+    def nnz(self):
+        return self.base.nnz + self.Z.size
+
+    def solve(self, F):
+        X = self.base.solve(F)
+        if self.rank == 0:
+            return X
+        X_d = X[self.dofs]
+        return X - self.Z @ lu_solve(self._capacitance, self.delta @ X_d)
@@ -0,0 +1,143 @@
+"""
+Benchmark suite for FrameSolver: times every solver phase on generated frames
+of increasing size and writes machine-readable results.
+
+    python FrameBenchmark.py --kinds portal truss random --sizes 100 1000 10000 100000 \
+        --output bench.json --csv bench.csv
+    python FrameBenchmark.py --sizes 1000 10000 --compare bench.json
+
+Each (kind, size, method) case is run --repeat times and the fastest time of
+every phase is kept. --compare prints the ratio against an earlier JSON file
+so scaling regressions in assembly, solve and recovery stand out.
+"""
+import argparse
+import csv
+import json
+import platform
+import time
+
+import numpy as np
+import scipy
+
+from FrameGenerators import GENERATORS, frame_of_size
+from FrameSolver import FrameSolver
+from SolverInstrumentation import SolverInstrumentation
+
+
+PHASES = FrameSolver.PHASES
+
+
+def benchmark_case(kind, size, method="sparse", reorder=False, repeat=3, seed=0):
+    # Returns one result row with the best time of each phase over the repeats
+    model = frame_of_size(kind, size, seed=seed)
+
+    best = {phase: float("inf") for phase in PHASES}
+    best_total = float("inf")
+    num_eq = nnz = 0
+
+    for _ in range(repeat):
+        instrumentation = SolverInstrumentation()
+        solver = FrameSolver(model, method=method, reorder=reorder, instrumentation=instrumentation)
+        start = time.perf_counter()
+        results = solver.run()
+        best_total = min(best_total, time.perf_counter() - start)
+
+        for record in results.phases:
+            best[record.name] = min(best[record.name], record.seconds)
+        num_eq = results.num_eq
+        nnz = results.phase("assembly").sizes.get("nnz", 0)
+
+    row = {"kind": kind, "size": size, "method": method, "reorder": reorder,
+           "nodes": model.node_coordinates.shape[0], "elements": model.element_connectivity.shape[0],
+           "equations": num_eq, "nnz": nnz, "total": best_total}
+    row.update(best)
+    return row
+
+
+def run_suite(kinds, sizes, methods, reorder=False, repeat=3, seed=0):
+    rows = []
+    for kind in kinds:
+        for size in sizes:
+            for method in methods:
+                row = benchmark_case(kind, size, method, reorder, repeat, seed)
+                rows.append(row)
+                print(format_row(row), flush=True)
+    return rows
+
+
+def environment():
+    return {"python": platform.python_version(), "numpy": np.__version__, "scipy": scipy.__version__,
+            "machine": platform.machine(), "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def write_json(rows, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": rows}, f, indent=2)
+
+
+def write_csv(rows, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def format_row(row):
+    phases = " ".join(f"{row[phase] * 1000:>10.2f}" for phase in PHASES)
+    return (f"{row['kind']:<7} {row['elements']:>8} {row['equations']:>9} {row['method']:<7} "
+            f"{phases} {row['total'] * 1000:>10.2f}")
+
+
+def header():
+    phases = " ".join(f"{phase + ' ms':>10}" for phase in PHASES)
+    return f"{'kind':<7} {'elements':>8} {'equations':>9} {'method':<7} {phases} {'total ms':>10}"
+
+
+def compare(rows, baseline_path):
+    """
+    Prints current / baseline time ratios per phase for the cases present in both runs.
+    Ratios above 1 are slower than the baseline.
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["kind"], r["size"], r["method"], r["reorder"]): r for r in json.load(f)["results"]}
+
+    print()
+    print(f"Ratio against {baseline_path} (current / baseline)")
+    print(f"{'kind':<7} {'size':>8} {'method':<7} " + " ".join(f"{phase:>10}" for phase in PHASES + ("total",)))
+    for row in rows:
+        old = baseline.get((row["kind"], row["size"], row["method"], row["reorder"]))
+        if old is None:
+            continue
+        ratios = " ".join(f"{row[key] / old[key]:>10.2f}" if old.get(key, 0) > 0 else f"{'-':>10}"
+                          for key in PHASES + ("total",))
+        print(f"{row['kind']:<7} {row['size']:>8} {row['method']:<7} {ratios}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark FrameSolver phases on generated frames.")
+    parser.add_argument("--kinds", nargs="+", choices=GENERATORS, default=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000],
+                        help="target element counts (up to 100000)")
+    parser.add_argument("--methods", nargs="+", choices=FrameSolver.METHODS, default=["sparse"])
+    parser.add_argument("--reorder", action="store_true", help="renumber equations with reverse Cuthill-McKee")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random frame generator")
+    parser.add_argument("--output", default="benchmark.json", help="JSON results file")
+    parser.add_argument("--csv", help="optional CSV results file")
+    parser.add_argument("--compare", help="earlier JSON results file to compare against")
+    args = parser.parse_args(argv)
+
+    print(header())
+    rows = run_suite(args.kinds, args.sizes, args.methods, args.reorder, args.repeat, args.seed)
+
+    write_json(rows, args.output)
+    if args.csv:
+        write_csv(rows, args.csv)
+    if args.compare:
+        compare(rows, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
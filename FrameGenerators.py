@@ -0,0 +1,191 @@
+"""
+Parametric frame generators that build FrameModelData directly from arrays.
+Used by the benchmark suite and handy for producing large test models.
+All generated models are stable, have unit-consistent default properties
+(kN, m) and a single load case in force_conditions.
+"""
+import math
+
+import numpy as np
+
+from FrameModelData import FrameModelData
+
+
+DEFAULT_PROPERTIES = (0.02, 2.0e-4, 2.0e8)  # A (m2), I (m4), E (kN/m2)
+
+
+def portal_frame(stories, bays, story_height=3.0, bay_width=5.0, properties=DEFAULT_PROPERTIES,
+                 lateral_load=10.0, gravity_load=-20.0):
+    """
+    Multi-storey, multi-bay rigid portal frame with fixed column bases.
+    Nodes are numbered floor by floor; elements are stories * (2 * bays + 1).
+    Each floor carries a lateral load at its leftmost node and gravity loads at every joint.
+    """
+    columns_per_floor = bays + 1
+    xs, ys = np.meshgrid(np.arange(columns_per_floor) * bay_width, np.arange(stories + 1) * story_height)
+    coords = np.column_stack((xs.ravel(), ys.ravel()))
+    ids = np.arange(coords.shape[0]).reshape(stories + 1, columns_per_floor) + 1
+
+    columns = np.column_stack((ids[:-1].ravel(), ids[1:].ravel()))
+    beams = np.column_stack((ids[1:, :-1].ravel(), ids[1:, 1:].ravel()))
+    connectivity = np.vstack((columns, beams))
+
+    supports = np.column_stack((ids[0], np.ones((columns_per_floor, 3), dtype=int)))
+
+    floor_nodes = ids[1:].ravel()
+    forces = np.zeros((floor_nodes.shape[0], 4))
+    forces[:, 0] = floor_nodes
+    forces[:, 2] = gravity_load
+    forces[::columns_per_floor, 1] = lateral_load
+
+    return _model(coords, connectivity, properties, supports, forces)
+
+
+def storey_frame(stories, bays, segments=4, story_height=3.0, bay_width=5.0, properties=DEFAULT_PROPERTIES,
+                 lateral_load=10.0, gravity_load=-20.0, substructures=True):
+    """
+    Portal frame whose members are each split into segments elements, with one substructure
+    "storey <k>" per storey (its columns and the beams of the floor above them), so the
+    intermediate member nodes can be condensed. All storeys but the lowest and the top one
+    are identical. Joints are numbered as in portal_frame, followed by the intermediate nodes
+    member by member. Gravity loads act at every beam node, lateral loads at the leftmost joints.
+    """
+    columns_per_floor = bays + 1
+    xs, ys = np.meshgrid(np.arange(columns_per_floor) * bay_width, np.arange(stories + 1) * story_height)
+    joints = np.column_stack((xs.ravel(), ys.ravel()))
+    ids = np.arange(joints.shape[0]).reshape(stories + 1, columns_per_floor) + 1
+
+    members = np.vstack((np.column_stack((ids[:-1].ravel(), ids[1:].ravel())),
+                         np.column_stack((ids[1:, :-1].ravel(), ids[1:, 1:].ravel()))))
+    storey = np.concatenate((np.repeat(np.arange(stories), columns_per_floor), np.repeat(np.arange(stories), bays)))
+    is_beam = np.arange(members.shape[0]) >= stories * columns_per_floor
+
+    # Intermediate nodes along every member, then the members as chains of segments elements
+    t = np.arange(1, segments) / segments
+    start, end = joints[members[:, 0] - 1], joints[members[:, 1] - 1]
+    inner = start[:, None] + t[None, :, None] * (end - start)[:, None]
+    inner_ids = joints.shape[0] + 1 + np.arange(inner.shape[0] * inner.shape[1]).reshape(inner.shape[:2])
+    coords = np.vstack((joints, inner.reshape(-1, 2)))
+
+    chains = np.hstack((members[:, :1], inner_ids, members[:, 1:]))
+    connectivity = np.column_stack((chains[:, :-1].ravel(), chains[:, 1:].ravel()))
+
+    supports = np.column_stack((ids[0], np.ones((columns_per_floor, 3), dtype=int)))
+
+    beam_nodes = np.unique(chains[is_beam])
+    forces = np.zeros((beam_nodes.shape[0], 4))
+    forces[:, 0] = beam_nodes
+    forces[:, 2] = gravity_load
+    forces[np.isin(beam_nodes, ids[1:, 0]), 1] = lateral_load
+
+    model = _model(coords, connectivity, properties, supports, forces)
+    if substructures:
+        element_storey = np.repeat(storey, segments)
+        for k in range(stories):
+            model.addSubstructure(f"storey {k + 1}", np.flatnonzero(element_storey == k) + 1)
+    return model
+
+
+def truss(panels, panel_width=2.0, height=2.5, properties=(0.005, 1.0e-6, 2.0e8), gravity_load=-15.0):
+    """
+    Pratt truss with rigid joints, pinned at the left end and on a roller at the right end.
+    Bottom chord nodes come first, then top chord nodes; elements are 4 * panels + 1.
+    """
+    x = np.arange(panels + 1) * panel_width
+    coords = np.vstack((np.column_stack((x, np.zeros_like(x))), np.column_stack((x, np.full_like(x, height)))))
+    bottom = np.arange(panels + 1) + 1
+    top = bottom + panels + 1
+
+    half = panels // 2
+    left = np.arange(half)
+    right = np.arange(half, panels)
+    connectivity = np.vstack((
+        np.column_stack((bottom[:-1], bottom[1:])),          # bottom chord
+        np.column_stack((top[:-1], top[1:])),                # top chord
+        np.column_stack((bottom, top)),                      # verticals
+        np.column_stack((bottom[left + 1], top[left])),      # diagonals sloping towards midspan
+        np.column_stack((bottom[right], top[right + 1])),
+    ))
+
+    supports = np.array([[bottom[0], 1, 1, 0], [bottom[-1], 0, 1, 0]])
+    forces = np.column_stack((bottom[1:-1], np.zeros(panels - 1), np.full(panels - 1, gravity_load),
+                              np.zeros(panels - 1)))
+
+    return _model(coords, connectivity, properties, supports, forces)
+
+
+def random_frame(node_count, element_count, seed=0, spacing=4.0, properties=DEFAULT_PROPERTIES,
+                 support_fraction=0.05):
+    """
+    Random planar frame on a jittered grid of about node_count nodes.
+    A comb of all horizontal members plus the first column keeps the frame connected;
+    the remaining members are drawn at random from the unused vertical members and one
+    diagonal per grid cell, so members never cross. Node numbers are shuffled, so the
+    bandwidth depends on equation renumbering. The lowest nodes are fixed and every
+    free node gets a random load.
+    """
+    rng = np.random.default_rng(seed)
+    nx = max(2, math.ceil(math.sqrt(node_count)))
+    ny = max(2, math.ceil(node_count / nx))
+    node_count = nx * ny
+
+    xs, ys = np.meshgrid(np.arange(nx) * spacing, np.arange(ny) * spacing)
+    coords = np.column_stack((xs.ravel(), ys.ravel()))
+    coords += rng.uniform(-0.3 * spacing, 0.3 * spacing, size=coords.shape)
+    grid = np.arange(node_count).reshape(ny, nx)
+
+    comb = np.vstack((np.column_stack((grid[:, :-1].ravel(), grid[:, 1:].ravel())),
+                      np.column_stack((grid[:-1, 0], grid[1:, 0]))))
+
+    rising = rng.random((ny - 1, nx - 1)) < 0.5
+    diagonals = np.column_stack((np.where(rising, grid[:-1, :-1], grid[:-1, 1:]).ravel(),
+                                 np.where(rising, grid[1:, 1:], grid[1:, :-1]).ravel()))
+    candidates = np.vstack((np.column_stack((grid[:-1, 1:].ravel(), grid[1:, 1:].ravel())), diagonals))
+
+    extra_count = element_count - comb.shape[0]
+    if extra_count > candidates.shape[0]:
+        raise ValueError(f"At most {comb.shape[0] + candidates.shape[0]} elements fit on {node_count} nodes")
+    extra = candidates[rng.permutation(candidates.shape[0])[:max(extra_count, 0)]]
+    pairs = np.vstack((comb, extra))
+
+    # Shuffle the node numbering so the user order carries no locality
+    order = rng.permutation(node_count)
+    coords = coords[np.argsort(order)]
+    connectivity = order[pairs] + 1
+
+    support_count = max(1, int(node_count * support_fraction))
+    fixed = np.argsort(coords[:, 1])[:support_count] + 1
+    supports = np.column_stack((fixed, np.ones((support_count, 3), dtype=int)))
+
+    loaded = np.setdiff1d(np.arange(1, node_count + 1), fixed)
+    forces = np.column_stack((loaded, rng.normal(0.0, 10.0, size=(loaded.shape[0], 3))))
+
+    return _model(coords, connectivity, properties, supports, forces)
+
+
+def frame_of_size(kind, element_count, seed=0):
+    """
+    Builds a model of the given kind ("portal", "truss", "random" or "storeys") with roughly element_count elements.
+    """
+    if kind == "portal":
+        bays = max(1, int(round(math.sqrt(element_count / 2))))
+        stories = max(1, math.ceil(element_count / (2 * bays + 1)))
+        return portal_frame(stories, bays)
+    elif kind == "truss":
+        return truss(max(2, math.ceil((element_count - 1) / 4)))
+    elif kind == "random":
+        node_count = max(4, element_count // 2)
+        return random_frame(node_count, element_count, seed=seed)
+    elif kind == "storeys":
+        bays = max(1, int(round(math.sqrt(element_count / 16))))
+        stories = max(1, math.ceil(element_count / (4 * (2 * bays + 1))))
+        return storey_frame(stories, bays)
+    raise ValueError(f"Unknown frame kind '{kind}'")
+
+
+GENERATORS = ("portal", "truss", "random", "storeys")
+
+
+def _model(coords, connectivity, properties, supports, forces):
+    properties = np.tile(np.asarray(properties, dtype=float), (connectivity.shape[0], 1))
+    return FrameModelData.fromArrays(coords, connectivity, properties, supports, forces)
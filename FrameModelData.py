@@ -1,224 +1,275 @@
-from PyQt5.QtWidgets import QTableWidgetItem, QMessageBox
-from PyQt5.QtCore import Qt
 import numpy as np
 
+# PyQt5 is imported inside the table methods only, so the model can be
+# built and solved headless without a display or a QApplication.
+# The input tables are views onto the arrays below (see FrameTableModels).
+
 class FrameModelData:
+    """
+    Structure-of-arrays store of one frame model. Every instance owns its arrays:
+      node_coordinates      (n_nodes, 2) float64 [X, Y]
+      element_connectivity  (n_elem, 2) int32 1-based [start node, end node]
+      element_properties    (n_elem, 3) [A, I, E], float64 or float32 (property_dtype)
+      support_conditions    (n_supports, 4) int32 [node, fix X, fix Y, fix rotation]
+      force_conditions      (n_forces, 4) float64 [node, Fx, Fy, Mz]
+    Assigning an array converts it to these dtypes and shapes. Code that edits
+    element_connectivity in place calls arrayChanged() so the topology index is rebuilt.
+    """
+
+    __slots__ = ("_node_coordinates", "_element_connectivity", "_element_properties", "_support_conditions",
+                 "_force_conditions", "property_dtype", "load_cases", "member_loads", "load_combinations",
+                 "substructures", "_topology")
+
+
+    def __init__(self, node_count=0, element_count=0, support_count=0, force_count=0, property_dtype=np.float64):
+        self.property_dtype = np.dtype(property_dtype)
+        self._topology = None  # NodeElementIndex, built on first use
+
+        # Named nodal load cases, name -> [node_id, Fx, Fy, Mz] rows.
+        # When empty, force_conditions is analysed as the single "Default" case.
+        self.load_cases = {}
+
+        # Loads on the element spans per load case, name -> (n, 7) float64 rows
+        # [element_id, kind, direction, w1, w2, a, b] (see MemberLoads); "Default" when
+        # there are no named load cases. A name without nodal loads is a case of its own.
+        self.member_loads = {}
+
+        # Named load combinations, name -> {load case name: factor}. Each is built from the
+        # solved load cases by superposition (see LoadCombinations).
+        self.load_combinations = {}
+
+        # Named substructures, name -> 1-based element IDs. Their interior nodes are
+        # condensed out by the solver (see Substructures).
+        self.substructures = {}
+
+        # Blank arrays for the input tables: NaN marks a value and 0 a node ID that is not entered yet
+        self.node_coordinates = np.full((node_count, 2), np.nan)
+        self.element_connectivity = np.zeros((element_count, 2), dtype=np.int32)
+        self.element_properties = np.full((element_count, 3), np.nan)
+        self.support_conditions = np.zeros((support_count, 4), dtype=np.int32)
+        self.force_conditions = np.zeros((force_count, 4))
+        self.force_conditions[:, 1:] = np.nan
+
+
+    @property
+    def node_coordinates(self):
+        return self._node_coordinates
+
+    @node_coordinates.setter
+    def node_coordinates(self, array):
+        self._node_coordinates = np.asarray(array, dtype=np.float64).reshape(-1, 2)
+        self._topology = None
+
+    @property
+    def element_connectivity(self):
+        return self._element_connectivity
+
+    @element_connectivity.setter
+    def element_connectivity(self, array):
+        self._element_connectivity = np.asarray(array, dtype=np.int32).reshape(-1, 2)
+        self._topology = None
+
+    @property
+    def element_properties(self):
+        return self._element_properties
+
+    @element_properties.setter
+    def element_properties(self, array):
+        self._element_properties = np.asarray(array, dtype=self.property_dtype).reshape(-1, 3)
+
+    @property
+    def support_conditions(self):
+        return self._support_conditions
+
+    @support_conditions.setter
+    def support_conditions(self, array):
+        self._support_conditions = np.asarray(array, dtype=np.int32).reshape(-1, 4)
+
+    @property
+    def force_conditions(self):
+        return self._force_conditions
+
+    @force_conditions.setter
+    def force_conditions(self, array):
+        self._force_conditions = np.asarray(array, dtype=np.float64).reshape(-1, 4)
+
+    @property
+    def node_count(self):
+        return self._node_coordinates.shape[0]
+
+    @property
+    def element_count(self):
+        return self._element_connectivity.shape[0]
+
+    @property
+    def support_count(self):
+        return self._support_conditions.shape[0]
+
+    @property
+    def force_count(self):
+        return self._force_conditions.shape[0]
+
+    @property
+    def nbytes(self):
+        arrays = [self._node_coordinates, self._element_connectivity, self._element_properties,
+                  self._support_conditions, self._force_conditions]
+        arrays += list(self.load_cases.values()) + list(self.member_loads.values()) + list(self.substructures.values())
+        return sum(np.asarray(array).nbytes for array in arrays) + (self._topology.nbytes if self._topology else 0)
+
+
+    @classmethod
+    def fromArrays(cls, node_coordinates, element_connectivity, element_properties,
+                   support_conditions, force_conditions=None, property_dtype=np.float64):
+        # Builds a model directly from arrays, bypassing the input tables
+        node_coordinates = np.asarray(node_coordinates, dtype=np.float64).reshape(-1, 2)
+        element_connectivity = np.asarray(element_connectivity, dtype=np.int32).reshape(-1, 2)
+        element_properties = np.asarray(element_properties, dtype=property_dtype).reshape(-1, 3)
+        support_conditions = np.asarray(support_conditions, dtype=np.int32).reshape(-1, 4)
+        if force_conditions is None:
+            force_conditions = np.zeros((0, 4))
+        force_conditions = np.asarray(force_conditions, dtype=np.float64).reshape(-1, 4)
+
+        # Created empty: blank tables of the full size would be allocated only to be replaced,
+        # which for memory-mapped arrays costs more than the arrays themselves
+        model = cls(0, 0, 0, 0, property_dtype)
+        model.node_coordinates = node_coordinates
+        model.element_connectivity = element_connectivity
+        model.element_properties = element_properties
+        model.support_conditions = support_conditions
+        model.force_conditions = force_conditions
+        return model
 
-    node_coordinates = np.array([])  # Placeholder for node coordinates
-    element_connectivity = np.array([])  # Placeholder for element connectivity
-    support_conditions = np.array([])  # Placeholder for support conditions
-    force_conditions = np.array([])  # Placeholder for force conditions
+    
+    def copy(self):
+        # Independent copy of the arrays and load cases, e.g. to solve it while the tables are being edited
+        model = FrameModelData.fromArrays(np.array(self.node_coordinates), np.array(self.element_connectivity),
+                                          np.array(self.element_properties), np.array(self.support_conditions),
+                                          np.array(self.force_conditions), self.property_dtype)
+        model.load_cases = {name: np.array(forces) for name, forces in self.load_cases.items()}
+        model.member_loads = {name: np.array(rows) for name, rows in self.member_loads.items()}
+        model.load_combinations = {name: dict(factors) for name, factors in self.load_combinations.items()}
+        model.substructures = {name: np.array(elements) for name, elements in self.substructures.items()}
+        return model
 
 
-    def __init__(self, node_count=0, element_count=0, support_count=0, force_count=0):
-        # Metadata
-        self.node_count = node_count
-        self.element_count = element_count
-        self.support_count = support_count
-        self.force_count = force_count
+    def setNodeTable(self, tableView):
+        from FrameTableModels import ArrayTableModel, NODE_COLUMNS, attach_table
 
-        print(f"Initializing FrameModelData with {node_count} nodes, {element_count} elements, "
-              f"{support_count} supports, and {force_count} forces.")
+        # The table shows node_coordinates directly; edits are written into the array
+        return attach_table(tableView, ArrayTableModel(self, NODE_COLUMNS, tableView))
 
-    
-    def setNodeTable(self, tableWidget):
-        # This method will be used to set the node table in the UI
-        if self.node_count > 1:
-            tableWidget.setRowCount(self.node_count)
-
-            for i in range(self.node_count):
-
-                # Node ID (non-editable, center-aligned)
-                node_item = QTableWidgetItem(str(i + 1))
-                node_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                node_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 0, node_item)
-
-                # X coordinate (editable, center-aligned)
-                x_item = QTableWidgetItem("")
-                x_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-                x_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 1, x_item)
-
-                # Y coordinate (editable, center-aligned)
-                y_item = QTableWidgetItem("")
-                y_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-                y_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 2, y_item)
-
-
-            return tableWidget
-        
-        else:
-            # Error handling purposes
-            return None
 
+    def setElementTable(self, tableView):
+        from FrameTableModels import ArrayTableModel, ELEMENT_COLUMNS, attach_table
 
-    def setElementTable(self, tableWidget):
+        # Element connectivity and [A, I, E] share one table
+        return attach_table(tableView, ArrayTableModel(self, ELEMENT_COLUMNS, tableView))
 
-        # This method will be used to set the element table in the UI
+    def setSupportTable(self, tableView):
+        from FrameTableModels import ArrayTableModel, SUPPORT_COLUMNS, attach_table
 
-        if self.element_count > 0:
+        return attach_table(tableView, ArrayTableModel(self, SUPPORT_COLUMNS, tableView))
 
-            tableWidget.setRowCount(self.element_count)
 
-            for i in range(self.element_count):
+    def setForceTable(self, tableView):
+        from FrameTableModels import ArrayTableModel, FORCE_COLUMNS, attach_table
 
-                # Element ID (non-editable, center-aligned)
-                element_item = QTableWidgetItem(str(i + 1))
-                element_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                element_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 0, element_item)
+        return attach_table(tableView, ArrayTableModel(self, FORCE_COLUMNS, tableView))
 
-                # Start Node (editable, center-aligned)
-                start_node_item = QTableWidgetItem("")
-                start_node_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-                start_node_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 1, start_node_item)
 
-                # End Node (editable, center-aligned)
-                end_node_item = QTableWidgetItem("")
-                end_node_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-                end_node_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 2, end_node_item)
+    def addLoadCase(self, name, forces):
+        # Adds or replaces a named nodal load case with [node_id, Fx, Fy, Mz] rows
+        forces = np.asarray(forces, dtype=float).reshape(-1, 4)
+        self.load_cases[name] = forces
+        return forces
 
-            return tableWidget
-        
-        else:
-            # Error handling purposes
-            return None
-    
-    def setSupportTable(self, tableWidget):
-        
-        if self.support_count > 0:
-            tableWidget.setRowCount(self.force_count)
-
-            for i in range(self.support_count):
-                # Editable Node ID (center-aligned)
-                node_item = QTableWidgetItem("")
-                node_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-                node_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 0, node_item)
-
-                # Columns 1–3: Checkboxes
-                for j in range(1, 4):
-                    check_item = QTableWidgetItem()
-                    check_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-                    check_item.setCheckState(Qt.Unchecked)
-                    check_item.setTextAlignment(Qt.AlignCenter)
-                    tableWidget.setItem(i, j, check_item)
-
-            return tableWidget
-        
-        else:
-            # Error handling purposes
-            return None
-        
-
-    def setForceTable(self, tableWidget):
-        # This method will be used to set the force table in the UI
-        if self.force_count > 0:
-            tableWidget.setRowCount(self.force_count)
-
-            for i in range(self.force_count):
-                # Node ID (editable, center-aligned)
-                node_item = QTableWidgetItem("")
-                node_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
-                node_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 0, node_item)
-
-                # Force X (editable, center-aligned)
-                fx_item = QTableWidgetItem("")
-                fx_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-                fx_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 1, fx_item)
-
-                # Force Y (editable, center-aligned)
-                fy_item = QTableWidgetItem("")
-                fy_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-                fy_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 2, fy_item)
-
-                # Moment Z (editable, center-aligned)
-                mz_item = QTableWidgetItem("")
-                mz_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable)
-                mz_item.setTextAlignment(Qt.AlignCenter)
-                tableWidget.setItem(i, 3, mz_item)
-
-            return tableWidget
-        
-        else:
-            # Error handling purposes
-            return None
-        
-    def setNodeMatrixFromNodeTable(self, node_table, parent=None):
-
-        self.node_coordinates = np.zeros((self.node_count, 2))
-        
-        for i in range(self.node_count):
-            try:
-                x = float(node_table.item(i, 1).text())
-                y = float(node_table.item(i, 2).text())
-                self.node_coordinates[i] = [x, y]
-            except (AttributeError, ValueError):
-                QMessageBox.critical(parent, "Error", f"Invalid or missing value at row {i} of node table")
-
-
-    def setElementConnectivityFromTable(self, table_widget, parent=None):
-
-        self.element_connectivity = np.zeros((self.element_count, 2), dtype=int)
-
-        for i in range(self.element_count):
-            try:
-                start_node = int(table_widget.item(i, 1).text())
-                end_node = int(table_widget.item(i, 2).text())
-                self.element_connectivity[i] = [start_node, end_node]
-            except (AttributeError, ValueError):
-                QMessageBox.critical(parent, "Error" ,f"Invalid or missing value at row {i} of element table")
-
-    def setElementPropertiesFromTable(self, table_widget, parent=None):
-
-        self.element_properties = np.zeros((self.element_count, 3), dtype=float)
-
-        for i in range(self.element_count):
-            try:
-                area = float(table_widget.item(i, 3).text())
-                inertia = float(table_widget.item(i, 4).text())
-                elastic_modulus = float(table_widget.item(i, 5).text())
-                self.element_properties[i] = [area, inertia, elastic_modulus]
-            except (AttributeError, ValueError):
-                QMessageBox.critical(parent, "Error" ,f"Invalid or missing value at row {i} of element table")
 
-    
-    def setSupportConditionsFromTable(self, table_widget, parent=None):
-        self.support_conditions = np.zeros((self.support_count, 4), dtype=int)
+    def addMemberLoads(self, case, rows):
+        # Appends [element_id, kind, direction, w1, w2, a, b] rows to the member loads of a load case
+        rows = np.asarray(rows, dtype=float).reshape(-1, 7)
+        if case in self.member_loads:
+            rows = np.vstack((self.member_loads[case], rows))
+        self.member_loads[case] = rows
+        return rows
 
-        for i in range(self.support_count):
-            try:
-                node_id = int(table_widget.item(i, 0).text())
-                support_x = table_widget.item(i, 1).checkState() == Qt.Checked
-                support_y = table_widget.item(i, 2).checkState() == Qt.Checked
-                support_mz = table_widget.item(i, 3).checkState() == Qt.Checked
 
-                self.support_conditions[i] = [node_id, int(support_x), int(support_y), int(support_mz)]
-            except (AttributeError, ValueError):
-                QMessageBox.critical(parent, "Error", f"Invalid or missing value at row {i} of support table")
+    def addUniformLoad(self, element_ids, w, direction="local y", case="Default"):
+        # Load w per unit length over the whole span of every given 1-based element
+        from MemberLoads import member_load_rows
+        return self.addMemberLoads(case, member_load_rows(element_ids, "distributed", direction, w))
+
+
+    def addTrapezoidalLoad(self, element_ids, w1, w2, a=0.0, b=1.0, direction="local y", case="Default"):
+        # Load varying linearly from w1 at a to w2 at b, positions as fractions of the element length
+        from MemberLoads import member_load_rows
+        return self.addMemberLoads(case, member_load_rows(element_ids, "distributed", direction, w1, w2, a, b))
+
+
+    def addPointLoad(self, element_ids, P, a=0.5, direction="local y", case="Default"):
+        # Force P at fraction a of the length of every given element
+        from MemberLoads import member_load_rows
+        return self.addMemberLoads(case, member_load_rows(element_ids, "point", direction, P, 0.0, a, a))
 
-    
-    def setForceConditionsFromTable(self, table_widget, parent=None):
-        self.force_conditions = np.zeros((self.force_count, 4))
 
-        for i in range(self.force_count,):
-            try:
-                node_id = int(table_widget.item(i, 0).text())
-                fx = float(table_widget.item(i, 1).text())
-                fy = float(table_widget.item(i, 2).text())
-                mz = float(table_widget.item(i, 3).text())
+    def addLoadCombination(self, name, factors):
+        # Adds or replaces a load combination given as {load case name: factor}, e.g. {"D": 1.2, "L": 1.6}
+        factors = {case: float(factor) for case, factor in dict(factors).items()}
+        self.load_combinations[name] = factors
+        return factors
 
-                self.force_conditions[i] = [node_id, fx, fy, mz]
-            except (AttributeError, ValueError):
-                QMessageBox.critical(parent, "Error", f"Invalid or missing value at row {i} of force table")
 
-            
+    def addSubstructure(self, name, elements):
+        # Adds or replaces a substructure made of the given 1-based element IDs
+        elements = np.asarray(elements, dtype=np.int32).ravel()
+        self.substructures[name] = elements
+        return elements
 
 
+    def arrayChanged(self, name):
+        # Called after an array was edited in place, e.g. by the input tables
+        if name == "element_connectivity":
+            self._topology = None
+
+
+    def topology(self):
+        # Node -> element index of the current connectivity, built once and kept until it changes
+        if self._topology is None:
+            from ModelTopology import NodeElementIndex
+            self._topology = NodeElementIndex(self._element_connectivity, self.node_count)
+        return self._topology
+
+
+    def elementsAtNode(self, node_id):
+        # 1-based IDs of the elements connected to a 1-based node
+        return self.topology().elements_at(node_id - 1) + 1
+
+
+    def nodeDegree(self):
+        # Number of element ends at every node
+        return self.topology().degree
+
+
+    def connectedComponents(self):
+        # (count, labels): zero-based component of every node of the frame
+        return self.topology().connected_components()
+
+
+    def restrainedDofs(self):
+        # (node_count, 3) bool [X, Y, rotation] fixed by the support table; later rows win
+        restrained = np.zeros((self.node_count, 3), dtype=bool)
+        supports = self._support_conditions
+        valid = (supports[:, 0] >= 1) & (supports[:, 0] <= self.node_count)
+        restrained[supports[valid, 0] - 1] = supports[valid, 1:] != 0
+        return restrained
+
+
+    def getLoadCases(self):
+        # Returns the nodal loads of every load case to analyse, in definition order;
+        # a case with member loads only has no rows
+        if self.load_cases:
+            cases = dict(self.load_cases)
+        else:
+            cases = {"Default": np.asarray(self.force_conditions, dtype=float).reshape(-1, 4)}
+        for name in self.member_loads:
+            cases.setdefault(name, np.zeros((0, 4)))
+        return cases
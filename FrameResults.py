@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FrameResults:
+    """
+    Immutable results of a frame analysis, independent of any GUI.
+    All arrays are read-only copies; the leading axis of the per-case arrays
+    follows load_case_names.
+
+    eq_matrix:           (node_count, 3) equation numbers, 0 for restrained DOFs
+    displacements:       (num_eq, n_cases) displacements in equation order
+    nodal_displacements: (n_cases, node_count, 3) [ux, uy, rz] per node
+    element_end_forces:  (n_cases, n_elem, 6) local end forces [N1, V1, M1, N2, V2, M2]
+    reactions:           (n_cases, node_count, 3) support reactions, 0 at free DOFs
+    residual_history:    (iterations + 1, n_cases) relative residual norms of the last pcg solve, None otherwise
+    stations:            (n_stations,) positions along the members as fractions of their length, if requested
+    internal_forces:     (n_cases, n_elem, n_stations, 3) [N, V, M] at the stations (see InternalForces)
+    phases:              PhaseRecord timings, peak memory and matrix sizes per solver phase
+    profile_report:      cProfile text report when profiling was requested
+    """
+
+    load_case_names: tuple
+    eq_matrix: np.ndarray
+    displacements: np.ndarray
+    nodal_displacements: np.ndarray
+    element_end_forces: np.ndarray
+    reactions: np.ndarray
+    residual_history: np.ndarray = None
+    stations: np.ndarray = None
+    internal_forces: np.ndarray = None
+    phases: tuple = ()
+    profile_report: str = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "load_case_names", tuple(self.load_case_names))
+        for name in ("eq_matrix", "displacements", "nodal_displacements", "element_end_forces", "reactions"):
+            array = np.array(getattr(self, name))
+            array.setflags(write=False)
+            object.__setattr__(self, name, array)
+        for name in ("residual_history", "stations", "internal_forces"):
+            if getattr(self, name) is not None:
+                array = np.array(getattr(self, name))
+                array.setflags(write=False)
+                object.__setattr__(self, name, array)
+
+    @property
+    def num_eq(self):
+        return self.displacements.shape[0]
+
+    def phase(self, name):
+        # Last record of the named phase, e.g. results.phase("solve").seconds
+        for record in reversed(self.phases):
+            if record.name == name:
+                return record
+        raise KeyError(name)
+
+    def case_index(self, name):
+        return self.load_case_names.index(name)
@@ -1,205 +1,581 @@
+import logging
+import time
+
 import numpy as np
-from ShowResults import ShowResults
+from scipy import sparse
+from ElementKernels import ElementKernels
+from Factorization import Factorization, UpdatedFactorization
+from FrameModelData import FrameModelData
+from FrameResults import FrameResults
+from InternalForces import internal_forces, station_positions
+from IterativeSolver import PRECONDITIONERS, ElementStiffnessOperator, PCGSolver, plan_storage
+from MemberLoads import fixed_end_forces
+from ModelChanges import ModelSnapshot
+from ModelValidation import ModelValidationError, validate_model
+from Renumbering import rcm_node_order, half_bandwidth
+from SolverInstrumentation import PHASES, SolverInstrumentation
+from Substructures import StaticCondensation
+
+
+logger = logging.getLogger(__name__)
+
+
+def analyze(model_data=None, method="sparse", reorder=False, instrumentation=None, **arrays):
+    """
+    Headless entry point: runs a full analysis and returns a FrameResults object.
+    Accepts a FrameModelData or the plain arrays node_coordinates, element_connectivity,
+    element_properties, support_conditions and force_conditions as keyword arguments.
+    Does not import PyQt5 or matplotlib.
+    """
+    if model_data is None:
+        model_data = FrameModelData.fromArrays(**arrays)
+    elif arrays:
+        raise TypeError("Pass either a FrameModelData or plain arrays, not both")
+
+    return FrameSolver(model_data, method=method, reorder=reorder, instrumentation=instrumentation).run()
 
 
 class FrameSolver:
-    def __init__(self, model_data):
+    METHODS = ("sparse", "dense", "banded", "pcg")
+    PHASES = PHASES  # in the order run() executes them
+    UPDATE_PATHS = ("unchanged", "loads", "low-rank", "refactor", "full")  # reanalyze() paths, cheapest first
+
+    def __init__(self, model_data, method="sparse", reorder=False, instrumentation=None, dump_matrices=False,
+                 workers=None, preconditioner="ilu", tolerance=1e-8, max_iterations=None,
+                 memory_limit=None, matrix_free=None, stations=None):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown solver method '{method}', expected one of {self.METHODS}")
+        if preconditioner not in PRECONDITIONERS:
+            raise ValueError(f"Unknown preconditioner '{preconditioner}', expected one of {PRECONDITIONERS}")
+
         self.model = model_data
+        self.method = method    # sparse: CSR + sparse LU, dense: full matrix, banded: band Cholesky, pcg: iterative
+        self.reorder = reorder  # number equations in reverse Cuthill-McKee node order
+        self.instrumentation = instrumentation or SolverInstrumentation()
+        self.dump_matrices = dump_matrices  # log full E, K, F and result arrays; slow on large models
+        self.workers = workers  # threads for condensing substructures, default: one per CPU
+        # Station count or fractions of the member length; when set, N, V and M along every member
+        # are recovered with the end forces (see InternalForces)
+        self.stations = None if stations is None else station_positions(stations)
+
+        # pcg only: see IterativeSolver. memory_limit is in bytes; matrix_free None lets the limit decide
+        self.preconditioner = preconditioner
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.memory_limit = memory_limit
+        self.matrix_free = matrix_free
+        self.storage = None  # pcg: storage of K_global, preconditioner and memory estimate chosen for the last assembly
         self.num_eq = 0
-        self.E = None  # Equation numbering
-        self.K_global = None
-        self.F_global = None
-        self.displacements = None
-
-    def solve(self):
-        self._number_equations()
-        self._assemble_global_stiffness()
-        self._assemble_global_load_vector()
-        self._solve_displacements()
-        self._compute_element_end_forces()
-
-        self.results_window = ShowResults(
-                                            self.model,
-                                            displacements=self.displacements,
-                                            eq_matrix=self.E,
-                                            coords=self.model.node_coordinates,
-                                            elements=self.model.element_connectivity,
-                                            element_end_forces = self.element_end_forces
-                                         )
-        self.results_window.show()
+        self.E = None  # Equation numbering, rows follow the user's node numbering
+        self.bandwidth = None  # (before, after) half bandwidth of K_global
+        self.K_global = None  # only the DOFs left after condensing the substructures, if the model has any
+        self.condensation = None  # StaticCondensation of the model's substructures
+        self.F_global = None  # (num_eq, n_cases), one column per load case
+        self.factorization = None  # cached factorization of K_global, reused for every load case
+        self.load_case_names = []
+        self.displacements = None  # (num_eq, n_cases), columns follow load_case_names
+        self.nodal_loads = None  # (n_cases, node_count, 3) applied nodal loads
+        self.fixed_end_forces = None  # (n_cases, n_elem, 6) local fixed-end forces of the member loads, None without any
+        self.nodal_displacements = None  # (n_cases, node_count, 3)
+        self.reactions = None  # (n_cases, node_count, 3)
+        self.kernels = None  # element geometry, k_local and T cached from assembly for force recovery
+        self.element_end_forces = None  # (n_cases, n_elem, 6) local end forces, contiguous per case
+        self.internal_forces = None  # (n_cases, n_elem, n_stations, 3) [N, V, M], only with stations
+        self.validation = None  # ValidationReport of the last run
+        self.snapshot = None  # ModelSnapshot of the model as last solved, for reanalyze()
+        self.base_factorization = None  # last full factorization of K_global
+        self.update_dofs = np.zeros(0, dtype=int)  # equations (zero-based) where K_global differs from base_factorization
+        self.update_delta = np.zeros((0, 0))  # K_global - factorized K on update_dofs
+        self.factor_seconds = 0.0  # time of the last full factorization
+        self.rhs_seconds = 0.0  # time of one solve per right-hand side with the current factorization
+
+    def run(self):
+        """
+        Runs the analysis without any GUI and returns the FrameResults.
+        Phase timings are recorded by self.instrumentation and attached to the results.
+        Raises ModelValidationError, carrying the full report, if the model has any problems.
+        """
+        instrumentation = self.instrumentation
+        instrumentation.reset()
+
+        with instrumentation.profiled():
+            self._validate()
+
+            with instrumentation.phase("numbering") as phase:
+                self._number_equations()
+                phase.sizes.update(num_eq=self.num_eq, bandwidth=self.bandwidth)
+
+            with instrumentation.phase("assembly") as phase:
+                self._assemble_global_stiffness()
+                self.factorization = None
+                phase.sizes.update(self._assembly_sizes())
+
+            self._solve_and_recover()
+
+        self.snapshot = ModelSnapshot(self.model)
+        logger.log(instrumentation.log_level, "Analysis finished in %.3f ms", instrumentation.total_seconds() * 1000)
+        return self.build_results()
+
+    def reanalyze(self, model_data=None, max_update_rank=240):
+        """
+        Re-solves after edits to the model (or a new copy of it in model_data), reusing as much of
+        the last analysis as the changes allow. The path taken is stored in the sizes of the
+        "update" phase of the results and logged with its time:
+
+            unchanged  nothing changed; the last results are returned
+            loads      only loads changed; the cached factorization is reused
+            low-rank   A, I or E of a few elements changed; K_global is patched with their stiffness
+                       differences and the factorization is updated with the Woodbury identity
+            refactor   as low-rank, but the update would touch more than max_update_rank
+                       equations or is estimated to take longer than a new factorization,
+                       so the patched K_global is factorized again without reassembly
+            full       nodes, connections, supports or substructures changed, nothing was solved
+                       before, or properties changed in a model with substructures
+        """
+        if model_data is not None:
+            self.model = model_data
+
+        instrumentation = self.instrumentation
+        instrumentation.reset()
+
+        with instrumentation.profiled():
+            self._validate()
+
+            with instrumentation.phase("update") as phase:
+                changes = self.snapshot.changes(self.model) if self.snapshot is not None else None
+                if (changes is None or self.factorization is None or changes.structure
+                        or changes.properties.size and self.condensation is not None):
+                    path = "full"
+                elif changes.properties.size:
+                    path = self._update_stiffness(changes.properties, max_update_rank)
+                elif changes.loads:
+                    path = "loads"
+                else:
+                    path = "unchanged"
+                description = changes.describe() if changes else "first solve"
+                phase.sizes.update(path=path, changes=description, rank=self.update_dofs.shape[0])
+
+            if path == "full":
+                with instrumentation.phase("numbering") as phase:
+                    self._number_equations()
+                    phase.sizes.update(num_eq=self.num_eq, bandwidth=self.bandwidth)
+                with instrumentation.phase("assembly") as phase:
+                    self._assemble_global_stiffness()
+                    self.factorization = None
+                    phase.sizes.update(self._assembly_sizes())
+
+            if path != "unchanged":
+                self._solve_and_recover()
+
+        self.snapshot = ModelSnapshot(self.model)
+        logger.log(instrumentation.log_level, "Re-analysis path %s (%s) finished in %.3f ms",
+                   path, description, instrumentation.total_seconds() * 1000)
+        return self.build_results()
+
+    def _validate(self):
+        with self.instrumentation.phase("validation") as phase:
+            self.validation = validate_model(self.model)
+            phase.sizes.update(issues=self.validation.issue_count)
+        if not self.validation.ok:
+            raise ModelValidationError(self.validation)
+
+    def _solve_and_recover(self):
+        instrumentation = self.instrumentation
+
+        with instrumentation.phase("loads") as phase:
+            self._assemble_global_load_vector()
+            phase.sizes.update(shape=self.F_global.shape, load_cases=len(self.load_case_names),
+                               member_loads=sum(len(rows) for rows in self.model.member_loads.values()))
+
+        with instrumentation.phase("solve") as phase:
+            self._solve_displacements()
+            phase.sizes.update(factor_nnz=self.factorization.nnz, shape=self.displacements.shape)
+            if self.method == "pcg":
+                pcg = self._pcg()
+                phase.sizes.update(iterations=int(pcg.iterations.max(initial=0)),
+                                   residual=float(pcg.residual_history[-1].max(initial=0.0)))
+
+        with instrumentation.phase("recovery") as phase:
+            self._compute_element_end_forces()
+            self.reactions = self._compute_reactions()
+            phase.sizes.update(shape=self.element_end_forces.shape)
+            if self.stations is not None:
+                self.internal_forces = self._internal_forces_for(self.element_end_forces, self.load_case_names,
+                                                                 self.model.member_loads)
+                phase.sizes.update(stations=self.stations.shape[0])
+
+    def _update_stiffness(self, elements, max_update_rank):
+        """
+        Applies new A, I, E of the given elements to K_global by adding only their stiffness
+        differences, then updates or redoes the factorization. Returns the path taken.
+        """
+        kernels = self.kernels
+        properties = np.asarray(self.model.element_properties, dtype=float).reshape(-1, 3)
+
+        old = kernels.global_stiffness_matrices(elements)
+        kernels.set_properties(elements, properties[elements])
+        delta = kernels.global_stiffness_matrices(elements) - old
+
+        dof_matrix = self._element_dof_matrix(kernels.n1[elements], kernels.n2[elements])
+        rows, cols, vals = self._stiffness_triplets(delta, dof_matrix)
+        self._add_to_stiffness(rows, cols, vals)
+
+        # The update is kept relative to the last full factorization, so repeated edits accumulate.
+        # Each equation it newly touches costs one solve with the base factorization.
+        dofs = np.union1d(self.update_dofs, rows)
+        new_solves = dofs.shape[0] - self.update_dofs.shape[0]
+        if (self.method == "pcg" or dofs.shape[0] > max_update_rank
+                or new_solves * self.rhs_seconds > self.factor_seconds):
+            # With PCG every solve costs iterations, so only the preconditioner is rebuilt
+            self._factorize_stiffness()
+            return "refactor"
+
+        update_delta = np.zeros((dofs.shape[0], dofs.shape[0]))
+        previous = np.searchsorted(dofs, self.update_dofs)
+        update_delta[np.ix_(previous, previous)] = self.update_delta
+        np.add.at(update_delta, (np.searchsorted(dofs, rows), np.searchsorted(dofs, cols)), vals)
+
+        self.update_dofs, self.update_delta = dofs, update_delta
+        previous = self.factorization if isinstance(self.factorization, UpdatedFactorization) else None
+        self.factorization = UpdatedFactorization(self.base_factorization, dofs, update_delta, previous)
+        return "low-rank"
+
+    def build_results(self):
+        # Snapshot of every load case solved so far, including solve_load_cases() runs
+        return FrameResults(
+            load_case_names=self.load_case_names,
+            eq_matrix=self.E,
+            displacements=self.displacements,
+            nodal_displacements=self.nodal_displacements,
+            element_end_forces=self.element_end_forces,
+            reactions=self.reactions,
+            residual_history=self._pcg().residual_history if self.method == "pcg" else None,
+            stations=self.stations,
+            internal_forces=self.internal_forces,
+            phases=tuple(self.instrumentation.phases),
+            profile_report=self.instrumentation.profile_report,
+        )
+
+    def _matrix_sizes(self, matrix):
+        # Shape, stored entries and memory of a dense or sparse matrix, for the phase records
+        if isinstance(matrix, ElementStiffnessOperator):
+            return {"shape": matrix.shape, "nnz": 0, "bytes": matrix.nbytes}
+        if sparse.issparse(matrix):
+            nbytes = matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+            return {"shape": matrix.shape, "nnz": matrix.nnz, "bytes": nbytes}
+        return {"shape": matrix.shape, "nnz": int(np.count_nonzero(matrix)), "bytes": matrix.nbytes}
+
+    def _assembly_sizes(self):
+        sizes = self._matrix_sizes(self.K_global)
+        if self.condensation is not None:
+            sizes.update(self.condensation.sizes())
+        if self.method == "pcg":
+            sizes.update(self.storage)
+        return sizes
+
+    def _dump(self, message, array):
+        # Full array dumps are opt-in; at scale printing them takes longer than the solve
+        if self.dump_matrices:
+            logger.log(self.instrumentation.log_level, "%s:\n%s", message,
+                       array.toarray() if sparse.issparse(array) else array)
 
     def _number_equations(self):
         node_count = self.model.node_coordinates.shape[0]
-        self.E = np.zeros((node_count, 3), dtype=int)
-
-        for i in range(self.model.support_conditions.shape[0]):
-            node_id = int(self.model.support_conditions[i, 0]) - 1
-            self.E[node_id] = self.model.support_conditions[i, 1:]
-
-        eq_num = 1
-        for i in range(node_count):
-            for j in range(3):  # x, y, rotation
-                if self.E[i, j] == 0:
-                    self.E[i, j] = eq_num
-                    eq_num += 1
-                else:
-                    self.E[i, j] = 0
-        self.num_eq = eq_num - 1
+        connectivity = self.model.element_connectivity
+        restrained = self.model.restrainedDofs()
 
-        print("Equation numbering (E):\n", self.E)
-        print("Number of equations (num_eq):", self.num_eq)
+        natural_order = np.arange(node_count)
+        E_natural = self._equation_numbers(restrained, natural_order)
+        bandwidth_before = half_bandwidth(E_natural, connectivity)
 
-    def _assemble_global_stiffness(self):
-        self.K_global = np.zeros((self.num_eq, self.num_eq))
+        if self.reorder:
+            self.E = self._equation_numbers(restrained, rcm_node_order(self.model.topology().node_adjacency()))
+        else:
+            self.E = E_natural
 
-        rowConnectivity = self.model.element_connectivity.shape[0]
+        self.num_eq = int(self.E.max()) if self.E.size else 0
+        self.bandwidth = (bandwidth_before, half_bandwidth(self.E, connectivity))
 
-        for row in range(rowConnectivity):
-            n1, n2 = self.model.element_connectivity[row, 0] - 1, self.model.element_connectivity[row, 1] - 1
-            x1, y1 = self.model.node_coordinates[n1]
-            x2, y2 = self.model.node_coordinates[n2]
+        self._dump("Equation numbering (E)", self.E)
+        logger.log(self.instrumentation.log_level,
+                   "Number of equations: %d, half bandwidth: %d before, %d after renumbering",
+                   self.num_eq, self.bandwidth[0], self.bandwidth[1])
 
-            A, I, E = self.model.element_properties[row]
+    def _equation_numbers(self, restrained, node_order):
+        """
+        Numbers the free DOFs (x, y, rotation) of the nodes in node_order consecutively from 1.
+        Restrained DOFs get 0. Rows of the returned matrix stay in the user's node numbering.
+        """
+        free = ~restrained[node_order]
+        numbers = np.cumsum(free.ravel()).reshape(free.shape) * free
 
-            print(f"Processing element {row+1}: Nodes {n1+1}-{n2+1}, Coordinates ({x1}, {y1}) to ({x2}, {y2}), Properties (A={A}, I={I}, E={E})")
+        E = np.zeros(restrained.shape, dtype=int)
+        E[node_order] = numbers
+        return E
 
-            L = ((x2 - x1)**2 + (y2 - y1)**2)**0.5
-            c = (x2 - x1) / L
-            s = (y2 - y1) / L
+    def _assemble_global_stiffness(self):
+        kernels = ElementKernels(self.model.node_coordinates,
+                                 self.model.element_connectivity,
+                                 self.model.element_properties)
+        self.kernels = kernels
+
+        # Element matrices in global axes and their equation numbers, stacked for one-pass assembly
+        self.condensation = None
+        elements = slice(None)
+        size = self.num_eq
+        if self.model.substructures:
+            # Substructure elements enter K_global only through their condensed superelements
+            self.condensation = StaticCondensation(self.model, kernels, self.E, self.workers)
+            elements = self.condensation.free_elements
+            size = self.condensation.reduced_size
+
+        if self.method == "pcg":
+            matrix_free, preconditioner, estimate = plan_storage(
+                self.num_eq, kernels.count, self.E.shape[0], len(self.model.getLoadCases()), self.preconditioner,
+                self.memory_limit, self.matrix_free, assembled_only=self.condensation is not None)
+            self.storage = {"storage": "matrix-free" if matrix_free else "csr", "preconditioner": preconditioner,
+                            "memory_estimate": estimate}
+            if matrix_free:
+                # K_global is applied from the element stacks and never assembled
+                dof_matrix = self._element_dof_matrix(kernels.n1, kernels.n2)
+                self.K_global = ElementStiffnessOperator(kernels, dof_matrix, self.num_eq)
+                return
+
+        k_globals = kernels.global_stiffness_matrices(elements)
+        dof_matrix = self._element_dof_matrix(kernels.n1[elements], kernels.n2[elements])
+
+        rows, cols, vals = self._stiffness_triplets(k_globals, dof_matrix)
+        if self.condensation is not None:
+            rows, cols, vals = self.condensation.reduce(rows, cols, vals)
+            self.bandwidth = (self.bandwidth[0], int(np.max(np.abs(cols - rows), initial=0)))
+            sizes = self.condensation.sizes()
+            logger.log(self.instrumentation.log_level, "Condensed %d substructures into %d superelements, "
+                       "%d of %d equations left", sizes["substructures"], sizes["superelements"], size, self.num_eq)
+
+        if self.method in ("sparse", "pcg"):
+            # Duplicate (row, col) pairs are summed by the COO -> CSR conversion
+            self.K_global = sparse.coo_matrix((vals, (rows, cols)), shape=(size, size)).tocsr()
+        elif self.method == "banded":
+            self.K_global = np.zeros((self.bandwidth[1] + 1, size))
+            self._add_to_stiffness(rows, cols, vals)
+        else:
+            self.K_global = np.zeros((size, size))
+            self._add_to_stiffness(rows, cols, vals)
+
+        self._dump("Global stiffness matrix (K_global)", self.K_global)
+
+    def _add_to_stiffness(self, rows, cols, vals):
+        # Adds COO triplets into K_global in the storage of the solver method
+        if isinstance(self.K_global, ElementStiffnessOperator):
+            return  # applied from the element kernels, which already hold the new stiffness
+        if self.method in ("sparse", "pcg"):
+            self.K_global = self.K_global + sparse.coo_matrix((vals, (rows, cols)), shape=self.K_global.shape).tocsr()
+        elif self.method == "banded":
+            # Upper band storage as used by LAPACK: ab[bw + i - j, j] = K[i, j] for i <= j
+            bw = self.bandwidth[1]
+            upper = rows <= cols
+            np.add.at(self.K_global, (bw + rows[upper] - cols[upper], cols[upper]), vals[upper])
+        else:
+            np.add.at(self.K_global, (rows, cols), vals)
+
+    def _stiffness_triplets(self, k_globals, dof_matrix):
+        """
+        Flattens stacked (n_elem, 6, 6) element matrices into COO triplets.
+        Entries that belong to restrained DOFs (equation number 0) are dropped.
+        Returns zero-based row indices, column indices and values.
+        """
+        n_elem = dof_matrix.shape[0]
+        rows = np.repeat(dof_matrix, 6, axis=1)  # row DOF of entry (i, j) is dof[i]
+        cols = np.tile(dof_matrix, (1, 6))       # column DOF of entry (i, j) is dof[j]
+        vals = k_globals.reshape(n_elem, 36)
 
-            # Transformation matrix T and local k
-            k_local = self._element_stiffness_matrix(E, A, I, L)
-            print(f"Element {n1+1}-{n2+1} local stiffness matrix:\n", k_local)
-            T = self._transformation_matrix(c, s)
-            k_global = T.T @ k_local @ T
+        mask = (rows != 0) & (cols != 0)
+        return rows[mask] - 1, cols[mask] - 1, vals[mask]
 
-            
-            # Global DOF indices
-            dof_indices = self._get_global_dof_indices(n1, n2)
+    def solve_load_cases(self, load_cases, member_loads=None):
+        """
+        Solves additional load cases against the cached factorization of K_global.
+        load_cases maps case names to [node_id, Fx, Fy, Mz] rows, and member_loads
+        optionally maps some of them to member load rows (see MemberLoads).
+        The structure must have been solved once before.
+        Returns displacements (num_eq, n_new) and local end forces (n_new, n_elem, 6)
+        for the given cases only.
+        """
+        if self.factorization is None:
+            raise RuntimeError("FrameSolver.run must run before additional load cases can be solved")
+
+        names = list(load_cases)
+        with self.instrumentation.phase("loads"):
+            P = self._nodal_load_array([load_cases[name] for name in names])
+            fixed = self._fixed_end_forces(names, member_loads or {})
+            F = self._load_matrix(P + self._equivalent_nodal_loads(fixed))
+        with self.instrumentation.phase("solve"):
+            U = self.factorization.solve(F).reshape(F.shape)
+        with self.instrumentation.phase("recovery"):
+            disps, f_local = self._end_forces_for(U, fixed)
+            if self.stations is not None:
+                diagrams = self._internal_forces_for(f_local, names, member_loads or {})
+
+        # Keep the new cases alongside the ones already solved
+        if fixed is not None or self.fixed_end_forces is not None:
+            old = self.fixed_end_forces if self.fixed_end_forces is not None else np.zeros(self.element_end_forces.shape)
+            self.fixed_end_forces = np.concatenate((old, fixed if fixed is not None else np.zeros(f_local.shape)))
+        self.load_case_names += names
+        self.nodal_loads = np.concatenate((self.nodal_loads, P))
+        self.F_global = np.hstack((self.F_global, F))
+        self.displacements = np.hstack((self.displacements, U))
+        self.nodal_displacements = np.concatenate((self.nodal_displacements, disps))
+        self.element_end_forces = np.concatenate((self.element_end_forces, f_local))
+        if self.stations is not None:
+            self.internal_forces = np.concatenate((self.internal_forces, diagrams))
+        self.reactions = self._compute_reactions()
+
+        return U, f_local
 
-            # Assemble into K_global
-            for i in range(6):
-                for j in range(6):
-                    if dof_indices[i] != 0 and dof_indices[j] != 0:
-                        self.K_global[dof_indices[i]-1, dof_indices[j]-1] += k_global[i, j]
+    def _assemble_global_load_vector(self):
+        load_cases = self.model.getLoadCases()
+        self.load_case_names = list(load_cases)
+        self.nodal_loads = self._nodal_load_array(list(load_cases.values()))
+        self.fixed_end_forces = self._fixed_end_forces(self.load_case_names, self.model.member_loads)
+        self.F_global = self._load_matrix(self.nodal_loads + self._equivalent_nodal_loads(self.fixed_end_forces))
+
+        self._dump(f"Global load vectors (F_global) for cases {self.load_case_names}", self.F_global)
+
+    def _nodal_load_array(self, case_forces):
+        # Sums [node_id, Fx, Fy, Mz] rows of every case into a (n_cases, node_count, 3) array
+        P = np.zeros((len(case_forces), self.E.shape[0], 3))
+
+        for case, forces in enumerate(case_forces):
+            forces = np.asarray(forces, dtype=float).reshape(-1, 4)
+            np.add.at(P[case], forces[:, 0].astype(int) - 1, forces[:, 1:])
+        return P
+
+    def _fixed_end_forces(self, case_names, member_loads):
+        # Local fixed-end forces (n_cases, n_elem, 6) of the member loads of every case, None if there are none
+        if not any(len(member_loads.get(name, ())) for name in case_names):
+            return None
+        kernels = self.kernels
+        return np.stack([fixed_end_forces(member_loads.get(name, np.zeros((0, 7))), kernels.L, kernels.c, kernels.s)
+                         for name in case_names])
+
+    def _equivalent_nodal_loads(self, fixed):
+        # Nodal loads (n_cases, node_count, 3) equivalent to the member loads: the fixed-end forces reversed
+        if fixed is None:
+            return 0.0
+        kernels = self.kernels
+        f_global = kernels.global_end_forces(fixed)
+        P = np.zeros((fixed.shape[0], self.E.shape[0], 3))
+        np.add.at(P, (slice(None), kernels.n1), -f_global[:, :, :3])
+        np.add.at(P, (slice(None), kernels.n2), -f_global[:, :, 3:])
+        return P
+
+    def _load_matrix(self, P):
+        # Gathers the free DOFs of (n_cases, node_count, 3) nodal loads into a (num_eq, n_cases) block
+        F = np.zeros((self.num_eq, P.shape[0]))
+        free = self.E != 0
+        F[self.E[free] - 1] = P[:, free].T
+        return F
+
+    def _factorize_stiffness(self):
+        start = time.perf_counter()
+        if self.method == "pcg":
+            factorization = self._iterative_solver()
+        else:
+            factorization = Factorization(self.K_global, self.method)
+        if self.condensation is not None:
+            # Solves take and return all num_eq equations, including the condensed interior ones
+            factorization = self.condensation.factorization(factorization)
+        self.factorization = self.base_factorization = factorization
+        self.factor_seconds = time.perf_counter() - start
+        self.update_dofs = np.zeros(0, dtype=int)
+        self.update_delta = np.zeros((0, 0))
+
+    def _iterative_solver(self):
+        # PCG stands in for the factorization; the preconditioner is built here once per K_global
+        K = self.K_global
+        index = np.arange(self.num_eq) if self.condensation is None else self.condensation.reduced_index
+        if self.num_eq == 0:
+            groups = np.full(self.E.shape, -1)  # every DOF is restrained
+        else:
+            groups = np.where(self.E > 0, index[self.E - 1], -1)
+        node_blocks = None
+        if isinstance(K, ElementStiffnessOperator):
+            node_blocks = lambda: K.node_blocks(self.E.shape[0])
+        return PCGSolver(K, self.storage["preconditioner"], self.tolerance, self.max_iterations,
+                         groups=groups, node_blocks=node_blocks, log_level=self.instrumentation.log_level)
+
+    def _pcg(self):
+        # PCGSolver of the last solve, also when the substructure condensation wraps it
+        return self.factorization.reduced if self.condensation is not None else self.factorization
 
-        print("Global stiffness matrix (K_global):\n", self.K_global)
+    def _solve_displacements(self):
+        if self.factorization is None:
+            self._factorize_stiffness()
 
-    def _assemble_global_load_vector(self):
-        self.F_global = np.zeros((self.num_eq, 1))
+        # All load cases are solved in one pass against the same factorization
+        start = time.perf_counter()
+        self.displacements = self.factorization.solve(self.F_global).reshape(self.F_global.shape)
+        self.rhs_seconds = (time.perf_counter() - start) / max(self.displacements.shape[1], 1)
+        self._dump("Displacements", self.displacements)
 
-        for force in self.model.force_conditions:
-            node = int(force[0]) - 1
-            for i in range(3):  # Fx, Fy, M
-                dof = self.E[node, i]
-                if dof != 0:
-                    self.F_global[dof - 1] += force[i + 1]
-        
-        print("Global load vector (F_global):\n", self.F_global)
+    def _element_dof_matrix(self, n1, n2):
+        # Equation numbers of [ux1, uy1, rz1, ux2, uy2, rz2] for every element, shape (n_elem, 6)
+        return np.hstack((self.E[n1], self.E[n2]))
 
-    def _solve_displacements(self):
-        self.displacements = np.linalg.solve(self.K_global, self.F_global)
-        print("Displacements:\n", self.displacements)
-
-    def _get_global_dof_indices(self, n1, n2):
-        return [
-            self.E[n1, 0], self.E[n1, 1], self.E[n1, 2],
-            self.E[n2, 0], self.E[n2, 1], self.E[n2, 2]
-        ]
-
-    def _transformation_matrix(self, c, s):
-        T = np.zeros((6, 6))
-        T[0, 0] = T[3, 3] = c
-        T[0, 1] = T[3, 4] = s
-        T[1, 0] = T[4, 3] = -s
-        T[1, 1] = T[4, 4] = c
-        T[2, 2] = T[5, 5] = 1
-        return T
-
-    def _element_stiffness_matrix(self, E, A, I, L):
-        EA_L = E * A / L
-        EI_L2 = E * I / L**2
-        EI_L3 = E * I / L**3
-
-        k = np.array([
-            [ EA_L,      0,           0,     -EA_L,      0,           0],
-            [ 0,      12*EI_L3,   6*EI_L2,     0,   -12*EI_L3,   6*EI_L2],
-            [ 0,      6*EI_L2,    4*E*I/L,     0,   -6*EI_L2,    2*E*I/L],
-            [-EA_L,     0,           0,      EA_L,      0,           0],
-            [ 0,     -12*EI_L3,  -6*EI_L2,     0,    12*EI_L3,  -6*EI_L2],
-            [ 0,      6*EI_L2,    2*E*I/L,     0,   -6*EI_L2,    4*E*I/L]
-        ])
-        return k
-    
     # Define the function to be used in FrameSolver for post-processing member end forces
 
     def _compute_element_end_forces(self):
         """
-        Computes local member end forces for all elements in the structure.
-        Assumes self.displacements contains global DOFs per node: [ux, uy, rz]
-        Assumes self.model_data has node_coordinates, element_connectivity, and material_props
-        Returns a list of local force vectors for each element.
+        Computes local member end forces for all elements and all load cases
+        into self.element_end_forces, shape (n_cases, n_elem, 6), including the
+        fixed-end forces of the member loads.
         """
-        self.element_end_forces = {}
-        coords = self.model.node_coordinates
-        connectivity = self.model.element_connectivity
-        materials = self.model.element_properties  # [A, I, E] per element
-        eq_matrix = self.E  # Equation numbering matrix
-        disps = np.zeros((self.model.node_coordinates.shape[0], 3))
-
-        for i in range(self.model.node_coordinates.shape[0]):
-            for j in range(3):
-                eq = eq_matrix[i, j]
-                if eq > 0:
-                    disps[i,j] = self.displacements[eq - 1][0]
-                else:
-                    disps[i,j] = 0.0
-
-        print("Displacements for each node:\n", disps)
-
-        for i, (n1, n2) in enumerate(connectivity):
-            n1 -= 1  # zero-based
-            n2 -= 1
-
-            x1, y1 = coords[n1]
-            x2, y2 = coords[n2]
-            ux1, uy1, rz1 = disps[n1]
-            ux2, uy2, rz2 = disps[n2]
-            d_global = np.array([ux1, uy1, rz1, ux2, uy2, rz2])
-
-            A, I, E = materials[i]
-            L = np.hypot(x2 - x1, y2 - y1)
-            c = (x2 - x1) / L
-            s = (y2 - y1) / L
-
-            # Rotation matrix R (6x6)
-            R = np.array([
-                [ c,  s, 0,  0,  0, 0],
-                [-s,  c, 0,  0,  0, 0],
-                [ 0,  0, 1,  0,  0, 0],
-                [ 0,  0, 0,  c,  s, 0],
-                [ 0,  0, 0, -s,  c, 0],
-                [ 0,  0, 0,  0,  0, 1]
-            ])
-
-            # Local displacement vector
-            d_local = R @ d_global
-
-            # Local stiffness matrix k'
-            k_local = np.array([
-                [ A*E/L,        0,          0,        -A*E/L,        0,          0],
-                [ 0,     12*E*I/L**3,  6*E*I/L**2,     0, -12*E*I/L**3,  6*E*I/L**2],
-                [ 0,     6*E*I/L**2,   4*E*I/L,        0, -6*E*I/L**2,   2*E*I/L],
-                [-A*E/L,        0,          0,         A*E/L,        0,          0],
-                [ 0, -12*E*I/L**3, -6*E*I/L**2,        0,  12*E*I/L**3, -6*E*I/L**2],
-                [ 0,     6*E*I/L**2,   2*E*I/L,        0, -6*E*I/L**2,   4*E*I/L]
-            ])
-
-            # Local force vector
-            f_local = k_local @ d_local
-            self.element_end_forces[f"Element {i+1}"] = f_local
-
-            print(f"Element {i+1} local end forces:\n", f_local)
-         
+        self.nodal_displacements, self.element_end_forces = self._end_forces_for(self.displacements,
+                                                                                 self.fixed_end_forces)
+
+    def _end_forces_for(self, displacements, fixed_end_forces=None):
+        """
+        Computes local member end forces for the displacement columns in displacements.
+        Assumes displacements holds global DOFs in equation order, one column per case,
+        and reuses the element kernels cached by the stiffness assembly.
+        Returns nodal displacements (n_cases, node_count, 3) and local end forces (n_cases, n_elem, 6).
+        """
+        kernels = self.kernels
+        n_cases = displacements.shape[1]
+
+        # Row 0 of the padded vector serves every restrained DOF (equation number 0)
+        padded = np.vstack((np.zeros((1, n_cases)), displacements))
+        disps = np.ascontiguousarray(np.moveaxis(padded[self.E], 2, 0))
+
+        self._dump("Displacements for each node", disps)
+
+        # Element end displacements in global axes, shape (n_cases, n_elem, 6)
+        d_global = np.concatenate((disps[:, kernels.n1], disps[:, kernels.n2]), axis=2)
+        f_local = kernels.local_end_forces(d_global)
+        if fixed_end_forces is not None:
+            f_local += fixed_end_forces
+
+        self._dump("Element local end forces", f_local)
+        return disps, f_local
+
+    def _internal_forces_for(self, f_local, case_names, member_loads):
+        # [N, V, M] at the stations of every member, (n_cases, n_elem, n_stations, 3)
+        kernels = self.kernels
+        return np.stack([internal_forces(f_local[case], kernels.L, kernels.c, kernels.s, self.stations,
+                                         member_loads.get(name))
+                         for case, name in enumerate(case_names)])
+
+    def _compute_reactions(self):
+        """
+        Support reactions per case, shape (n_cases, node_count, 3).
+        Member end forces are rotated to global axes and summed at the nodes;
+        whatever the applied loads do not balance at a restrained DOF is the reaction.
+        """
+        kernels = self.kernels
+        f_global = kernels.global_end_forces(self.element_end_forces)
 
+        internal = np.zeros(self.nodal_loads.shape)
+        np.add.at(internal, (slice(None), kernels.n1), f_global[:, :, :3])
+        np.add.at(internal, (slice(None), kernels.n2), f_global[:, :, 3:])
 
+        return np.where(self.E == 0, internal - self.nodal_loads, 0.0)
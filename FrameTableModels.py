@@ -0,0 +1,205 @@
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtWidgets import QHeaderView
+import numpy as np
+
+
+# Column kinds:
+#   "row"   row number + 1, read-only (node and element IDs)
+#   "node"  node ID stored as a number, 0 means not entered
+#   "float" value stored as float, NaN means not entered
+#   "check" 0/1 flag shown as a checkbox
+
+NODE_COLUMNS = [
+    ("Node ID", None, None, "row"),
+    ("X (m)", "node_coordinates", 0, "float"),
+    ("Y (m)", "node_coordinates", 1, "float"),
+]
+
+ELEMENT_COLUMNS = [
+    ("Element ID", None, None, "row"),
+    ("Start Node ID", "element_connectivity", 0, "node"),
+    ("End Node ID", "element_connectivity", 1, "node"),
+    ("Cross Sectional Area (m_{^2})", "element_properties", 0, "float"),
+    ("Moment of Inertia (m_{^4})", "element_properties", 1, "float"),
+    ("Elastic Modulus (MPa)", "element_properties", 2, "float"),
+]
+
+SUPPORT_COLUMNS = [
+    ("Node ID", "support_conditions", 0, "node"),
+    ("Fixed in X Direction", "support_conditions", 1, "check"),
+    ("Fixed in Y Direction", "support_conditions", 2, "check"),
+    ("Fixed in Rotation", "support_conditions", 3, "check"),
+]
+
+FORCE_COLUMNS = [
+    ("Node ID", "force_conditions", 0, "node"),
+    ("X (kN)", "force_conditions", 1, "float"),
+    ("Y (kN)", "force_conditions", 2, "float"),
+    ("M (kNm)", "force_conditions", 3, "float"),
+]
+
+
+class ArrayTableModel(QAbstractTableModel):
+    """
+    Shows the rows of FrameModelData arrays in a QTableView and writes edits straight back into them.
+    Each column is (header, array attribute, array column, kind). The arrays are looked up on every
+    access, so a model whose arrays are replaced only needs refresh().
+    """
+
+    def __init__(self, model_data, columns, parent=None):
+        super().__init__(parent)
+        self.model_data = model_data
+        self.columns = columns
+        self.row_attribute = next(attribute for _, attribute, _, _ in columns if attribute)
+
+    def refresh(self):
+        self.beginResetModel()
+        self.endResetModel()
+
+    def array(self, column):
+        return getattr(self.model_data, self.columns[column][1])
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return np.shape(getattr(self.model_data, self.row_attribute))[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return str(section + 1)
+
+    def flags(self, index):
+        kind = self.columns[index.column()][3]
+        if kind == "row":
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if kind == "check":
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        _, _, column, kind = self.columns[index.column()]
+
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        if kind == "row":
+            return str(row + 1) if role in (Qt.DisplayRole, Qt.EditRole) else None
+
+        value = self.array(index.column())[row, column]
+        if kind == "check":
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if value else Qt.Unchecked
+            return None
+
+        if role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        if kind == "node":
+            return str(int(value)) if value > 0 else ""
+        return "" if np.isnan(value) else str(float(value))
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row = index.row()
+        _, _, column, kind = self.columns[index.column()]
+        array = self.array(index.column())
+
+        if kind == "check":
+            if role != Qt.CheckStateRole:
+                return False
+            array[row, column] = 1 if value == Qt.Checked else 0
+        elif role == Qt.EditRole and kind in ("node", "float"):
+            text = str(value).strip()
+            try:
+                if kind == "node":
+                    array[row, column] = int(text) if text else 0
+                else:
+                    array[row, column] = float(text) if text else np.nan
+            except (ValueError, OverflowError):
+                # The editor keeps the old value; bad text never reaches the arrays
+                return False
+        else:
+            return False
+
+        self.model_data.arrayChanged(self.columns[index.column()][1])
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """
+    Read-only table over result columns, each (header, 1-D array, format string).
+    Rows go through self.order, so sorting and filtering are done with NumPy on the
+    column arrays and never touch more than the visible rows through Qt.
+    """
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.order = np.arange(len(columns[0][1]))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.order.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return None
+        _, values, fmt = self.columns[index.column()]
+        return fmt.format(values[self.order[index.row()]])
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        positions = np.argsort(self.columns[column][1][self.order], kind="stable")
+        if order == Qt.DescendingOrder:
+            positions = positions[::-1]
+        self.order = self.order[positions]
+
+        # Keep the selection on the same elements
+        new_rows = np.empty_like(positions)
+        new_rows[positions] = np.arange(positions.shape[0])
+        old = self.persistentIndexList()
+        self.changePersistentIndexList(old, [self.index(int(new_rows[i.row()]), i.column()) for i in old])
+        self.layoutChanged.emit()
+
+    def setRows(self, rows):
+        # Shows only the given array rows, in the given order
+        self.beginResetModel()
+        self.order = np.asarray(rows, dtype=np.int64)
+        self.endResetModel()
+
+    def arrayRow(self, row):
+        return int(self.order[row])
+
+
+def attach_table(view, table_model):
+    # Fixed row heights let the view lay out only the rows that are visible
+    view.setModel(table_model)
+    rows = view.verticalHeader()
+    rows.setSectionResizeMode(QHeaderView.Fixed)
+    rows.setDefaultSectionSize(rows.fontMetrics().height() + 8)
+    return table_model
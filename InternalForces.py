@@ -0,0 +1,110 @@
+"""
+Axial force, shear and bending moment along every member.
+
+    stations = np.linspace(0, 1, 11)
+    NVM = internal_forces(f_local, L, c, s, stations, member_loads)   # (n_elem, 11, 3)
+
+The distributions follow from the local end forces [N1, V1, M1, N2, V2, M2] and the
+member loads between the start node and each station:
+
+    N(x) = -N1 - integral of q_x
+    V(x) =  V1 + integral of q_y
+    M(x) = -M1 + V1 x + integral of q_y(t) (x - t) dt
+
+so tension and sagging moments (tension on the local -y side) are positive, and the
+values at x = L agree with N2, -V2 and M2. Stations are fractions of the member length;
+all members and all member loads are evaluated in one pass.
+"""
+import numpy as np
+
+from MemberLoads import POINT, local_components
+
+
+STATIONS = 11  # default stations per member, ends included
+POINT_BUDGET = 200_000  # diagram points drawn for the whole frame; stations are thinned out beyond this
+
+
+def station_positions(stations=STATIONS):
+    # Fractions of the member length: a count of equally spaced stations, or the positions themselves
+    if np.ndim(stations) == 0:
+        return np.linspace(0.0, 1.0, int(stations))
+    return np.asarray(stations, dtype=float)
+
+
+def internal_forces(end_forces, L, c, s, stations=STATIONS, member_loads=None):
+    """
+    end_forces:   (n_elem, 6) local end forces of one load case, fixed-end forces included
+    L, c, s:      element lengths and direction cosines (ElementKernels)
+    member_loads: member load rows of the same case, see MemberLoads
+    Returns [N, V, M] at every station, shape (n_elem, n_stations, 3).
+    """
+    xi = station_positions(stations)
+    x = L[:, None] * xi  # (n_elem, n_stations)
+    f = np.asarray(end_forces, dtype=float)
+
+    values = np.empty(x.shape + (3,))
+    values[:, :, 0] = -f[:, 0, None]
+    values[:, :, 1] = f[:, 1, None]
+    values[:, :, 2] = -f[:, 2, None] + f[:, 1, None] * x
+
+    rows = np.zeros((0, 7)) if member_loads is None else np.asarray(member_loads, dtype=float).reshape(-1, 7)
+    if rows.shape[0]:
+        _add_member_loads(values, rows, xi, L, c, s)
+    return values
+
+
+def _add_member_loads(values, rows, xi, L, c, s):
+    # Adds the resultants of the loads between the start node and every station
+    e = rows[:, 0].astype(np.int64) - 1
+    kind, w1, w2, a, b = rows[:, 1], rows[:, 3], rows[:, 4], rows[:, 5], rows[:, 6]
+    point = kind == POINT
+    along, across = local_components(rows, c, s)
+
+    length = L[e][:, None]
+    x = xi * length  # (n_rows, n_stations)
+    start, end = a[:, None] * length, np.where(point, a, b)[:, None] * length
+
+    # Linear load from w1 at start to w2 at end, over the part of [start, end] left of x
+    slope = np.where(point, 0.0, (w2 - w1) / np.where(b > a, b - a, 1.0))[:, None] / length
+    u = np.clip(x, start, end) - start
+    d = x - start
+    force = w1[:, None] * u + slope * u * u / 2
+    moment = w1[:, None] * (d * u - u * u / 2) + slope * (d * u * u / 2 - u ** 3 / 3)
+
+    # A point load acts on the stations beyond it; the last station always includes it, so V(L) = -V2
+    beyond = (xi > a[:, None]) | (xi == 1.0)
+    force = np.where(point[:, None], w1[:, None] * beyond, force)
+    moment = np.where(point[:, None], w1[:, None] * np.maximum(d, 0.0), moment)
+
+    contributions = np.stack((-force * along[:, None], force * across[:, None], moment * across[:, None]), axis=-1)
+    n_stations = xi.shape[0]
+    flat = values.reshape(-1, 3)
+    index = (e[:, None] * n_stations + np.arange(n_stations)).ravel()
+    for k in range(3):
+        flat[:, k] += np.bincount(index, weights=contributions[:, :, k].ravel(), minlength=flat.shape[0])
+
+
+def display_stations(element_count, station_count, budget=POINT_BUDGET):
+    # Indices of the stations kept for drawing, evenly thinned so about budget points are drawn; ends are kept
+    step = max(int(np.ceil(element_count * station_count / budget)), 1)
+    return np.union1d(np.arange(0, station_count, step), [station_count - 1])
+
+
+def diagram_polylines(coords, n1, n2, values, stations, scale):
+    """
+    One polyline with NaN gaps tracing the diagram of every member: from the start node
+    out to the values, drawn at scale along the local y axis, and back to the end node.
+    values: (n_elem, n_stations) one quantity at the fractions stations of every member.
+    Returns x and y arrays for a single Line2D.
+    """
+    coords = np.asarray(coords, dtype=float)
+    p1, p2 = coords[n1], coords[n2]
+    axis = p2 - p1
+    normal = np.column_stack((-axis[:, 1], axis[:, 0])) / np.hypot(axis[:, 0], axis[:, 1])[:, None]
+
+    along = p1[:, None, :] + np.asarray(stations)[None, :, None] * axis[:, None, :]
+    points = along + (scale * values)[:, :, None] * normal[:, None, :]
+
+    n_elem = values.shape[0]
+    path = np.concatenate((p1[:, None, :], points, p2[:, None, :], np.full((n_elem, 1, 2), np.nan)), axis=1)
+    return path[:, :, 0].ravel(), path[:, :, 1].ravel()
@@ -0,0 +1,272 @@
+"""
+Preconditioned conjugate gradient solver for models too large for a direct factorization.
+
+    FrameSolver(model, method="pcg", preconditioner="ilu", tolerance=1e-8,
+                memory_limit=4 * 2**30).run()
+
+K_global is never stored as a dense matrix. It is assembled in CSR form, or applied
+matrix-free from the element stiffness stacks when the memory limit does not allow
+assembling it. Preconditioners:
+
+    jacobi        inverse of the diagonal of K
+    block-jacobi  inverse of the 3 x 3 block of every node
+    ilu           incomplete LDL' factorization of the assembled K, in place of an
+                  incomplete Cholesky factorization, which SciPy does not provide
+
+The ilu preconditioner is built with SuperLU's spilu in symmetric mode, without
+pivoting. Only its L factor and the diagonal of U are kept, and it is applied as
+P' L^-T D^-1 L^-1 P. The full incomplete LU would not be symmetric, and CG is
+only guaranteed to converge with a symmetric positive definite preconditioner.
+
+All load cases are iterated together; each column stops when its residual norm falls
+below tolerance times the norm of its load vector. The iteration counts and the
+residual history of every solve are kept on the PCGSolver.
+"""
+import logging
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import spilu, spsolve_triangular
+
+
+logger = logging.getLogger(__name__)
+
+PRECONDITIONERS = ("jacobi", "block-jacobi", "ilu")
+
+# Rough memory use in bytes, used to choose the storage and preconditioner under a memory limit
+ELEMENT_BYTES = 1000  # kernels (k_local, T, k_local @ T), geometry and end forces per element and case
+ASSEMBLY_BYTES = 2100  # peak per element while assembling K from COO triplets, including the CSR result
+CSR_NNZ_PER_ELEMENT = 24  # stored entries of K per element once duplicates are summed
+MATRIX_FREE_BYTES = 250  # per element and load case for the temporaries of one matrix-free product
+ILU_FILL_FACTOR = 10
+ILU_DROP_TOL = 1e-5
+CHUNK_SIZE = 100_000  # elements per chunk when node blocks are built from the element stacks
+
+
+class ConvergenceError(RuntimeError):
+    # Raised when PCG does not reach the tolerance within the iteration limit
+
+    def __init__(self, iterations, residuals):
+        self.iterations = iterations
+        self.residuals = residuals
+        super().__init__(f"PCG did not converge in {iterations} iterations, "
+                         f"largest relative residual {np.max(residuals):.3e}")
+
+
+def plan_storage(num_eq, element_count, node_count, n_cases, preconditioner, memory_limit=None, matrix_free=None,
+                 assembled_only=False):
+    """
+    Chooses between an assembled and a matrix-free K and, if needed, a cheaper preconditioner
+    so that the estimated memory stays below memory_limit (bytes). Tries the requested setup
+    first, then ilu -> block-jacobi, then matrix-free K, then jacobi.
+    Returns (matrix_free, preconditioner, estimated bytes); raises MemoryError if nothing fits.
+    """
+    def estimate(free, name):
+        total = element_count * ELEMENT_BYTES * max(n_cases, 1) + 7 * num_eq * n_cases * 8
+        total += element_count * (MATRIX_FREE_BYTES * n_cases if free else ASSEMBLY_BYTES)
+        if name == "ilu":
+            total += ILU_FILL_FACTOR * element_count * CSR_NNZ_PER_ELEMENT * 12
+        elif name == "block-jacobi":
+            total += node_count * 3 * 3 * 8 * 2
+        else:
+            total += num_eq * 8
+        return total
+
+    matrix_free = False if assembled_only else matrix_free
+    candidates = [(bool(matrix_free), preconditioner)]
+    if preconditioner == "ilu":
+        candidates.append((bool(matrix_free), "block-jacobi"))
+    if matrix_free is None and not assembled_only:
+        candidates += [(True, name) for name in ("block-jacobi", "jacobi")]
+    candidates = [(free, name) for free, name in candidates if not (free and name == "ilu")]
+
+    for free, name in candidates:
+        total = estimate(free, name)
+        if memory_limit is None or total <= memory_limit:
+            return free, name, total
+    smallest = min(estimate(free, name) for free, name in candidates)
+    raise MemoryError(f"the iterative solve needs about {smallest / 2**20:.0f} MiB, "
+                      f"more than the limit of {memory_limit / 2**20:.0f} MiB")
+
+
+class ElementStiffnessOperator:
+    """
+    K_global applied without assembling it: K x = sum over elements of T^T k_local T x_e,
+    computed as batched products on the element stacks of ElementKernels.
+    dof_matrix holds the (n_elem, 6) 1-based equation numbers, 0 for restrained DOFs.
+    """
+
+    def __init__(self, kernels, dof_matrix, num_eq):
+        self.kernels = kernels
+        self.dof_matrix = dof_matrix
+        self.shape = (num_eq, num_eq)
+
+    @property
+    def nbytes(self):
+        return self.dof_matrix.nbytes
+
+    def __matmul__(self, X):
+        X = np.asarray(X, dtype=float)
+        columns = X.reshape(self.shape[0], -1)
+        n_cases = columns.shape[1]
+
+        padded = np.vstack((np.zeros((1, n_cases)), columns))
+        f_global = self.kernels.global_stiffness_product(padded[self.dof_matrix])  # (n_elem, 6, n_cases)
+
+        Y = np.empty(columns.shape)
+        dofs = self.dof_matrix.ravel()
+        for case in range(n_cases):
+            Y[:, case] = np.bincount(dofs, weights=f_global[:, :, case].ravel(), minlength=self.shape[0] + 1)[1:]
+        return Y.reshape(X.shape)
+
+    def diagonal(self):
+        return np.bincount(self.dof_matrix.ravel(), weights=self._element_diagonals().ravel(),
+                           minlength=self.shape[0] + 1)[1:]
+
+    def node_blocks(self, node_count):
+        # Sum of the 3 x 3 diagonal blocks of the element matrices at every node, shape (node_count, 3, 3)
+        kernels = self.kernels
+        blocks = np.zeros((node_count, 3, 3))
+        for start in range(0, kernels.count, CHUNK_SIZE):
+            elements = np.arange(start, min(start + CHUNK_SIZE, kernels.count))
+            k_global = kernels.global_stiffness_matrices(elements)
+            np.add.at(blocks, kernels.n1[elements], k_global[:, :3, :3])
+            np.add.at(blocks, kernels.n2[elements], k_global[:, 3:, 3:])
+        return blocks
+
+    def _element_diagonals(self):
+        diagonals = np.empty((self.kernels.count, 6))
+        for start in range(0, self.kernels.count, CHUNK_SIZE):
+            elements = np.arange(start, min(start + CHUNK_SIZE, self.kernels.count))
+            diagonals[elements] = np.diagonal(self.kernels.global_stiffness_matrices(elements), axis1=1, axis2=2)
+        return diagonals
+
+
+class PCGSolver:
+    """
+    Stands in for a Factorization: built once per K_global, then solve(F) runs PCG for
+    every column of F. groups holds the zero-based equations of each node, -1 where a
+    DOF has no equation; it is needed by block-jacobi only. node_blocks, when given,
+    returns the (node_count, 3, 3) node blocks without reading them from K. Convergence
+    is logged at log_level.
+    """
+
+    method = "pcg"
+
+    def __init__(self, K, preconditioner="ilu", tolerance=1e-8, max_iterations=None,
+                 groups=None, node_blocks=None, log_level=logging.INFO):
+        if preconditioner not in PRECONDITIONERS:
+            raise ValueError(f"Unknown preconditioner '{preconditioner}', expected one of {PRECONDITIONERS}")
+
+        self.K = K
+        self.size = K.shape[0]
+        self.preconditioner = preconditioner
+        self.tolerance = tolerance
+        self.log_level = log_level
+        self.max_iterations = max_iterations or max(self.size, 100)
+        self.iterations = np.zeros(0, dtype=int)  # per load case, of the last solve
+        self.residual_history = np.zeros((0, 0))  # (iterations + 1, n_cases) relative residual norms
+
+        if self.size == 0:
+            # Every DOF is restrained; solve returns the empty block without preconditioning
+            self.nnz = 0
+        elif preconditioner == "jacobi":
+            self._inverse = 1.0 / K.diagonal()
+            self.nnz = self.size
+        elif preconditioner == "block-jacobi":
+            self._groups = groups
+            blocks = node_blocks() if node_blocks is not None else self._blocks_from_matrix(K, groups)
+            # DOFs without an equation get a unit diagonal so every block can be inverted
+            missing = groups < 0
+            blocks[missing] = 0.0
+            blocks.transpose(0, 2, 1)[missing] = 0.0
+            blocks[:, [0, 1, 2], [0, 1, 2]] += missing
+            self._inverse = np.linalg.inv(blocks)
+            self.nnz = self._inverse.size
+        else:
+            # A symmetric fill-reducing ordering; the default COLAMD makes spilu very slow on large frames.
+            # Without pivoting the rows keep that order, and only L and the diagonal of U are kept.
+            ilu = spilu(sparse.csc_matrix(K), drop_tol=ILU_DROP_TOL, fill_factor=ILU_FILL_FACTOR,
+                        permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0, options={"SymmetricMode": True})
+            self._order = ilu.perm_c
+            self._lower = sparse.csr_matrix(ilu.L)
+            self._upper = sparse.csr_matrix(ilu.L.T)
+            self._diagonal = np.abs(ilu.U.diagonal())
+            self.nnz = 2 * self._lower.nnz + self.size
+
+    @staticmethod
+    def _blocks_from_matrix(K, groups):
+        rows = np.repeat(groups, 3, axis=1)
+        cols = np.tile(groups, (1, 3))
+        valid = (rows >= 0) & (cols >= 0)
+        blocks = np.zeros(rows.shape)
+        blocks[valid] = np.asarray(K[rows[valid], cols[valid]]).ravel()
+        return blocks.reshape(-1, 3, 3)
+
+    def precondition(self, R):
+        if self.preconditioner == "jacobi":
+            return R * self._inverse[:, None]
+        elif self.preconditioner == "ilu":
+            # Z = P' L^-T D^-1 L^-1 P R, symmetric positive definite for any drop pattern
+            Y = np.empty(R.shape)
+            Y[self._order] = R
+            Y = spsolve_triangular(self._lower, Y, lower=True, unit_diagonal=True) / self._diagonal[:, None]
+            Y = spsolve_triangular(self._upper, Y, lower=False, unit_diagonal=True)
+            return Y[self._order]
+
+        groups = self._groups
+        padded = np.vstack((R, np.zeros((1, R.shape[1]))))  # row -1 serves the DOFs without an equation
+        Z_nodes = np.matmul(self._inverse, padded[groups])
+        Z = np.empty(R.shape)
+        valid = groups >= 0
+        Z[groups[valid]] = Z_nodes[valid]
+        return Z
+
+    def solve(self, F):
+        F = np.asarray(F, dtype=float)
+        B = F if F.ndim == 2 else F.reshape(self.size, -1)
+        n_cases = B.shape[1]
+        if self.size == 0:
+            self.iterations = np.zeros(n_cases, dtype=int)
+            self.residual_history = np.zeros((1, n_cases))
+            return np.zeros(F.shape)
+
+        norms = np.linalg.norm(B, axis=0)
+        norms[norms == 0] = 1.0
+        X = np.zeros(B.shape)
+        R = B.copy()
+        Z = self.precondition(R)
+        P = Z.copy()
+        rz = np.einsum('ij,ij->j', R, Z)
+
+        residuals = np.linalg.norm(R, axis=0) / norms
+        history = [residuals.copy()]
+        iterations = np.zeros(n_cases, dtype=int)
+        active = np.flatnonzero(residuals > self.tolerance)
+
+        while active.size and iterations.max() < self.max_iterations:
+            Q = self.K @ P[:, active]
+            alpha = rz[active] / np.einsum('ij,ij->j', P[:, active], Q)
+            X[:, active] += alpha * P[:, active]
+            R[:, active] -= alpha * Q
+            iterations[active] += 1
+
+            residuals[active] = np.linalg.norm(R[:, active], axis=0) / norms[active]
+            history.append(residuals.copy())
+            active = active[residuals[active] > self.tolerance]
+            if not active.size:
+                break
+
+            Z = self.precondition(R[:, active])
+            rz_new = np.einsum('ij,ij->j', R[:, active], Z)
+            P[:, active] = Z + (rz_new / rz[active]) * P[:, active]
+            rz[active] = rz_new
+
+        self.iterations = iterations
+        self.residual_history = np.array(history)
+        if active.size:
+            raise ConvergenceError(int(iterations.max()), residuals)
+
+        logger.log(self.log_level, "PCG (%s) converged in %d iterations, relative residual %.3e",
+                   self.preconditioner, iterations.max(), residuals.max())
+        return X.reshape(F.shape)
@@ -0,0 +1,158 @@
+"""
+Load combinations and envelopes by linear superposition of solved load cases.
+
+    model.addLoadCase("D", dead_loads)
+    model.addLoadCase("L", live_loads)
+    model.addLoadCombination("1.4D", {"D": 1.4})
+    model.addLoadCombination("1.2D+1.6L", {"D": 1.2, "L": 1.6})
+    results = FrameSolver(model).run()
+
+    combined = combine(results, model.load_combinations)
+    forces = envelope(results, model.load_combinations)["element_end_forces"]
+    forces.maximum[:, 2], forces.governing("max")[:, 2]   # largest M1 of every element and its combination
+
+The analysis is linear, so every basic load case is solved once and a combination is
+the factored sum of the case results. All combinations are formed together as one
+matrix product of the (n_comb, n_cases) factor matrix with the cached case arrays,
+without solving again. Envelopes are reduced chunk by chunk over the combinations, so
+only a bounded block of combined results is held in memory at a time.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+
+QUANTITIES = ("nodal_displacements", "element_end_forces", "reactions")
+CHUNK_BYTES = 64 * 2**20  # combined values held at once while an envelope is reduced
+
+
+@dataclass(frozen=True)
+class CombinationResults:
+    """
+    Results of every load combination, laid out as in FrameResults with the leading
+    axis following combination_names.
+
+    factors:             (n_comb, n_cases) factor of every load case in every combination
+    nodal_displacements: (n_comb, node_count, 3) [ux, uy, rz] per node
+    element_end_forces:  (n_comb, n_elem, 6) local end forces [N1, V1, M1, N2, V2, M2]
+    reactions:           (n_comb, node_count, 3) support reactions
+    """
+
+    combination_names: tuple
+    factors: np.ndarray
+    nodal_displacements: np.ndarray
+    element_end_forces: np.ndarray
+    reactions: np.ndarray
+
+    def __post_init__(self):
+        object.__setattr__(self, "combination_names", tuple(self.combination_names))
+        for name in ("factors",) + QUANTITIES:
+            array = np.asarray(getattr(self, name))
+            array.setflags(write=False)
+            object.__setattr__(self, name, array)
+
+    def combination_index(self, name):
+        return self.combination_names.index(name)
+
+
+@dataclass(frozen=True)
+class Envelope:
+    """
+    Largest and smallest value of one result quantity over all combinations.
+    maximum and minimum have the shape of one combination, e.g. (n_elem, 6) for the end
+    forces; max_combination and min_combination hold the index in combination_names of
+    the governing combination of every value. Ties go to the earlier combination.
+    """
+
+    combination_names: tuple
+    maximum: np.ndarray
+    minimum: np.ndarray
+    max_combination: np.ndarray
+    min_combination: np.ndarray
+
+    def __post_init__(self):
+        object.__setattr__(self, "combination_names", tuple(self.combination_names))
+        for name in ("maximum", "minimum", "max_combination", "min_combination"):
+            getattr(self, name).setflags(write=False)
+
+    def governing(self, extreme="max"):
+        # Names of the governing combinations, shaped like maximum
+        if extreme not in ("max", "min"):
+            raise ValueError(f"Unknown extreme '{extreme}', expected 'max' or 'min'")
+        index = self.max_combination if extreme == "max" else self.min_combination
+        return np.array(self.combination_names, dtype=object)[index]
+
+
+def combination_factors(case_names, combinations):
+    """
+    Returns (names, factors) for combinations given as name -> {load case: factor}.
+    factors is (n_comb, n_cases) with columns following case_names.
+    Raises ValueError if a combination refers to a load case that was not solved.
+    """
+    case_names = list(case_names)
+    names = list(combinations)
+    factors = np.zeros((len(names), len(case_names)))
+    for i, name in enumerate(names):
+        for case, factor in combinations[name].items():
+            if case not in case_names:
+                raise ValueError(f"load combination '{name}' refers to load case '{case}', which was not solved")
+            factors[i, case_names.index(case)] += factor
+    return names, factors
+
+
+def combine(results, combinations):
+    # Every combination of a FrameResults at once, as CombinationResults
+    names, factors = combination_factors(results.load_case_names, combinations)
+    return CombinationResults(names, factors, **{quantity: _superpose(factors, getattr(results, quantity))
+                                                 for quantity in QUANTITIES})
+
+
+def envelope(results, combinations, quantities=QUANTITIES):
+    """
+    Max/min envelopes of a FrameResults over the combinations, as quantity -> Envelope.
+    The combined arrays are never formed in full; see CHUNK_BYTES.
+    """
+    names, factors = combination_factors(results.load_case_names, combinations)
+    if not names:
+        raise ValueError("there are no load combinations to envelope")
+    return {quantity: _envelope(names, factors, getattr(results, quantity)) for quantity in quantities}
+
+
+def _superpose(factors, cases):
+    # (n_comb, ...) factored sums of the (n_cases, ...) case arrays
+    combined = factors @ cases.reshape(cases.shape[0], -1)
+    return combined.reshape((factors.shape[0],) + cases.shape[1:])
+
+
+def _envelope(names, factors, cases):
+    # One row per result value, so the arg-reductions run along contiguous rows
+    values = np.ascontiguousarray(cases.reshape(cases.shape[0], -1).T)
+    size = values.shape[0]
+
+    maximum = np.full(size, -np.inf)
+    minimum = np.full(size, np.inf)
+    max_combination = np.zeros(size, dtype=np.int64)
+    min_combination = np.zeros(size, dtype=np.int64)
+
+    chunk = min(max(CHUNK_BYTES // max(8 * size, 1), 1), factors.shape[0])
+    buffer = np.empty((size, chunk))  # reused, so every chunk writes to memory that is already mapped
+    for start in range(0, factors.shape[0], chunk):
+        block = factors[start:start + chunk]
+        combined = buffer[:, :block.shape[0]]
+        np.matmul(values, block.T, out=combined)
+
+        k = combined.argmax(axis=1)
+        top = np.take_along_axis(combined, k[:, None], axis=1)[:, 0]
+        larger = top > maximum
+        maximum[larger] = top[larger]
+        max_combination[larger] = k[larger] + start
+
+        k = combined.argmin(axis=1)
+        bottom = np.take_along_axis(combined, k[:, None], axis=1)[:, 0]
+        smaller = bottom < minimum
+        minimum[smaller] = bottom[smaller]
+        min_combination[smaller] = k[smaller] + start
+
+    shape = cases.shape[1:]
+    return Envelope(names, maximum.reshape(shape), minimum.reshape(shape),
+                    max_combination.reshape(shape), min_combination.reshape(shape))
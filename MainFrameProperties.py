@@ -1,13 +1,44 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox, QLabel, QSlider
 from MainFramePropertiesWindow import Ui_Form_MainPropertiesWindow
 from FrameModelData import FrameModelData
-from FrameSolver import FrameSolver
+from AnalysisQueue import AnalysisQueue
+from DeformedShape import DeformedShape
+from InternalForces import STATIONS
+from ModelIO import save_model
+from ModelValidation import ModelValidationError, validate_model
+from SolverInstrumentation import PHASES
+from ValidationPanel import ValidationPanel
 
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
-from matplotlib.patches import Arc
+import numpy as np
 
+# matplotlib and ShowResults are imported on first use: the canvas is built on the first
+# Draw and the results window after the first analysis
+
+
+SUPPORT_MARKERS = {
+    (0, 0, 0): None,
+    (1, 0, 0): 'o',     # Roller support (fixed in X)
+    (0, 1, 0): 'o',     # Roller support (fixed in X)
+    (1, 1, 0): '^',     # Pinned
+    (1, 1, 1): 's',     # Fully fixed
+}
+
+# Marker for each (x, y, rotation) code read as a 3-bit number; other combinations get a diamond
+SUPPORT_MARKER_BY_CODE = np.array([SUPPORT_MARKERS.get(((code >> 2) & 1, (code >> 1) & 1, code & 1), 'd') or ''
+                                   for code in range(8)])
+
+LABEL_LIMIT = 300  # node and load labels are drawn for models up to this many nodes + loads
+DEFORMED_SIZE = 0.1  # at the default scale the largest displacement is drawn as this fraction of the model size
+DEFORMED_SLIDER = (0, 500, 100)  # slider minimum, maximum and default, in percent of the default scale
+
+
+def segments_xy(starts, ends):
+    # x and y of many separate segments as one polyline with NaN gaps, drawn as a single path
+    points = np.full((starts.shape[0], 3, 2), np.nan)
+    points[:, 0] = starts
+    points[:, 1] = ends
+    return points[:, :, 0].ravel(), points[:, :, 1].ravel()
 
 
 class MainFrameProperties(QWidget):
@@ -18,25 +49,125 @@ class MainFrameProperties(QWidget):
         self.model_data = model_data
 
         #Set the table properties for the model data
-        self.model_data.setNodeTable(self.ui.table_NodeProperties)
-        self.model_data.setElementTable(self.ui.table_ElementProperties)
-        self.model_data.setSupportTable(self.ui.table_SupportProperties)
-        self.model_data.setForceTable(self.ui.table_ForceProperties)
+        # The tables edit the model arrays in place, so they never need to be read back
+        self.table_models = [
+            self.model_data.setNodeTable(self.ui.table_NodeProperties),
+            self.model_data.setElementTable(self.ui.table_ElementProperties),
+            self.model_data.setSupportTable(self.ui.table_SupportProperties),
+            self.model_data.setForceTable(self.ui.table_ForceProperties),
+        ]
+
+        self.model_figure = None  # drawing canvas, created on the first Draw
+        self.deformed_shape = None  # deformed shape of the last finished analysis
+        self.model_background = None  # canvas without the deformed shape, for blitting
 
         self.ui.button_Draw.clicked.connect(self.handle_draw)
+        self.ui.button_SaveModel.clicked.connect(self.handle_save)
+
+        # One problem list shared by drawing and solving
+        self.validation_panel = ValidationPanel({
+            "nodes": self.ui.table_NodeProperties,
+            "elements": self.ui.table_ElementProperties,
+            "supports": self.ui.table_SupportProperties,
+            "forces": self.ui.table_ForceProperties,
+        }, self)
+
+        # Analyses run one at a time on a worker thread; the tables stay editable meanwhile
+        self.analysis_queue = AnalysisQueue(self)
+        self.analysis_queue.phaseStarted.connect(self.on_phase_started)
+        self.analysis_queue.phaseFinished.connect(self.on_phase_finished)
+        self.analysis_queue.analysisFinished.connect(self.on_analysis_finished)
+        self.analysis_queue.analysisFailed.connect(self.on_analysis_failed)
+        self.analysis_queue.analysisCancelled.connect(self.on_analysis_cancelled)
+        self.analysis_queue.queueChanged.connect(self.on_queue_changed)
+        self.results_windows = []
+        self.ui.progressBar_Solver.setRange(0, len(PHASES))
+
+        self.ui.button_RunSolver.clicked.connect(self.run_solver)
+        self.ui.button_CancelSolver.clicked.connect(lambda: self.analysis_queue.cancel())  # all queued and running
+
+    def run_solver(self):
+        report = validate_model(self.model_data)
+        if not report.ok:
+            self.validation_panel.show_report(report)
+            return
+        self.validation_panel.hide()
+
+        # The N, V, M diagrams are recovered on the worker thread, so results open with them ready
+        job_id = self.analysis_queue.submit(self.model_data, stations=STATIONS)
+        self.ui.label_SolverStatus.setText(f"Analysis {job_id} queued")
+
+    def on_phase_started(self, job_id, name):
+        self.ui.label_SolverStatus.setText(f"Analysis {job_id}: {name}...")
+        if name in PHASES:
+            self.ui.progressBar_Solver.setValue(PHASES.index(name))
+
+    def on_phase_finished(self, job_id, name, seconds):
+        if name in PHASES:
+            self.ui.progressBar_Solver.setValue(PHASES.index(name) + 1)
+
+    def on_analysis_finished(self, job_id, model, results):
+        total = sum(record.seconds for record in results.phases)
+        path = next((record.sizes["path"] for record in results.phases if record.name == "update"), "full")
+        self.ui.label_SolverStatus.setText(f"Analysis {job_id} finished in {total * 1000:.0f} ms ({path})")
+
+        self.show_deformed_shape(model, results)
+
+        from ShowResults import ShowResults
+
+        # The window shows the model as it was when the analysis was queued
+        window = ShowResults(model, results)
+        window.setWindowTitle(f"Results - Analysis {job_id}")
+        self.results_windows.append(window)
+        window.show()
+
+    def on_analysis_failed(self, job_id, error):
+        self.ui.label_SolverStatus.setText(f"Analysis {job_id} failed")
+        if isinstance(error, ModelValidationError):
+            self.validation_panel.show_report(error.report)
+        else:
+            QMessageBox.critical(self, "Error", f"Analysis {job_id} failed:\n{error}")
+
+    def on_analysis_cancelled(self, job_id):
+        self.ui.label_SolverStatus.setText(f"Analysis {job_id} cancelled")
+        self.ui.progressBar_Solver.setValue(0)
+
+    def on_queue_changed(self, count):
+        self.ui.button_CancelSolver.setEnabled(count > 0)
+        if count > 1:
+            self.ui.button_CancelSolver.setText(f"Cancel ({count})")
+        else:
+            self.ui.button_CancelSolver.setText("Cancel")
+
+    def closeEvent(self, event):
+        self.analysis_queue.stop()
+        super().closeEvent(event)
+
+    def handle_save(self):
+        filters = {
+            "NumPy model archive (*.npz)": ".npz",
+            "Memory-mapped model directory (*.frame)": ".frame",
+            "JSON model (*.json)": ".json",
+        }
+        path, selected_filter = QFileDialog.getSaveFileName(self, "Save the Model", "", ";;".join(filters))
+        if not path:
+            return
+
+        extension = filters.get(selected_filter, ".npz")
+        if not path.lower().endswith(extension):
+            path += extension
 
-        self.solver = FrameSolver(model_data)
-        
-        self.ui.button_RunSolver.clicked.connect(self.solver.solve)
+        try:
+            save_model(self.model_data, path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"The model could not be saved:\n{e}")
 
-        
-    
     def handle_draw(self):
-        self.model_data.setNodeMatrixFromNodeTable(self.ui.table_NodeProperties, self)
-        self.model_data.setElementConnectivityFromTable(self.ui.table_ElementProperties, self)
-        self.model_data.setElementPropertiesFromTable(self.ui.table_ElementProperties, self)
-        self.model_data.setSupportConditionsFromTable(self.ui.table_SupportProperties, self)
-        self.model_data.setForceConditionsFromTable(self.ui.table_ForceProperties, self)
+        report = validate_model(self.model_data)
+        if not report.ok:
+            self.validation_panel.show_report(report)
+            return
+        self.validation_panel.hide()
 
         print("Node Coordinates:")
         print(self.model_data.node_coordinates)
@@ -55,92 +186,160 @@ class MainFrameProperties(QWidget):
 
         self.draw_model()
 
-    def draw_model(self):
-        model_data = self.model_data
-        XY = model_data.node_coordinates
-        C = model_data.element_connectivity
-        S = model_data.support_conditions
-        F = model_data.force_conditions
+    def create_model_canvas(self):
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
 
-        fig = Figure()
-        ax = fig.add_subplot(111)
+        # Built once; every later Draw updates these artists in place
+        self.model_figure = Figure()
+        ax = self.model_axes = self.model_figure.add_subplot(111)
         ax.set_aspect('equal')
         ax.axis('off')
 
-        # === Draw Elements ===
-        for i in range(C.shape[0]):
-            n1, n2 = int(C[i, 0]) - 1, int(C[i, 1]) - 1
-            x1, y1 = XY[n1]
-            x2, y2 = XY[n2]
-            ax.plot([x1, x2], [y1, y2], color='black', linewidth=2)
+        # All members in one line, broken between elements by NaN points
+        self.member_lines, = ax.plot([], [], color='black', linewidth=2)
+        self.node_points = ax.scatter([], [], s=12, c='black', zorder=3)
 
-        # === Draw Supports ===
-        support_markers = {
-            (0, 0, 0): None,
-            (1, 0, 0): 'o',     # Roller support (fixed in X)
-            (0, 1, 0): 'o',     # Roller support (fixed in X)
-            (1, 1, 0): '^',     # Pinned
-            (1, 1, 1): 's',     # Fully fixed
-        }
+        # One scatter per support marker type
+        self.support_points = {marker: ax.scatter([], [], s=150, c='red', marker=marker, zorder=4)
+                               for marker in set(SUPPORT_MARKER_BY_CODE) if marker}
 
-        for i in range(S.shape[0]):
-            nid = int(S[i, 0]) - 1
-            x, y = XY[nid]
-            code = tuple(S[i, 1:4].astype(int))
-            marker = support_markers.get(code, 'd')
-            if marker:
-                ax.scatter(x, y, s=150, c='red', marker=marker)
+        # Moments as one marker layer per direction
+        self.moment_points = [ax.scatter([], [], s=300, c='green', marker=r'$\circlearrowleft$', zorder=5),
+                              ax.scatter([], [], s=300, c='green', marker=r'$\circlearrowright$', zorder=5)]
+        # Force arrows: one line for every shaft, one marker layer per head direction
+        self.force_shafts, = ax.plot([], [], color='blue', linewidth=2, zorder=5)
+        self.force_heads = {marker: ax.scatter([], [], s=60, c='blue', marker=marker, zorder=5)
+                            for marker in ('>', '<', '^', 'v')}
+        self.model_labels = []
+
+        # Redrawn on its own by blitting whenever the scale changes, so it stays out of full draws
+        self.deformed_line, = ax.plot([], [], color='darkorange', linewidth=1.5, zorder=6, animated=True)
 
-        # === Draw Forces ===
-        scale = 0.1
-        for i in range(F.shape[0]):
-            nid = int(F[i, 0]) - 1
-            x, y = XY[nid]
-            fx = float(F[i, 1])
-            fy = float(F[i, 2])
-            mz = float(F[i, 3]) if F.shape[1] > 3 else 0
-
-            if fx != 0:
-                ax.arrow(x, y, fx * scale, 0,
-                        head_width=0.07, head_length=0.07, linewidth=2,
-                        length_includes_head=True, color='blue')
-                ax.text(x + fx * scale * 1.1, y, f"Fx={fx:.1f}", fontsize=9, fontweight='bold', color='blue')
-
-            if fy != 0:
-                ax.arrow(x, y, 0, fy * scale,
-                        head_width=0.07, head_length=0.07, linewidth=2,
-                        length_includes_head=True, color='blue')
-                ax.text(x, y + fy * scale * 1.1, f"Fy={fy:.1f}", fontsize=9, fontweight='bold', color='blue')
-
-            if mz != 0:
-                angle = 270 
-                arc = Arc((x, y), 0.4, 0.4, theta1=0, theta2=angle,
-                        color='green', linewidth=3)
-                ax.add_patch(arc)
-                # Add an arrowhead to indicate direction
-                direction = 1 if mz > 0 else -1
-                dx = 0.1 * direction
-                dy = -0.1
-                ax.text(x + 0.2 * direction, y + 0.2, f"M={mz:.1f}", fontsize=8, color='green')
-
-        # === Add node labels ===
-        for i, (x, y) in enumerate(XY):
-            ax.text(x + 0.05, y + 0.05, f"N{i+1}", color='black', fontsize=8)
-
-        # === Display on Qt Widget ===
         area = self.ui.widget_DrawingArea  # updated widget name
         layout = area.layout()
         if layout is None:
             layout = QVBoxLayout(area)
             area.setLayout(layout)
-        else:
-            while layout.count():
-                item = layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
 
-        canvas = FigureCanvas(fig)
-        toolbar = NavigationToolbar(canvas, self)
+        self.model_canvas = FigureCanvas(self.model_figure)
+        layout.addWidget(NavigationToolbar(self.model_canvas, self))
+        layout.addWidget(self.model_canvas)
+
+        # Deformation scale, shown once an analysis has finished
+        self.deformed_controls = QWidget(area)
+        controls = QHBoxLayout(self.deformed_controls)
+        controls.setContentsMargins(0, 0, 0, 0)
+        self.deformed_slider = QSlider(Qt.Horizontal, self.deformed_controls)
+        self.deformed_slider.setRange(*DEFORMED_SLIDER[:2])
+        self.deformed_slider.setValue(DEFORMED_SLIDER[2])
+        self.deformed_label = QLabel(self.deformed_controls)
+        controls.addWidget(QLabel("Deformed shape scale", self.deformed_controls))
+        controls.addWidget(self.deformed_slider)
+        controls.addWidget(self.deformed_label)
+        self.deformed_controls.hide()
+        layout.addWidget(self.deformed_controls)
+
+        self.deformed_slider.valueChanged.connect(self.update_deformed_shape)
+        self.model_canvas.mpl_connect('draw_event', self.on_model_drawn)
+
+    def on_model_drawn(self, event):
+        # Every full draw (Draw, zoom, pan, resize) renews the background, then adds the deformed shape
+        self.model_background = self.model_canvas.copy_from_bbox(self.model_figure.bbox)
+        self.model_axes.draw_artist(self.deformed_line)
+
+    def show_deformed_shape(self, model, results):
+        # Overlays the first load case of a finished analysis on the drawing, at the default scale
+        if self.model_figure is None:
+            self.draw_model()
+        coords = model.node_coordinates
+        self.deformed_shape = DeformedShape(coords, model.element_connectivity, results.nodal_displacements[0])
+
+        size = max(np.ptp(coords[:, 0]), np.ptp(coords[:, 1])) if coords.shape[0] else 0.0
+        self.deformed_default_scale = self.deformed_shape.auto_scale(DEFORMED_SIZE * size)
+        # The controls take space from the canvas, so the old background is dropped for a full draw
+        self.deformed_controls.show()
+        self.model_background = None
+        self.update_deformed_shape()
+
+    def update_deformed_shape(self):
+        # Only the deformed line is replaced and blitted over the saved background
+        if self.deformed_shape is None:
+            return
+        scale = self.deformed_slider.value() / DEFORMED_SLIDER[2] * self.deformed_default_scale
+        self.deformed_line.set_data(*self.deformed_shape.points(scale))
+        self.deformed_label.setText(f"x {scale:.4g}")
+
+        if self.model_background is None:
+            self.model_canvas.draw_idle()
+            return
+        self.model_canvas.restore_region(self.model_background)
+        self.model_axes.draw_artist(self.deformed_line)
+        self.model_canvas.blit(self.model_figure.bbox)
+
+    def draw_model(self):
+        if self.model_figure is None:
+            self.create_model_canvas()
+
+        model_data = self.model_data
+        ax = self.model_axes
+        XY = np.asarray(model_data.node_coordinates, dtype=float).reshape(-1, 2)
+        C = np.asarray(model_data.element_connectivity, dtype=int).reshape(-1, 2)
+        S = np.asarray(model_data.support_conditions, dtype=int).reshape(-1, 4)
+        F = np.asarray(model_data.force_conditions, dtype=float).reshape(-1, 4)
+
+        # === Draw Elements and Nodes ===
+        self.member_lines.set_data(*segments_xy(XY[C[:, 0] - 1], XY[C[:, 1] - 1]))
+        self.node_points.set_offsets(XY)
+
+        # === Draw Supports ===
+        support_xy = XY[S[:, 0] - 1]
+        codes = (S[:, 1:4] != 0).astype(int) @ [4, 2, 1]
+        markers = SUPPORT_MARKER_BY_CODE[codes]
+        for marker, points in self.support_points.items():
+            points.set_offsets(support_xy[markers == marker].reshape(-1, 2))
+
+        # === Draw Forces ===
+        scale = 0.1
+        force_xy = XY[F[:, 0].astype(int) - 1]
+        fx, fy, mz = F[:, 1], F[:, 2], F[:, 3]
+        # Fx and Fy arrows of all nodes together; loads are axis-aligned, so four head markers cover them
+        tails = np.vstack((force_xy[fx != 0], force_xy[fy != 0]))
+        tips = tails + scale * np.vstack((np.column_stack((fx[fx != 0], np.zeros(np.count_nonzero(fx)))),
+                                          np.column_stack((np.zeros(np.count_nonzero(fy)), fy[fy != 0]))))
+        self.force_shafts.set_data(*segments_xy(tails, tips))
+        direction = np.concatenate((np.where(fx[fx != 0] > 0, '>', '<'), np.where(fy[fy != 0] > 0, '^', 'v')))
+        for marker, heads in self.force_heads.items():
+            heads.set_offsets(tips[direction == marker].reshape(-1, 2))
+        self.moment_points[0].set_offsets(force_xy[mz > 0])
+        self.moment_points[1].set_offsets(force_xy[mz < 0])
+
+        # === Add node and load labels ===
+        # Text is drawn one artist at a time, so it is skipped for large models
+        for label in self.model_labels:
+            label.remove()
+        self.model_labels = []
+        if XY.shape[0] + F.shape[0] <= LABEL_LIMIT:
+            for i, (x, y) in enumerate(XY):
+                self.model_labels.append(ax.text(x + 0.05, y + 0.05, f"N{i+1}", color='black', fontsize=8))
+            for (x, y), fx_i, fy_i, mz_i in zip(force_xy, fx, fy, mz):
+                if fx_i != 0:
+                    self.model_labels.append(ax.text(x + fx_i * scale * 1.1, y, f"Fx={fx_i:.1f}",
+                                                     fontsize=9, fontweight='bold', color='blue'))
+                if fy_i != 0:
+                    self.model_labels.append(ax.text(x, y + fy_i * scale * 1.1, f"Fy={fy_i:.1f}",
+                                                     fontsize=9, fontweight='bold', color='blue'))
+                if mz_i != 0:
+                    direction = 1 if mz_i > 0 else -1
+                    self.model_labels.append(ax.text(x + 0.2 * direction, y + 0.2, f"M={mz_i:.1f}",
+                                                     fontsize=8, color='green'))
+
+        # Collections do not update the data limits, so the view is fitted to the nodes
+        if XY.shape[0] > 0:
+            (x_min, y_min), (x_max, y_max) = XY.min(axis=0), XY.max(axis=0)
+            margin = 0.1 * max(x_max - x_min, y_max - y_min, 1.0)
+            ax.set_xlim(x_min - margin, x_max + margin)
+            ax.set_ylim(y_min - margin, y_max + margin)
 
-        layout.addWidget(toolbar)
-        layout.addWidget(canvas)
\ No newline at end of file
+        self.model_canvas.draw_idle()
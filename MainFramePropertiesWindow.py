@@ -39,16 +39,8 @@ class Ui_Form_MainPropertiesWindow(object):
         self.label_Node.setFont(font)
         self.label_Node.setObjectName("label_Node")
         self.verticalLayout.addWidget(self.label_Node)
-        self.table_NodeProperties = QtWidgets.QTableWidget(Form_MainPropertiesWindow)
-        self.table_NodeProperties.setRowCount(4)
-        self.table_NodeProperties.setColumnCount(3)
+        self.table_NodeProperties = QtWidgets.QTableView(Form_MainPropertiesWindow)
         self.table_NodeProperties.setObjectName("table_NodeProperties")
-        item = QtWidgets.QTableWidgetItem()
-        self.table_NodeProperties.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_NodeProperties.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_NodeProperties.setHorizontalHeaderItem(2, item)
         self.verticalLayout.addWidget(self.table_NodeProperties)
         self.gridLayout.addLayout(self.verticalLayout, 0, 0, 1, 1)
         self.verticalLayout_2 = QtWidgets.QVBoxLayout()
@@ -61,22 +53,8 @@ class Ui_Form_MainPropertiesWindow(object):
         self.label_Element.setFont(font)
         self.label_Element.setObjectName("label_Element")
         self.verticalLayout_2.addWidget(self.label_Element)
-        self.table_ElementProperties = QtWidgets.QTableWidget(Form_MainPropertiesWindow)
-        self.table_ElementProperties.setRowCount(4)
-        self.table_ElementProperties.setColumnCount(6)
+        self.table_ElementProperties = QtWidgets.QTableView(Form_MainPropertiesWindow)
         self.table_ElementProperties.setObjectName("table_ElementProperties")
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ElementProperties.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ElementProperties.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ElementProperties.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ElementProperties.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ElementProperties.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ElementProperties.setHorizontalHeaderItem(5, item)
         self.verticalLayout_2.addWidget(self.table_ElementProperties)
         self.gridLayout.addLayout(self.verticalLayout_2, 0, 1, 1, 1)
         self.verticalLayout_3 = QtWidgets.QVBoxLayout()
@@ -89,22 +67,12 @@ class Ui_Form_MainPropertiesWindow(object):
         self.label_Support_2.setFont(font)
         self.label_Support_2.setObjectName("label_Support_2")
         self.verticalLayout_3.addWidget(self.label_Support_2)
-        self.table_SupportProperties = QtWidgets.QTableWidget(Form_MainPropertiesWindow)
+        self.table_SupportProperties = QtWidgets.QTableView(Form_MainPropertiesWindow)
         self.table_SupportProperties.setInputMethodHints(QtCore.Qt.ImhNone)
         self.table_SupportProperties.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustIgnored)
         self.table_SupportProperties.setTextElideMode(QtCore.Qt.ElideLeft)
         self.table_SupportProperties.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerItem)
-        self.table_SupportProperties.setRowCount(4)
-        self.table_SupportProperties.setColumnCount(4)
         self.table_SupportProperties.setObjectName("table_SupportProperties")
-        item = QtWidgets.QTableWidgetItem()
-        self.table_SupportProperties.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_SupportProperties.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_SupportProperties.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_SupportProperties.setHorizontalHeaderItem(3, item)
         self.verticalLayout_3.addWidget(self.table_SupportProperties)
         self.gridLayout.addLayout(self.verticalLayout_3, 1, 0, 1, 1)
         self.verticalLayout_4 = QtWidgets.QVBoxLayout()
@@ -117,24 +85,17 @@ class Ui_Form_MainPropertiesWindow(object):
         self.label_Force.setFont(font)
         self.label_Force.setObjectName("label_Force")
         self.verticalLayout_4.addWidget(self.label_Force)
-        self.table_ForceProperties = QtWidgets.QTableWidget(Form_MainPropertiesWindow)
-        self.table_ForceProperties.setRowCount(4)
-        self.table_ForceProperties.setColumnCount(4)
+        self.table_ForceProperties = QtWidgets.QTableView(Form_MainPropertiesWindow)
         self.table_ForceProperties.setObjectName("table_ForceProperties")
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ForceProperties.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ForceProperties.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ForceProperties.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.table_ForceProperties.setHorizontalHeaderItem(3, item)
         self.verticalLayout_4.addWidget(self.table_ForceProperties)
         self.gridLayout.addLayout(self.verticalLayout_4, 1, 1, 1, 1)
         self.verticalLayout_5.addLayout(self.gridLayout)
         self.button_Draw = QtWidgets.QPushButton(Form_MainPropertiesWindow)
         self.button_Draw.setObjectName("button_Draw")
         self.verticalLayout_5.addWidget(self.button_Draw)
+        self.button_SaveModel = QtWidgets.QPushButton(Form_MainPropertiesWindow)
+        self.button_SaveModel.setObjectName("button_SaveModel")
+        self.verticalLayout_5.addWidget(self.button_SaveModel)
         self.verticalLayout_7.addLayout(self.verticalLayout_5)
         self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_2.setObjectName("horizontalLayout_2")
@@ -156,6 +117,20 @@ class Ui_Form_MainPropertiesWindow(object):
         self.button_RunSolver.setObjectName("button_RunSolver")
         self.horizontalLayout_2.addWidget(self.button_RunSolver)
         self.verticalLayout_7.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.label_SolverStatus = QtWidgets.QLabel(Form_MainPropertiesWindow)
+        self.label_SolverStatus.setObjectName("label_SolverStatus")
+        self.horizontalLayout_7.addWidget(self.label_SolverStatus)
+        self.progressBar_Solver = QtWidgets.QProgressBar(Form_MainPropertiesWindow)
+        self.progressBar_Solver.setProperty("value", 0)
+        self.progressBar_Solver.setObjectName("progressBar_Solver")
+        self.horizontalLayout_7.addWidget(self.progressBar_Solver)
+        self.button_CancelSolver = QtWidgets.QPushButton(Form_MainPropertiesWindow)
+        self.button_CancelSolver.setEnabled(False)
+        self.button_CancelSolver.setObjectName("button_CancelSolver")
+        self.horizontalLayout_7.addWidget(self.button_CancelSolver)
+        self.verticalLayout_7.addLayout(self.horizontalLayout_7)
         self.horizontalLayout_3.addLayout(self.verticalLayout_7)
         self.horizontalLayout_4.addLayout(self.horizontalLayout_3)
         self.horizontalLayout_5.addLayout(self.horizontalLayout_4)
@@ -177,48 +152,17 @@ class Ui_Form_MainPropertiesWindow(object):
         _translate = QtCore.QCoreApplication.translate
         Form_MainPropertiesWindow.setWindowTitle(_translate("Form_MainPropertiesWindow", "Main Frame Properties"))
         self.label_Node.setText(_translate("Form_MainPropertiesWindow", "Node ID and Coordinates"))
-        item = self.table_NodeProperties.horizontalHeaderItem(0)
-        item.setText(_translate("Form_MainPropertiesWindow", "Node ID"))
-        item = self.table_NodeProperties.horizontalHeaderItem(1)
-        item.setText(_translate("Form_MainPropertiesWindow", "X (m)"))
-        item = self.table_NodeProperties.horizontalHeaderItem(2)
-        item.setText(_translate("Form_MainPropertiesWindow", "Y (m)"))
         self.label_Element.setText(_translate("Form_MainPropertiesWindow", "Element Properties"))
-        item = self.table_ElementProperties.horizontalHeaderItem(0)
-        item.setText(_translate("Form_MainPropertiesWindow", "Element ID"))
-        item = self.table_ElementProperties.horizontalHeaderItem(1)
-        item.setText(_translate("Form_MainPropertiesWindow", "Start Node ID"))
-        item = self.table_ElementProperties.horizontalHeaderItem(2)
-        item.setText(_translate("Form_MainPropertiesWindow", "End Node ID"))
-        item = self.table_ElementProperties.horizontalHeaderItem(3)
-        item.setText(_translate("Form_MainPropertiesWindow", "Cross Sectional Area (m_{^2})"))
-        item = self.table_ElementProperties.horizontalHeaderItem(4)
-        item.setText(_translate("Form_MainPropertiesWindow", "Moment of Inertia (m_{^4})"))
-        item = self.table_ElementProperties.horizontalHeaderItem(5)
-        item.setText(_translate("Form_MainPropertiesWindow", "Elastic Modulus (MPa)"))
         self.label_Support_2.setText(_translate("Form_MainPropertiesWindow", "Support Conditions"))
-        item = self.table_SupportProperties.horizontalHeaderItem(0)
-        item.setText(_translate("Form_MainPropertiesWindow", "Node ID"))
-        item = self.table_SupportProperties.horizontalHeaderItem(1)
-        item.setText(_translate("Form_MainPropertiesWindow", "Fixed in X Direction"))
-        item = self.table_SupportProperties.horizontalHeaderItem(2)
-        item.setText(_translate("Form_MainPropertiesWindow", "Fixed in Y Direction"))
-        item = self.table_SupportProperties.horizontalHeaderItem(3)
-        item.setText(_translate("Form_MainPropertiesWindow", "Fixed in Rotation"))
         self.label_Force.setText(_translate("Form_MainPropertiesWindow", "Nodal Forces"))
-        item = self.table_ForceProperties.horizontalHeaderItem(0)
-        item.setText(_translate("Form_MainPropertiesWindow", "Node ID"))
-        item = self.table_ForceProperties.horizontalHeaderItem(1)
-        item.setText(_translate("Form_MainPropertiesWindow", "X (kN)"))
-        item = self.table_ForceProperties.horizontalHeaderItem(2)
-        item.setText(_translate("Form_MainPropertiesWindow", "Y (kN)"))
-        item = self.table_ForceProperties.horizontalHeaderItem(3)
-        item.setText(_translate("Form_MainPropertiesWindow", "M (kNm)"))
         self.button_Draw.setText(_translate("Form_MainPropertiesWindow", "Submit and Draw the Model"))
+        self.button_SaveModel.setText(_translate("Form_MainPropertiesWindow", "Save the Model"))
         self.groupBox.setTitle(_translate("Form_MainPropertiesWindow", "Choose the Beam Theory"))
         self.radiobutton_Euler.setText(_translate("Form_MainPropertiesWindow", "Euler-Bernoulli Beam Theory"))
         self.radioButton_Timoschenko.setText(_translate("Form_MainPropertiesWindow", "Timoschenko Beam Theory "))
         self.button_RunSolver.setText(_translate("Form_MainPropertiesWindow", "Run the Solver"))
+        self.label_SolverStatus.setText(_translate("Form_MainPropertiesWindow", "No analysis running"))
+        self.button_CancelSolver.setText(_translate("Form_MainPropertiesWindow", "Cancel"))
 
 
 if __name__ == "__main__":
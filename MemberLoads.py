@@ -0,0 +1,111 @@
+"""
+Loads on the span of a member, so a loaded beam can stay a single element.
+
+Rows of model.member_loads[case] are [element_id, kind, direction, w1, w2, a, b]:
+
+    kind       DISTRIBUTED: varies linearly from w1 at a to w2 at b, per unit length
+               POINT:       force w1 at a; w2 and b are not used
+    direction  LOCAL_X (along the member), LOCAL_Y, GLOBAL_X or GLOBAL_Y
+    a, b       positions along the member as fractions of its length, 0 at the start node
+
+A uniform load is DISTRIBUTED with w1 == w2, a = 0 and b = 1. Loads in global axes are
+per unit length of the member, not of its projection.
+
+The solver applies member loads as equivalent nodal loads and adds the fixed-end forces
+back to the recovered member end forces. For prismatic Euler-Bernoulli members the
+fixed-end forces are minus the consistent nodal loads, the integral of the load times
+the cubic Hermite (transverse) and linear (axial) shape functions. The integrand is at
+most a quartic, so three Gauss points per distributed load give them exactly; all
+loads of a case are evaluated together.
+"""
+import numpy as np
+
+
+DISTRIBUTED, POINT = 0, 1
+LOCAL_X, LOCAL_Y, GLOBAL_X, GLOBAL_Y = 0, 1, 2, 3
+KINDS = {"distributed": DISTRIBUTED, "point": POINT}
+DIRECTIONS = {"local x": LOCAL_X, "local y": LOCAL_Y, "global X": GLOBAL_X, "global Y": GLOBAL_Y}
+COLUMNS = ("element", "kind", "direction", "w1", "w2", "a", "b")
+
+GAUSS_POINTS = np.array([-np.sqrt(0.6), 0.0, np.sqrt(0.6)])
+GAUSS_WEIGHTS = np.array([5.0, 8.0, 5.0]) / 9.0
+
+
+def member_load_rows(elements, kind, direction, w1, w2=None, a=0.0, b=1.0):
+    """
+    Builds member load rows for many elements at once. kind and direction may be given
+    by name ("distributed", "local y", ...) or code; the other values broadcast against
+    elements. w2 defaults to w1.
+    """
+    elements = np.atleast_1d(np.asarray(elements)).ravel()
+    kind = KINDS[kind] if isinstance(kind, str) else kind
+    direction = DIRECTIONS[direction] if isinstance(direction, str) else direction
+    w2 = w1 if w2 is None else w2
+    columns = np.broadcast_arrays(elements, kind, direction, w1, w2, a, b)
+    return np.column_stack(columns).astype(float)
+
+
+def shape_functions(xi, L):
+    """
+    Axial and transverse shape functions at fractional positions xi of members of length L.
+    Returns (n..., 6) weights of [u1, v1, theta1, u2, v2, theta2]; entries 0 and 3 apply
+    to axial, the others to transverse values.
+    """
+    xi2, xi3 = xi * xi, xi * xi * xi
+    return np.stack((1 - xi,
+                     1 - 3 * xi2 + 2 * xi3,
+                     L * (xi - 2 * xi2 + xi3),
+                     xi,
+                     3 * xi2 - 2 * xi3,
+                     L * (xi3 - xi2)), axis=-1)
+
+
+def local_components(rows, c, s):
+    # Unit-load components along local x and y of every row, from the direction codes
+    direction = rows[:, 2]
+    e = rows[:, 0].astype(np.int64) - 1
+    cos, sin = c[e], s[e]
+    along = np.select([direction == LOCAL_X, direction == GLOBAL_X, direction == GLOBAL_Y], [1.0, cos, sin], 0.0)
+    across = np.select([direction == LOCAL_Y, direction == GLOBAL_X, direction == GLOBAL_Y], [1.0, -sin, cos], 0.0)
+    return along, across
+
+
+def load_points(rows, L):
+    """
+    Quadrature of every row: fractional positions xi and the forces concentrated there,
+    both (n_rows, 3). A point load uses the first slot only.
+    """
+    e = rows[:, 0].astype(np.int64) - 1
+    kind, w1, w2, a, b = rows[:, 1], rows[:, 3], rows[:, 4], rows[:, 5], rows[:, 6]
+    point = kind == POINT
+
+    half = np.where(point, 0.0, (b - a) / 2)
+    xi = (a + half)[:, None] + half[:, None] * GAUSS_POINTS
+    intensity = w1[:, None] + (w2 - w1)[:, None] * (GAUSS_POINTS + 1) / 2
+    forces = intensity * GAUSS_WEIGHTS * (half * L[e])[:, None]
+    forces[point] = w1[point, None] * [1.0, 0.0, 0.0]
+    return xi, forces
+
+
+def fixed_end_forces(rows, L, c, s):
+    """
+    Local fixed-end forces [N1, V1, M1, N2, V2, M2] of every element, shape (n_elem, 6),
+    for the member load rows of one load case. L, c, s are the element lengths and
+    direction cosines of ElementKernels.
+    """
+    rows = np.asarray(rows, dtype=float).reshape(-1, 7)
+    fixed = np.zeros((L.shape[0], 6))
+    if rows.shape[0] == 0:
+        return fixed
+
+    e = rows[:, 0].astype(np.int64) - 1
+    xi, forces = load_points(rows, L)
+    along, across = local_components(rows, c, s)
+
+    N = shape_functions(xi, L[e][:, None])  # (n_rows, 3, 6)
+    components = np.where([True, False, False, True, False, False], along[:, None], across[:, None])
+    f = -np.einsum('rp,rpi->ri', forces, N) * components
+
+    for i in range(6):
+        fixed[:, i] = np.bincount(e, weights=f[:, i], minlength=L.shape[0])
+    return fixed
@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class ModelChanges:
+    """
+    What changed in a model since a ModelSnapshot was taken.
+    Index arrays are zero-based rows of the model arrays.
+    """
+
+    resized: bool = False  # node, element or support count changed
+    nodes: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    connectivity: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    properties: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=int))
+    supports: bool = False
+    loads: bool = False
+    substructures: bool = False
+
+    @property
+    def structure(self):
+        # Changes that alter the equation numbering, the element geometry or the condensation
+        return (self.resized or self.supports or self.substructures
+                or self.nodes.size > 0 or self.connectivity.size > 0)
+
+    @property
+    def any(self):
+        return self.structure or self.properties.size > 0 or self.loads
+
+    def describe(self):
+        if self.resized:
+            return "model size changed"
+        parts = [f"{array.size} {name}" for name, array in
+                 (("nodes", self.nodes), ("element connections", self.connectivity),
+                  ("element properties", self.properties)) if array.size]
+        parts += [name for name, changed in (("supports", self.supports), ("loads", self.loads),
+                                             ("substructures", self.substructures)) if changed]
+        return ", ".join(parts) if parts else "no changes"
+
+
+class ModelSnapshot:
+    """
+    Copy of the model arrays at the time of a solve, compared against the live model
+    with whole-array operations to find what was edited since.
+    """
+
+    def __init__(self, model):
+        self.node_coordinates = np.array(model.node_coordinates, dtype=float).reshape(-1, 2)
+        self.element_connectivity = np.array(model.element_connectivity, dtype=int).reshape(-1, 2)
+        self.element_properties = np.array(model.element_properties, dtype=float).reshape(-1, 3)
+        self.support_conditions = np.array(model.support_conditions, dtype=int).reshape(-1, 4)
+        self.load_cases = {name: np.array(forces, dtype=float).reshape(-1, 4)
+                           for name, forces in model.getLoadCases().items()}
+        self.member_loads = {name: np.array(rows, dtype=float) for name, rows in model.member_loads.items()}
+        self.substructures = {name: np.array(elements) for name, elements in model.substructures.items()}
+
+    def changes(self, model):
+        coords = np.asarray(model.node_coordinates, dtype=float).reshape(-1, 2)
+        connectivity = np.asarray(model.element_connectivity, dtype=int).reshape(-1, 2)
+        properties = np.asarray(model.element_properties, dtype=float).reshape(-1, 3)
+        supports = np.asarray(model.support_conditions, dtype=int).reshape(-1, 4)
+
+        if (coords.shape != self.node_coordinates.shape or connectivity.shape != self.element_connectivity.shape
+                or supports.shape != self.support_conditions.shape):
+            return ModelChanges(resized=True, loads=True)
+
+        load_cases = {name: np.asarray(forces, dtype=float).reshape(-1, 4)
+                      for name, forces in model.getLoadCases().items()}
+        loads_changed = list(load_cases) != list(self.load_cases) or not all(
+            np.array_equal(forces, self.load_cases[name]) for name, forces in load_cases.items())
+        loads_changed = loads_changed or list(model.member_loads) != list(self.member_loads) or not all(
+            np.array_equal(rows, self.member_loads[name]) for name, rows in model.member_loads.items())
+
+        return ModelChanges(
+            nodes=np.flatnonzero((coords != self.node_coordinates).any(axis=1)),
+            connectivity=np.flatnonzero((connectivity != self.element_connectivity).any(axis=1)),
+            properties=np.flatnonzero((properties != self.element_properties).any(axis=1)),
+            supports=not np.array_equal(supports, self.support_conditions),
+            loads=loads_changed,
+            substructures=list(model.substructures) != list(self.substructures) or not all(
+                np.array_equal(elements, self.substructures[name]) for name, elements in model.substructures.items()),
+        )
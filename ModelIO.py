@@ -0,0 +1,219 @@
+import json
+import os
+
+import numpy as np
+
+from FrameModelData import FrameModelData
+from LoadCombinations import envelope
+
+
+MODEL_ARRAYS = ("node_coordinates", "element_connectivity", "element_properties",
+                "support_conditions", "force_conditions")
+
+# Supported model files: JSON text, a single .npz archive, or a .frame directory of .npy files
+MODEL_PATTERNS = ("*.json", "*.npz", "*.frame")
+
+FORMAT_VERSION = 1
+MANIFEST = "model.json"
+
+
+def save_model(model, path):
+    """
+    Saves a FrameModelData. The format follows the path:
+      *.frame  directory with one native .npy file per array and a small manifest
+      *.npz    single uncompressed NumPy archive
+      *.json   JSON text
+    Arrays are stored with their dtypes, so models round-trip exactly.
+    """
+    if _is_directory_format(path):
+        _save_directory(model, path)
+    elif path.lower().endswith(".npz"):
+        _save_npz(model, path)
+    else:
+        _save_json(model, path)
+
+
+def load_model(path, mmap=True):
+    """
+    Loads a model file into a new FrameModelData.
+    .frame directories are memory-mapped by default: arrays are paged in from
+    disk on first access and edits stay in memory (copy-on-write), so large
+    models open without reading or parsing every value up front.
+    """
+    if _is_directory_format(path):
+        return _load_directory(path, mmap)
+    elif path.lower().endswith(".npz"):
+        return _load_npz(path)
+    return _load_json(path)
+
+
+def is_model_path(path):
+    return os.path.isfile(path) or _is_directory_format(path) and os.path.isdir(path)
+
+
+def _is_directory_format(path):
+    return path.rstrip("/\\").lower().endswith(".frame") or os.path.isdir(path)
+
+
+def _model_from(arrays, load_cases, path, substructures=None, load_combinations=None, member_loads=None):
+    missing = [name for name in MODEL_ARRAYS[:4] if name not in arrays]
+    if missing:
+        raise ValueError(f"{path}: missing model arrays {missing}")
+
+    # float32 properties stay float32; everything else is read at the model's default precision
+    property_dtype = np.float32 if np.asarray(arrays["element_properties"]).dtype == np.float32 else np.float64
+    model = FrameModelData.fromArrays(**{name: arrays[name] for name in MODEL_ARRAYS if name in arrays},
+                                      property_dtype=property_dtype)
+    for name, forces in load_cases.items():
+        model.addLoadCase(name, forces)
+    for name, elements in (substructures or {}).items():
+        model.addSubstructure(name, elements)
+    for name, rows in (member_loads or {}).items():
+        model.addMemberLoads(name, rows)
+    for name, factors in (load_combinations or {}).items():
+        model.addLoadCombination(name, factors)
+    return model
+
+
+# === .frame directory of .npy files ===
+
+def _save_directory(model, path):
+    os.makedirs(os.path.join(path, "load_cases"), exist_ok=True)
+    os.makedirs(os.path.join(path, "member_loads"), exist_ok=True)
+    os.makedirs(os.path.join(path, "substructures"), exist_ok=True)
+
+    for name in MODEL_ARRAYS:
+        np.save(os.path.join(path, f"{name}.npy"), np.asarray(getattr(model, name)))
+
+    # Case names may contain any character, so files are numbered and named in the manifest
+    case_files = {}
+    for i, (name, forces) in enumerate(model.load_cases.items()):
+        case_files[name] = f"load_cases/case_{i}.npy"
+        np.save(os.path.join(path, case_files[name]), np.asarray(forces))
+
+    member_load_files = {}
+    for i, (name, rows) in enumerate(model.member_loads.items()):
+        member_load_files[name] = f"member_loads/case_{i}.npy"
+        np.save(os.path.join(path, member_load_files[name]), np.asarray(rows))
+
+    substructure_files = {}
+    for i, (name, elements) in enumerate(model.substructures.items()):
+        substructure_files[name] = f"substructures/substructure_{i}.npy"
+        np.save(os.path.join(path, substructure_files[name]), np.asarray(elements))
+
+    manifest = {"format": "frame", "version": FORMAT_VERSION, "arrays": list(MODEL_ARRAYS),
+                "load_cases": case_files, "member_loads": member_load_files,
+                "load_combinations": model.load_combinations,
+                "substructures": substructure_files}
+    with open(os.path.join(path, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def _load_directory(path, mmap):
+    with open(os.path.join(path, MANIFEST), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version", 0) > FORMAT_VERSION:
+        raise ValueError(f"{path}: model format version {manifest['version']} is newer than supported")
+
+    mmap_mode = "c" if mmap else None
+    arrays = {}
+    for name in manifest["arrays"]:
+        file = os.path.join(path, f"{name}.npy")
+        if os.path.exists(file):
+            arrays[name] = _load_npy(file, mmap_mode)
+
+    load_cases = {name: _load_npy(os.path.join(path, file), mmap_mode)
+                  for name, file in manifest.get("load_cases", {}).items()}
+    substructures = {name: np.load(os.path.join(path, file))
+                     for name, file in manifest.get("substructures", {}).items()}
+    member_loads = {name: np.load(os.path.join(path, file))
+                    for name, file in manifest.get("member_loads", {}).items()}
+    return _model_from(arrays, load_cases, path, substructures, manifest.get("load_combinations"), member_loads)
+
+
+def _load_npy(file, mmap_mode):
+    # Empty arrays cannot be memory-mapped
+    if mmap_mode and os.path.getsize(file) > 0:
+        try:
+            return np.load(file, mmap_mode=mmap_mode)
+        except ValueError:
+            pass
+    return np.load(file)
+
+
+# === single .npz archive ===
+
+def _save_npz(model, path):
+    arrays = {name: np.asarray(getattr(model, name)) for name in MODEL_ARRAYS}
+    case_names = list(model.load_cases)
+    for i, name in enumerate(case_names):
+        arrays[f"load_case_{i}"] = np.asarray(model.load_cases[name])
+    arrays["load_case_names"] = np.array(case_names, dtype=str)
+    member_load_names = list(model.member_loads)
+    for i, name in enumerate(member_load_names):
+        arrays[f"member_load_{i}"] = np.asarray(model.member_loads[name])
+    arrays["member_load_names"] = np.array(member_load_names, dtype=str)
+    substructure_names = list(model.substructures)
+    for i, name in enumerate(substructure_names):
+        arrays[f"substructure_{i}"] = np.asarray(model.substructures[name])
+    arrays["substructure_names"] = np.array(substructure_names, dtype=str)
+    # Combinations are small nested mappings, kept as JSON text so the archive loads without pickle
+    arrays["load_combinations"] = np.array(json.dumps(model.load_combinations))
+    np.savez(path, **arrays)
+
+
+def _load_npz(path):
+    with np.load(path, allow_pickle=False) as archive:
+        arrays = {name: archive[name] for name in MODEL_ARRAYS if name in archive.files}
+        names = archive["load_case_names"].tolist() if "load_case_names" in archive.files else []
+        load_cases = {name: archive[f"load_case_{i}"] for i, name in enumerate(names)}
+        names = archive["substructure_names"].tolist() if "substructure_names" in archive.files else []
+        substructures = {name: archive[f"substructure_{i}"] for i, name in enumerate(names)}
+        names = archive["member_load_names"].tolist() if "member_load_names" in archive.files else []
+        member_loads = {name: archive[f"member_load_{i}"] for i, name in enumerate(names)}
+        load_combinations = json.loads(archive["load_combinations"].item()) if "load_combinations" in archive.files else {}
+    return _model_from(arrays, load_cases, path, substructures, load_combinations, member_loads)
+
+
+# === JSON text ===
+
+def _save_json(model, path):
+    data = {name: np.asarray(getattr(model, name)).tolist() for name in MODEL_ARRAYS}
+    data["load_cases"] = {name: np.asarray(forces).tolist() for name, forces in model.load_cases.items()}
+    data["member_loads"] = {name: np.asarray(rows).tolist() for name, rows in model.member_loads.items()}
+    data["load_combinations"] = model.load_combinations
+    data["substructures"] = {name: np.asarray(elements).tolist() for name, elements in model.substructures.items()}
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return _model_from({name: data[name] for name in MODEL_ARRAYS if name in data}, data.get("load_cases", {}), path,
+                       data.get("substructures", {}), data.get("load_combinations", {}), data.get("member_loads", {}))
+
+
+def save_results(results, path, load_combinations=None):
+    """
+    Saves a FrameResults object as an uncompressed .npz archive.
+    With load_combinations, the max/min envelope of every result quantity and the index of its
+    governing combination are stored too, e.g. element_end_forces_max and element_end_forces_max_combination.
+    """
+    arrays = {}
+    if load_combinations:
+        for quantity, bounds in envelope(results, load_combinations).items():
+            arrays.update({f"{quantity}_max": bounds.maximum, f"{quantity}_min": bounds.minimum,
+                           f"{quantity}_max_combination": bounds.max_combination,
+                           f"{quantity}_min_combination": bounds.min_combination})
+        arrays["combination_names"] = np.array(list(load_combinations), dtype=str)
+
+    np.savez(path,
+             load_case_names=np.array(results.load_case_names, dtype=str),
+             eq_matrix=results.eq_matrix,
+             displacements=results.displacements,
+             nodal_displacements=results.nodal_displacements,
+             element_end_forces=results.element_end_forces,
+             reactions=results.reactions,
+             **arrays)
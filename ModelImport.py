@@ -0,0 +1,358 @@
+"""
+Streaming bulk import of frame models from tabular exports.
+
+    model, report = import_model("nodes.csv", "elements.csv", "supports.csv", "loads.jsonl")
+    if not report.ok:
+        print(report.summary())
+
+Every table can be CSV (with a header row) or JSON Lines (one object per line).
+Rows are read in chunks and converted column by column into NumPy arrays, so the
+cost per row stays flat from a handful of rows to millions. Problems are not
+raised one by one; they are collected into a single ImportReport. Cells that
+cannot be parsed are stored as NaN (values) or 0 (node ids) and listed in the report.
+
+Columns (case-insensitive, aliases in brackets):
+    nodes:     id [node, node_id] (optional), x, y
+    elements:  id [element, element_id] (optional), start [start_node, n1], end [end_node, n2],
+               a [area], i [inertia], e [modulus, elastic_modulus]
+    supports:  node [node_id, id], fix_x [ux], fix_y [uy], fix_rz [rz, rotation]  (0/1 or true/false)
+    loads:     node [node_id, id], fx, fy, mz [m], case [load_case] (optional, named load cases)
+"""
+import csv
+import itertools
+import json
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from FrameModelData import FrameModelData
+
+
+# (column, aliases, kind, required); kind is "float", "int", "bool" or "str"
+SCHEMAS = {
+    "nodes": [
+        ("id", ("node", "node_id"), "int", False),
+        ("x", (), "float", True),
+        ("y", (), "float", True),
+    ],
+    "elements": [
+        ("id", ("element", "element_id"), "int", False),
+        ("start", ("start_node", "n1"), "int", True),
+        ("end", ("end_node", "n2"), "int", True),
+        ("a", ("area",), "float", True),
+        ("i", ("inertia",), "float", True),
+        ("e", ("modulus", "elastic_modulus"), "float", True),
+    ],
+    "supports": [
+        ("node", ("node_id", "id"), "int", True),
+        ("fix_x", ("ux",), "bool", True),
+        ("fix_y", ("uy",), "bool", True),
+        ("fix_rz", ("rz", "rotation"), "bool", True),
+    ],
+    "loads": [
+        ("node", ("node_id", "id"), "int", True),
+        ("fx", (), "float", True),
+        ("fy", (), "float", True),
+        ("mz", ("m",), "float", True),
+        ("case", ("load_case",), "str", False),
+    ],
+}
+
+TRUE_WORDS = np.array(["1", "true", "yes", "y", "fixed"])
+FALSE_WORDS = np.array(["0", "false", "no", "n", "free", ""])
+
+
+@dataclass
+class ImportIssue:
+    table: str
+    row: int      # line number in the source file, 0 for table-level problems
+    column: str
+    message: str
+
+    def __str__(self):
+        where = f"line {self.row}" if self.row else "table"
+        column = f", column '{self.column}'" if self.column else ""
+        return f"{self.table}: {where}{column}: {self.message}"
+
+
+@dataclass
+class ImportReport:
+    """
+    All problems found while importing, in one place.
+    Only the first max_issues are stored; issue_count keeps counting beyond that.
+    """
+
+    max_issues: int = 1000
+    issues: list = field(default_factory=list)
+    issue_count: int = 0
+    rows: dict = field(default_factory=dict)  # rows read per table
+
+    @property
+    def ok(self):
+        return self.issue_count == 0
+
+    def add(self, table, row, column, message):
+        self.issue_count += 1
+        if len(self.issues) < self.max_issues:
+            self.issues.append(ImportIssue(table, int(row), column, message))
+
+    def add_rows(self, table, lines, column, message):
+        # Records the same problem for many rows without building the messages up front
+        lines = np.asarray(lines).ravel()
+        room = max(self.max_issues - len(self.issues), 0)
+        for line in lines[:room]:
+            self.issues.append(ImportIssue(table, int(line), column, message))
+        self.issue_count += lines.shape[0]
+
+    def summary(self):
+        counts = ", ".join(f"{count} {table}" for table, count in self.rows.items())
+        lines = [f"Imported {counts}; {self.issue_count} problem(s) found"]
+        lines += [f"  {issue}" for issue in self.issues]
+        if self.issue_count > len(self.issues):
+            lines.append(f"  ... and {self.issue_count - len(self.issues)} more")
+        return "\n".join(lines)
+
+
+def import_model(nodes, elements, supports=None, loads=None, chunk_size=100_000, max_issues=1000):
+    """
+    Imports node, element, support and load tables into a new FrameModelData.
+    node_count, element_count, support_count and force_count are set from the data.
+    Loads with a case column become named load cases; otherwise they fill force_conditions.
+    Returns (model, report).
+    """
+    report = ImportReport(max_issues=max_issues)
+
+    node_table = read_table(nodes, "nodes", report, chunk_size)
+    element_table = read_table(elements, "elements", report, chunk_size)
+    support_table = read_table(supports, "supports", report, chunk_size) if supports else _empty("supports")
+    load_table = read_table(loads, "loads", report, chunk_size) if loads else _empty("loads")
+
+    node_table = _order_by_id(node_table, "nodes", report)
+    element_table = _order_by_id(element_table, "elements", report)
+    node_count = node_table["x"].shape[0]
+
+    node_coordinates = np.column_stack((node_table["x"], node_table["y"]))
+    element_connectivity = np.column_stack((element_table["start"], element_table["end"]))
+    element_properties = np.column_stack((element_table["a"], element_table["i"], element_table["e"]))
+    support_conditions = np.column_stack((support_table["node"], support_table["fix_x"],
+                                          support_table["fix_y"], support_table["fix_rz"]))
+    forces = np.column_stack((load_table["node"], load_table["fx"], load_table["fy"], load_table["mz"]))
+
+    _check_node_references(element_table["start"], element_table["_line"], "elements", "start", node_count, report)
+    _check_node_references(element_table["end"], element_table["_line"], "elements", "end", node_count, report)
+    _check_node_references(support_table["node"], support_table["_line"], "supports", "node", node_count, report)
+    _check_node_references(load_table["node"], load_table["_line"], "loads", "node", node_count, report)
+
+    cases = load_table.get("case")
+    model = FrameModelData.fromArrays(node_coordinates, element_connectivity, element_properties,
+                                      support_conditions, None if cases is not None else forces)
+    if cases is not None:
+        names, first = np.unique(cases, return_index=True)
+        for name in names[np.argsort(first)]:  # keep the order cases first appear in
+            model.addLoadCase(str(name), forces[cases == name])
+
+    return model, report
+
+
+def read_table(path, table, report, chunk_size=100_000):
+    """
+    Reads one CSV or JSON Lines table in chunks.
+    Returns a dict of column arrays plus "_line" with the source line of each row.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        chunks = _jsonl_chunks(path, table, report, chunk_size)
+    else:
+        chunks = _csv_chunks(path, table, report, chunk_size)
+
+    parts = {}
+    for chunk in chunks:
+        for name, values in chunk.items():
+            parts.setdefault(name, []).append(values)
+
+    columns = _empty(table)
+    for name, values in parts.items():
+        columns[name] = np.concatenate(values)
+
+    # Optional columns that the file does not have are left out entirely
+    for column, _, _, required in SCHEMAS[table]:
+        if not required and column not in parts:
+            columns.pop(column)
+
+    report.rows[table] = columns["_line"].shape[0]
+    return columns
+
+
+# === readers ===
+
+def _csv_chunks(path, table, report, chunk_size):
+    with open(path, "r", newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            report.add(table, 0, "", f"{path} is empty")
+            return
+
+        positions = _resolve_columns([name.strip().lower() for name in header], table, report)
+        if positions is None:
+            return
+
+        width = max(positions.values()) + 1
+        while True:
+            line = reader.line_num + 1
+            rows = list(itertools.islice(reader, chunk_size))
+            if not rows:
+                break
+
+            lines = np.arange(line, line + len(rows))
+            lengths = np.fromiter(map(len, rows), int, len(rows))
+            keep = lengths >= width
+            short = (lengths > 0) & ~keep  # blank lines are skipped silently
+            if short.any():
+                report.add_rows(table, lines[short], "", f"expected at least {width} columns")
+
+            index = list(positions.values())
+            cells = [[row[i] for i in index] for row, k in zip(rows, keep) if k]
+            text = np.array(cells, dtype=str).reshape(-1, len(positions))
+            yield _convert(text, list(positions), lines[keep], table, report)
+
+
+def _jsonl_chunks(path, table, report, chunk_size):
+    with open(path, "r", encoding="utf-8") as f:
+        line = 0
+        names = None
+        while True:
+            raw = list(itertools.islice(f, chunk_size))
+            if not raw:
+                break
+
+            records, lines = [], []
+            for offset, text in enumerate(raw, start=line + 1):
+                if not text.strip():
+                    continue
+                try:
+                    record = json.loads(text)
+                except ValueError as e:
+                    report.add(table, offset, "", f"invalid JSON ({e.msg})")
+                    continue
+                if not isinstance(record, dict):
+                    report.add(table, offset, "", "expected a JSON object")
+                    continue
+                records.append({key.lower(): value for key, value in record.items()})
+                lines.append(offset)
+            line += len(raw)
+
+            if not records:
+                continue
+            if names is None:
+                # The keys of the first chunk name the columns for the whole file; a record without
+                # one of them reads as an empty cell and is reported as a missing value
+                header = list(dict.fromkeys(key for record in records for key in record))
+                positions = _resolve_columns(header, table, report)
+                if positions is None:
+                    return
+                columns, names = list(positions), [header[i] for i in positions.values()]
+
+            # Every row becomes text first so CSV and JSON Lines share one converter
+            cells = [["" if record.get(name) is None else str(record.get(name)) for name in names]
+                     for record in records]
+            text = np.array(cells, dtype=str).reshape(-1, len(names))
+            yield _convert(text, columns, np.array(lines), table, report)
+
+
+def _resolve_columns(header, table, report):
+    # Maps schema columns to their position in the header; None when a required column is missing
+    positions = {}
+    for column, aliases, _, required in SCHEMAS[table]:
+        for name in (column,) + aliases:
+            if name in header:
+                positions[column] = header.index(name)
+                break
+        else:
+            if required:
+                report.add(table, 0, column, "required column is missing")
+                return None
+    return positions
+
+
+# === conversion ===
+
+def _convert(text, columns, lines, table, report):
+    kinds = {column: kind for column, _, kind, _ in SCHEMAS[table]}
+    chunk = {"_line": lines}
+    for j, column in enumerate(columns):
+        chunk[column] = _convert_column(np.char.strip(text[:, j]), kinds[column], lines, table, column, report)
+    return chunk
+
+
+def _convert_column(values, kind, lines, table, column, report):
+    if kind == "str":
+        return values
+
+    if kind == "bool":
+        lowered = np.char.lower(values)
+        is_true = np.isin(lowered, TRUE_WORDS)
+        bad = ~(is_true | np.isin(lowered, FALSE_WORDS))
+        if bad.any():
+            report.add_rows(table, lines[bad], column, "expected 0/1 or true/false")
+        return is_true.astype(int)
+
+    missing = values == ""
+    if missing.any():
+        report.add_rows(table, lines[missing], column, "missing value")
+
+    numbers = np.full(values.shape[0], np.nan)
+    try:
+        numbers[~missing] = values[~missing].astype(float)
+    except ValueError:
+        # Slow path only for chunks that contain unparsable cells
+        for index in np.flatnonzero(~missing):
+            try:
+                numbers[index] = float(values[index])
+            except ValueError:
+                report.add(table, lines[index], column, f"cannot read '{values[index]}' as a number")
+
+    if kind == "int":
+        fractional = np.isfinite(numbers) & (numbers != np.round(numbers))
+        if fractional.any():
+            report.add_rows(table, lines[fractional], column, "expected a whole number")
+        return np.where(np.isfinite(numbers) & ~fractional, numbers, 0).astype(int)
+    return numbers
+
+
+def _empty(table):
+    columns = {"_line": np.zeros(0, dtype=int)}
+    for column, _, kind, _ in SCHEMAS[table]:
+        columns[column] = np.zeros(0, dtype={"float": float, "int": int, "bool": int, "str": str}[kind])
+    return columns
+
+
+# === consistency checks ===
+
+def _order_by_id(columns, table, report):
+    # Puts rows in id order when an id column is given; ids must be exactly 1..N
+    ids = columns.get("id")
+    if ids is None or ids.shape[0] == 0:
+        return columns
+
+    count = ids.shape[0]
+    in_range = (ids >= 1) & (ids <= count)
+    if not in_range.all():
+        report.add_rows(table, columns["_line"][~in_range], "id", f"id must be between 1 and {count}")
+
+    seen = np.bincount(np.where(in_range, ids, 0), minlength=count + 1)
+    duplicated = in_range & (seen[np.where(in_range, ids, 0)] > 1)
+    if duplicated.any():
+        report.add_rows(table, columns["_line"][duplicated], "id", "duplicate id")
+
+    if in_range.all() and not duplicated.any():
+        order = np.argsort(ids, kind="stable")
+        return {name: values[order] for name, values in columns.items()}
+    return columns
+
+
+def _check_node_references(node_ids, lines, table, column, node_count, report):
+    bad = (node_ids < 1) | (node_ids > node_count)
+    if bad.any():
+        report.add_rows(table, lines[bad], column, f"node id must be between 1 and {node_count}")
@@ -0,0 +1,90 @@
+"""
+Node -> element adjacency of a frame in compressed sparse row (CSR) form.
+
+    index = NodeElementIndex(model.element_connectivity, node_count)
+    index.elements_at(k)      # zero-based elements at zero-based node k
+    index.degree              # number of element ends at every node
+    index.connected_components()
+
+The index is built once from element_connectivity with one sort. Topology queries are
+then slices or whole-array operations on it and do not scan the element list again.
+FrameModelData keeps one index per model (FrameModelData.topology()).
+"""
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+
+class NodeElementIndex:
+    """
+    indptr:   (node_count + 1,) the entries of node k are indptr[k]:indptr[k + 1]
+    elements: zero-based element index of every entry, int32
+    others:   zero-based node at the other end of that element, -1 if it is not a valid node
+    Element ends that do not refer to a node between 1 and node_count are left out.
+    """
+
+    __slots__ = ("indptr", "elements", "others")
+
+    def __init__(self, connectivity, node_count):
+        connectivity = np.asarray(connectivity).reshape(-1, 2).astype(np.int64) - 1
+        element_count = connectivity.shape[0]
+
+        ends = np.concatenate((connectivity[:, 0], connectivity[:, 1]))
+        others = np.concatenate((connectivity[:, 1], connectivity[:, 0]))
+        elements = np.concatenate((np.arange(element_count), np.arange(element_count)))
+
+        valid = (ends >= 0) & (ends < node_count)
+        ends, others, elements = ends[valid], others[valid], elements[valid]
+        others[(others < 0) | (others >= node_count)] = -1
+
+        # Sorting on (node, entry) keeps the order deterministic and is much faster than a stable sort
+        order = np.argsort(ends * ends.shape[0] + np.arange(ends.shape[0]))
+        self.elements = elements[order].astype(np.int32)
+        self.others = others[order].astype(np.int32)
+        self.indptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ends, minlength=node_count), out=self.indptr[1:])
+
+    @property
+    def node_count(self):
+        return self.indptr.shape[0] - 1
+
+    @property
+    def degree(self):
+        return np.diff(self.indptr)
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.elements.nbytes + self.others.nbytes
+
+    def elements_at(self, node):
+        return self.elements[self.indptr[node]:self.indptr[node + 1]]
+
+    def nodes(self):
+        # Zero-based node of every entry, in index order
+        return np.repeat(np.arange(self.node_count), self.degree)
+
+    def node_adjacency(self):
+        """
+        Symmetric node adjacency graph as a CSR matrix with one entry per connected node pair.
+        """
+        valid = self.others >= 0
+        data = np.ones(np.count_nonzero(valid), dtype=np.int8)
+        graph = sparse.coo_matrix((data, (self.nodes()[valid], self.others[valid])),
+                                  shape=(self.node_count, self.node_count)).tocsr()
+        graph.data[:] = 1  # collapse parallel members into a single edge
+        return graph
+
+    def connected_components(self):
+        # Returns (count, labels) with the zero-based component of every node
+        return connected_components(self.node_adjacency(), directed=False)
+
+    def reduce_at_nodes(self, ufunc, values, empty):
+        """
+        Applies a reducing ufunc (np.minimum, np.add, ...) to per-element values over the
+        elements at every node. Nodes without elements get empty.
+        """
+        result = np.full(self.node_count, empty, dtype=np.result_type(values, empty))
+        used = self.degree > 0
+        if used.any():
+            result[used] = ufunc.reduceat(np.asarray(values)[self.elements], self.indptr[:-1][used])
+        return result
@@ -0,0 +1,248 @@
+"""
+Checks a whole FrameModelData at once before it is solved.
+
+    report = validate_model(model)
+    if not report.ok:
+        print(report.summary())
+
+Every check works on complete columns of the model arrays, so a model with a million
+rows is checked in about the time it takes to read it. All problems are collected
+into one ValidationReport: values that are missing or could not be read (NaN),
+node IDs out of range, zero-length elements, duplicate elements, non-positive
+A, I or E, nodes without elements, parts of the frame without supports, member
+loads with unknown elements, kinds, directions or positions, load combinations
+of unknown load cases, and substructures with unknown, repeated or shared
+elements. FrameSolver.run() refuses to solve a model whose report is not ok.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class ValidationIssue:
+    table: str    # "nodes", "elements", "supports", "forces", "load case '<name>'",
+                  # "member loads '<case>'", "load combination '<name>'" or "substructure '<name>'"
+    row: int      # 1-based table row, 0 for problems with the table as a whole
+    column: str
+    message: str
+
+    def __str__(self):
+        where = f"row {self.row}" if self.row else "table"
+        column = f", {self.column}" if self.column else ""
+        return f"{self.table}: {where}{column}: {self.message}"
+
+
+@dataclass
+class ValidationReport:
+    """
+    All problems found in a model, grouped by table and check.
+    Only the first max_issues are stored; issue_count keeps counting beyond that.
+    """
+
+    max_issues: int = 1000
+    issues: list = field(default_factory=list)
+    issue_count: int = 0
+
+    @property
+    def ok(self):
+        return self.issue_count == 0
+
+    def add(self, table, row, column, message):
+        self.issue_count += 1
+        if len(self.issues) < self.max_issues:
+            self.issues.append(ValidationIssue(table, row, column, message))
+
+    def add_rows(self, table, rows, column, message, values=None):
+        """
+        Records one problem for many rows at once. rows are 0-based array indices.
+        When values is given, message is formatted with values[k] for the k-th row,
+        but only for the issues that are actually stored.
+        """
+        rows = np.asarray(rows).ravel()
+        room = max(self.max_issues - len(self.issues), 0)
+        for k, row in enumerate(rows[:room]):
+            text = message if values is None else message.format(*np.atleast_1d(values[k]))
+            self.issues.append(ValidationIssue(table, int(row) + 1, column, text))
+        self.issue_count += rows.shape[0]
+
+    def summary(self):
+        lines = [f"{self.issue_count} problem(s) found" if self.issue_count else "No problems found"]
+        lines += [f"  {issue}" for issue in self.issues]
+        if self.issue_count > len(self.issues):
+            lines.append(f"  ... and {self.issue_count - len(self.issues)} more")
+        return "\n".join(lines)
+
+
+class ModelValidationError(ValueError):
+    # Raised by FrameSolver.run() for a model that did not pass validate_model()
+
+    def __init__(self, report):
+        self.report = report
+        first = f"; first: {report.issues[0]}" if report.issues else ""
+        super().__init__(f"the model has {report.issue_count} problem(s){first}")
+
+
+def validate_model(model, max_issues=1000):
+    """
+    Runs every check on the model arrays and returns a ValidationReport.
+    Node IDs are 1-based as in the input tables.
+    """
+    report = ValidationReport(max_issues=max_issues)
+
+    coords = np.asarray(model.node_coordinates, dtype=float).reshape(-1, 2)
+    connectivity = np.asarray(model.element_connectivity).reshape(-1, 2)
+    properties = np.asarray(model.element_properties, dtype=float).reshape(-1, 3)
+    supports = np.asarray(model.support_conditions).reshape(-1, 4)
+    node_count = coords.shape[0]
+
+    if node_count == 0:
+        report.add("nodes", 0, "", "the model has no nodes")
+    if connectivity.shape[0] == 0:
+        report.add("elements", 0, "", "the model has no elements")
+
+    _check_values(report, "nodes", coords, ("X", "Y"))
+
+    valid = _check_node_ids(report, "elements", connectivity[:, 0], "start node", node_count)
+    valid &= _check_node_ids(report, "elements", connectivity[:, 1], "end node", node_count)
+    _check_elements(report, coords, connectivity, valid)
+    if valid.all():
+        _check_connections(report, model)
+
+    _check_values(report, "elements", properties, ("A", "I", "E"))
+    for j, name in enumerate(("A", "I", "E")):
+        report.add_rows("elements", np.flatnonzero(properties[:, j] <= 0), name, "must be positive")
+
+    _check_node_ids(report, "supports", supports[:, 0], "node", node_count)
+
+    cases = model.load_cases or {"forces": model.force_conditions}
+    for name, forces in cases.items():
+        table = name if not model.load_cases else f"load case '{name}'"
+        forces = np.asarray(forces, dtype=float).reshape(-1, 4)
+        _check_node_ids(report, table, forces[:, 0], "node", node_count)
+        _check_values(report, table, forces[:, 1:], ("Fx", "Fy", "Mz"))
+
+    for name, rows in model.member_loads.items():
+        _check_member_loads(report, f"member loads '{name}'", np.asarray(rows, dtype=float).reshape(-1, 7),
+                            connectivity.shape[0])
+    _check_combinations(report, model.load_combinations, list(model.getLoadCases()))
+    _check_substructures(report, model.substructures, connectivity.shape[0])
+    return report
+
+
+def _check_values(report, table, values, columns):
+    # NaN marks a value that was never entered or could not be read
+    for j, column in enumerate(columns):
+        report.add_rows(table, np.flatnonzero(~np.isfinite(values[:, j])), column, "missing or invalid value")
+
+
+def _check_node_ids(report, table, ids, column, node_count):
+    # Returns the mask of rows whose node ID refers to an existing node
+    ids = np.asarray(ids, dtype=float)
+    missing = (ids == 0) | np.isnan(ids)
+    whole = ids == np.round(ids)
+    valid = whole & (ids >= 1) & (ids <= node_count)
+    report.add_rows(table, np.flatnonzero(missing), column, "missing node ID")
+    bad = np.flatnonzero(~valid & ~missing)
+    report.add_rows(table, bad, column, f"node ID {{:g}} is not between 1 and {node_count}", ids[bad])
+    return valid
+
+
+def _check_elements(report, coords, connectivity, valid):
+    rows = np.flatnonzero(valid)
+    n1 = connectivity[rows, 0].astype(np.int64) - 1
+    n2 = connectivity[rows, 1].astype(np.int64) - 1
+
+    same = n1 == n2
+    report.add_rows("elements", rows[same], "", "starts and ends at the same node")
+
+    length = np.hypot(*(coords[n2] - coords[n1]).T)
+    coincide = ~same & (length == 0)
+    report.add_rows("elements", rows[coincide], "", "zero length, nodes {:d} and {:d} are at the same point",
+                    np.column_stack((n1[coincide] + 1, n2[coincide] + 1)))
+
+    # Elements joining the same pair of nodes, in either direction
+    key = np.minimum(n1, n2) * coords.shape[0] + np.maximum(n1, n2)
+    _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    original = rows[first[inverse.ravel()]]
+    duplicate = ~same & (original != rows)
+    report.add_rows("elements", rows[duplicate], "", "duplicate of element {:d}", original[duplicate] + 1)
+
+
+def _check_connections(report, model):
+    # Free nodes without elements and parts of the frame with no support make K_global singular
+    topology = model.topology()
+    restrained = model.restrainedDofs()
+    isolated = (topology.degree == 0) & ~restrained.all(axis=1)
+    report.add_rows("nodes", np.flatnonzero(isolated), "", "not connected to any element")
+
+    count, labels = topology.connected_components()
+    supported = np.zeros(count, dtype=bool)
+    supported[labels[restrained.any(axis=1)]] = True
+    first = np.full(count, topology.node_count)
+    np.minimum.at(first, labels, np.arange(topology.node_count))
+    sizes = np.bincount(labels, minlength=count)
+    unsupported = np.flatnonzero(~supported & (sizes > 1))
+    report.add_rows("nodes", first[unsupported], "", "the {:d} nodes connected to this node have no support",
+                    sizes[unsupported])
+
+
+def _check_member_loads(report, table, rows, element_count):
+    # Columns as in MemberLoads: [element_id, kind, direction, w1, w2, a, b]
+    from MemberLoads import DIRECTIONS, KINDS, POINT
+
+    ids = rows[:, 0]
+    bad = np.flatnonzero(~np.isin(ids, np.arange(1, element_count + 1)))
+    report.add_rows(table, bad, "element", f"element ID {{:g}} is not between 1 and {element_count}", ids[bad])
+    report.add_rows(table, np.flatnonzero(~np.isin(rows[:, 1], list(KINDS.values()))), "kind", "unknown load kind")
+    report.add_rows(table, np.flatnonzero(~np.isin(rows[:, 2], list(DIRECTIONS.values()))), "direction",
+                    "unknown load direction")
+
+    point = rows[:, 1] == POINT
+    _check_values(report, table, rows[:, [3, 5]], ("w1", "a"))
+    _check_values(report, table, np.where(point[:, None], 0.0, rows[:, [4, 6]]), ("w2", "b"))
+    a, b = rows[:, 5], np.where(point, rows[:, 5], rows[:, 6])
+    report.add_rows(table, np.flatnonzero((a < 0) | (b > 1) | (a > b)), "a",
+                    "positions must satisfy 0 <= a <= b <= 1 (fractions of the element length)")
+
+
+def _check_combinations(report, combinations, case_names):
+    # Rows are the 1-based entries of a combination, the column its load case
+    for name, factors in combinations.items():
+        table = f"load combination '{name}'"
+        if not factors:
+            report.add(table, 0, "", "the combination has no load cases")
+        for row, (case, factor) in enumerate(factors.items(), start=1):
+            if case not in case_names:
+                report.add(table, row, str(case), "unknown load case")
+            if not np.isfinite(factor):
+                report.add(table, row, str(case), "missing or invalid factor")
+
+
+def _check_substructures(report, substructures, element_count):
+    # Every element may belong to one substructure at most
+    names = list(substructures)
+    owner = np.full(element_count, -1)
+    for k, (name, elements) in enumerate(substructures.items()):
+        table = f"substructure '{name}'"
+        ids = np.asarray(elements).ravel()
+        if ids.shape[0] == 0:
+            report.add(table, 0, "", "the substructure has no elements")
+        valid = (ids >= 1) & (ids <= element_count)
+        bad = np.flatnonzero(~valid)
+        report.add_rows(table, bad, "element", f"element ID {{:d}} is not between 1 and {element_count}", ids[bad])
+
+        # A repeated element would have its stiffness condensed twice; the repeats are reported once per ID
+        rows = np.flatnonzero(valid)
+        _, first, counts = np.unique(ids[rows], return_index=True, return_counts=True)
+        repeated = rows[first[counts > 1]]
+        report.add_rows(table, repeated, "element", "element {:d} is listed {:d} times",
+                        np.column_stack((ids[repeated], counts[counts > 1])))
+        rows = np.sort(rows[first])
+
+        elements = ids[rows] - 1
+        taken = owner[elements] >= 0
+        shown = elements[taken][:report.max_issues]
+        report.add_rows(table, rows[taken], "element", "element {} is already in substructure '{}'",
+                        [(e + 1, names[o]) for e, o in zip(shown, owner[shown])])
+        owner[elements[~taken]] = k
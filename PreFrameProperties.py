@@ -1,10 +1,11 @@
-from PyQt5.QtWidgets import QWidget, QMessageBox
-from MainFramePropertiesWindow import Ui_Form_MainPropertiesWindow
+import os
+
+from PyQt5.QtWidgets import QWidget, QMessageBox, QFileDialog
 from PreFramePropertiesWindow import Ui_Form_PreFrameProperties
-from MainFrameProperties import MainFrameProperties
 
 # Import the FrameModelData class
 from FrameModelData import FrameModelData
+from ModelIO import load_model, MANIFEST
 
 class PreFrameProperties(QWidget):
     def __init__(self):
@@ -14,6 +15,34 @@ class PreFrameProperties(QWidget):
 
         # Connect the button to open the next window
         self.ui.button_Submit.clicked.connect(self.open_next_window)
+        self.ui.button_OpenModel.clicked.connect(self.open_saved_model)
+
+    def open_saved_model(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Open a Saved Model", "",
+            "Frame models (*.npz *.json);;Memory-mapped model directories (model.json)")
+        if not path:
+            return
+
+        # A .frame directory is opened through its manifest file
+        if os.path.basename(path) == MANIFEST and os.path.dirname(path).lower().endswith(".frame"):
+            path = os.path.dirname(path)
+
+        try:
+            model_data = load_model(path)
+        except (OSError, ValueError, KeyError) as e:
+            QMessageBox.critical(self, "Error", f"The model could not be opened:\n{e}")
+            return
+
+        self.open_model_window(model_data)
+
+    def open_model_window(self, model_data):
+        # Imported here so the start window does not wait for the editor and its dependencies
+        from MainFrameProperties import MainFrameProperties
+
+        self.window2 = MainFrameProperties(model_data)
+        self.window2.show()
+        self.close()
 
     def open_next_window(self):
        
@@ -55,7 +84,5 @@ class PreFrameProperties(QWidget):
             # If all inputs are valid, create the FrameModelData
             model_data = FrameModelData(node_count, element_count, support_count, force_count)
 
-            self.window2 = MainFrameProperties(model_data)
-            self.window2.show()
-            self.close()
+            self.open_model_window(model_data)
 
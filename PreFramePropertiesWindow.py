@@ -81,6 +81,9 @@ class Ui_Form_PreFrameProperties(object):
         self.button_Submit = QtWidgets.QPushButton(Form_PreFrameProperties)
         self.button_Submit.setObjectName("button_Submit")
         self.verticalLayout_3.addWidget(self.button_Submit)
+        self.button_OpenModel = QtWidgets.QPushButton(Form_PreFrameProperties)
+        self.button_OpenModel.setObjectName("button_OpenModel")
+        self.verticalLayout_3.addWidget(self.button_OpenModel)
 
         self.retranslateUi(Form_PreFrameProperties)
         QtCore.QMetaObject.connectSlotsByName(Form_PreFrameProperties)
@@ -94,6 +97,7 @@ class Ui_Form_PreFrameProperties(object):
         self.label_Support.setText(_translate("Form_PreFrameProperties", "How many support reactions in the frame?"))
         self.label_Force.setText(_translate("Form_PreFrameProperties", "How many nodal forces in the frame?"))
         self.button_Submit.setText(_translate("Form_PreFrameProperties", "Submit"))
+        self.button_OpenModel.setText(_translate("Form_PreFrameProperties", "Open a Saved Model"))
 
 
 if __name__ == "__main__":
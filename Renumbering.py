@@ -0,0 +1,29 @@
+import numpy as np
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+
+def rcm_node_order(graph):
+    """
+    Reverse Cuthill-McKee ordering of the nodes of a node adjacency graph.
+    Returns zero-based node indices in the order their equations should be numbered.
+    """
+    return np.asarray(reverse_cuthill_mckee(graph, symmetric_mode=True), dtype=int)
+
+
+def half_bandwidth(E, connectivity):
+    """
+    Half bandwidth of the global stiffness matrix for equation numbering E:
+    the largest difference between two active equation numbers of one element.
+    """
+    connectivity = np.asarray(connectivity, dtype=int).reshape(-1, 2) - 1
+    if connectivity.shape[0] == 0:
+        return 0
+
+    dofs = np.hstack((E[connectivity[:, 0]], E[connectivity[:, 1]]))
+    active = dofs != 0
+    if not active.any():
+        return 0
+
+    highest = np.where(active, dofs, 0).max(axis=1)
+    lowest = np.where(active, dofs, np.iinfo(dofs.dtype).max).min(axis=1)
+    return int(np.max(np.where(active.any(axis=1), highest - lowest, 0)))
@@ -24,16 +24,23 @@ class Ui_Form_Results(object):
         self.tab_Displacements.setObjectName("tab_Displacements")
         self.horizontalLayout = QtWidgets.QHBoxLayout(self.tab_Displacements)
         self.horizontalLayout.setObjectName("horizontalLayout")
-        self.table_displacements = QtWidgets.QTableWidget(self.tab_Displacements)
+        self.table_displacements = QtWidgets.QTableView(self.tab_Displacements)
         self.table_displacements.setObjectName("table_displacements")
-        self.table_displacements.setColumnCount(0)
-        self.table_displacements.setRowCount(0)
         self.horizontalLayout.addWidget(self.table_displacements)
         self.tabs_Results.addTab(self.tab_Displacements, "")
         self.tab_Element1 = QtWidgets.QWidget()
         self.tab_Element1.setObjectName("tab_Element1")
         self.horizontalLayout_3 = QtWidgets.QHBoxLayout(self.tab_Element1)
         self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.lineEdit_SearchElement = QtWidgets.QLineEdit(self.tab_Element1)
+        self.lineEdit_SearchElement.setObjectName("lineEdit_SearchElement")
+        self.verticalLayout_3.addWidget(self.lineEdit_SearchElement)
+        self.table_Elements = QtWidgets.QTableView(self.tab_Element1)
+        self.table_Elements.setObjectName("table_Elements")
+        self.verticalLayout_3.addWidget(self.table_Elements)
+        self.horizontalLayout_3.addLayout(self.verticalLayout_3)
         self.verticalLayout_2 = QtWidgets.QVBoxLayout()
         self.verticalLayout_2.setObjectName("verticalLayout_2")
         self.label_Element = QtWidgets.QLabel(self.tab_Element1)
@@ -141,6 +148,7 @@ class Ui_Form_Results(object):
         _translate = QtCore.QCoreApplication.translate
         Form_Results.setWindowTitle(_translate("Form_Results", "Results"))
         self.tabs_Results.setTabText(self.tabs_Results.indexOf(self.tab_Displacements), _translate("Form_Results", "Displacements"))
+        self.lineEdit_SearchElement.setPlaceholderText(_translate("Form_Results", "Search by element or node ID"))
         self.label_Element.setText(_translate("Form_Results", "Element 1"))
         self.label_StartNodeDisp.setText(_translate("Form_Results", "Start Node Displacement:"))
         self.label_EndNodeDisp.setText(_translate("Form_Results", "End Node Displacement:"))
@@ -150,7 +158,7 @@ class Ui_Form_Results(object):
         self.label_EndNodeFx.setText(_translate("Form_Results", "End Node Fx:"))
         self.label_EndNodeFy.setText(_translate("Form_Results", "End Node Fy:"))
         self.label_EndNodeM.setText(_translate("Form_Results", "End Node M:"))
-        self.tabs_Results.setTabText(self.tabs_Results.indexOf(self.tab_Element1), _translate("Form_Results", "Element 1"))
+        self.tabs_Results.setTabText(self.tabs_Results.indexOf(self.tab_Element1), _translate("Form_Results", "Elements"))
 
 
 if __name__ == "__main__":
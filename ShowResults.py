@@ -1,108 +1,189 @@
-from PyQt5 import QtWidgets, QtCore
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTableWidgetItem
+from PyQt5 import QtCore
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QAbstractItemView, QComboBox
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from ResultsWindow import Ui_Form_Results
+from FrameTableModels import ResultsTableModel, attach_table
+from ElementKernels import ElementKernels
+from InternalForces import STATIONS, diagram_polylines, display_stations, internal_forces, station_positions
 import numpy as np
 
+# Quantity index in the [N, V, M] diagrams, label and unit
+DIAGRAMS = ((2, "Bending moment M", "kNm"), (1, "Shear force V", "kN"), (0, "Axial force N", "kN"))
+DIAGRAM_SIZE = 0.15  # largest diagram ordinate as a fraction of the model size
+
 class ShowResults(QWidget):
-    def __init__(self, model, displacements, eq_matrix, coords, elements, element_end_forces):
+    def __init__(self, model, results, case_index=0):
          super().__init__()
          self.ui = Ui_Form_Results()
          self.ui.setupUi(self)
  
+         # results is the FrameResults returned by the headless solver
          self.model_data = model
-         self.displacements = displacements
-         self.eq_matrix = eq_matrix
-         self.coords = coords
-         self.elements = elements
-         self.element_end_forces = element_end_forces
+         self.results = results
+         self.case_index = case_index
+         self.eq_matrix = results.eq_matrix
+         self.coords = model.node_coordinates
+         self.elements = model.element_connectivity
  
+         self.stations, self.diagrams = self.internal_force_diagrams()
          self.populate_displacement_table()
-         self.create_element_tabs()
+         self.create_element_browser()
+         self.create_diagram_tab()
+
+    def internal_force_diagrams(self):
+        # [N, V, M] along every member for this case; usually recovered by the solver already
+        if self.results.internal_forces is not None:
+            return self.results.stations, self.results.internal_forces[self.case_index]
+
+        connectivity = np.asarray(self.elements, dtype=np.int64).reshape(-1, 2)
+        L, c, s = ElementKernels.element_geometry(self.coords, connectivity[:, 0] - 1, connectivity[:, 1] - 1)
+        stations = station_positions(STATIONS)
+        member_loads = self.model_data.member_loads.get(self.results.load_case_names[self.case_index])
+        forces = self.results.element_end_forces[self.case_index]
+        return stations, internal_forces(forces, L, c, s, stations, member_loads)
 
     def populate_displacement_table(self):
-        num_nodes = self.eq_matrix.shape[0]
-        self.ui.table_displacements.setColumnCount(4)
-        self.ui.table_displacements.setRowCount(num_nodes)
-        self.ui.table_displacements.setHorizontalHeaderLabels(["Node", "Ux (mm)", "Uy (mm)", "Rz (mrad)"])
-
-        for i in range(num_nodes):
-            id_item = QTableWidgetItem(str(i+1))
-            id_item.setTextAlignment(QtCore.Qt.AlignCenter)
-            id_item.setFlags(id_item.flags() & ~QtCore.Qt.ItemIsEditable)
-            self.ui.table_displacements.setItem(i, 0, id_item)
-
-            for j in range(3):
-                eq = self.eq_matrix[i, j]
-                if eq > 0:
-                    val = self.displacements[eq - 1][0]
-                    val *= 1000 if j < 2 else 1000  # mm or mrad
-                    item = QTableWidgetItem(f"{val:.3f}")
-                else:
-                    item = QTableWidgetItem("0.000")
-                item.setTextAlignment(QtCore.Qt.AlignCenter)
-                item.setFlags(item.flags() & ~QtCore.Qt.ItemIsEditable)
-                self.ui.table_displacements.setItem(i, j+1, item)
-
-        self.ui.table_displacements.resizeColumnsToContents()
-
-    def create_element_tabs(self):
-
-        index = self.ui.tabs_Results.indexOf(self.ui.tab_Element1)
-        self.ui.tabs_Results.removeTab(index)
-
-        from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout
-        import matplotlib.pyplot as plt
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-
-        for i, (n1, n2) in enumerate(self.elements):
-            tab = QWidget()
-            layout = QHBoxLayout(tab)
-
-            # === Left: Label panel ===
-            labels_layout = QVBoxLayout()
-            labels = {}
-
-            for key in (["Element", "Start Node Fx", "Start Node Fy", "Start Node M",
-                        "End Node Fx", "End Node Fy", "End Node M"]):
-                lbl = QLabel(f"{key}:")
-                lbl.setObjectName(f"label_{key.replace(' ', '_')}_{i}")
-                labels[key] = lbl
-                labels_layout.addWidget(lbl)
-
-            # Set values for labels
-            labels["Element"].setText(f"Element {i+1}")
-            forces = self.element_end_forces[f"Element {i+1}"]
-            labels["Start Node Fx"].setText(f"Fx: {forces[0]:.2f} kN")
-            labels["Start Node Fy"].setText(f"Fy: {forces[1]:.2f} kN")
-            labels["Start Node M"].setText(f"M: {forces[2]:.2f} kNm")
-            labels["End Node Fx"].setText(f"Fx: {forces[3]:.2f} kN")
-            labels["End Node Fy"].setText(f"Fy: {forces[4]:.2f} kN")
-            labels["End Node M"].setText(f"M: {forces[5]:.2f} kNm")
-
-            layout.addLayout(labels_layout)
-
-            # === Right: Drawing area ===
-            fig = plt.figure(figsize=(4, 4))
-            ax = fig.add_subplot(111)
-
-            # Dummy element line
-            x1, y1 = self.coords[n1 - 1]
-            x2, y2 = self.coords[n2 - 1]
-            ax.plot([x1, x2], [y1, y2], 'k-')
-            ax.set_title(f"Element {i+1}")
-            ax.axis("equal")
-
-            canvas = FigureCanvas(fig)
-            drawing_layout = QVBoxLayout()
-            drawing_layout.addWidget(canvas)
-            right_widget = QWidget()
-            right_widget.setLayout(drawing_layout)
-
-            layout.addWidget(right_widget)
-
-            # Add the tab
-            self.ui.tabs_Results.addTab(tab, f"Element {i+1}")
\ No newline at end of file
+        nodal_displacements = self.results.nodal_displacements[self.case_index] * 1000  # mm and mrad
+        node_ids = np.arange(1, self.eq_matrix.shape[0] + 1)
+        self.displacement_model = ResultsTableModel([
+            ("Node", node_ids, "{:d}"),
+            ("Ux (mm)", nodal_displacements[:, 0], "{:.3f}"),
+            ("Uy (mm)", nodal_displacements[:, 1], "{:.3f}"),
+            ("Rz (mrad)", nodal_displacements[:, 2], "{:.3f}"),
+        ], self)
+        attach_table(self.ui.table_displacements, self.displacement_model)
+        self.ui.table_displacements.setSortingEnabled(True)
+        self.ui.table_displacements.sortByColumn(0, QtCore.Qt.AscendingOrder)
+
+    def create_element_browser(self):
+        # One sortable element list and one detail panel; the panel is filled only for the selected element
+        forces = self.results.element_end_forces[self.case_index]
+        connectivity = np.asarray(self.elements, dtype=np.int64).reshape(-1, 2)
+        self.element_model = ResultsTableModel([
+            ("Element", np.arange(1, connectivity.shape[0] + 1), "{:d}"),
+            ("Start Node", connectivity[:, 0], "{:d}"),
+            ("End Node", connectivity[:, 1], "{:d}"),
+            ("Max |N| (kN)", np.maximum(np.abs(forces[:, 0]), np.abs(forces[:, 3])), "{:.2f}"),
+            ("Max |M| (kNm)", np.maximum(np.abs(forces[:, 2]), np.abs(forces[:, 5])), "{:.2f}"),
+        ], self)
+
+        table = self.ui.table_Elements
+        attach_table(table, self.element_model)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SingleSelection)
+        table.setSortingEnabled(True)
+        table.sortByColumn(0, QtCore.Qt.AscendingOrder)
+        table.selectionModel().currentRowChanged.connect(self.on_element_selected)
+        self.ui.lineEdit_SearchElement.textChanged.connect(self.filter_elements)
+
+        # The canvas and its N, V and M artists are created once and updated for every selection
+        self.element_figure = Figure(figsize=(4, 6), tight_layout=True)
+        self.element_axes = self.element_figure.subplots(3, 1, sharex=True)
+        self.element_lines = []
+        for ax, (_, label, unit) in zip(self.element_axes, DIAGRAMS):
+            ax.axhline(0.0, color='black', linewidth=1)
+            self.element_lines.append(ax.plot([], [], 'b-')[0])
+            ax.set_ylabel(f"{label.split()[-1]} ({unit})")
+        self.element_axes[-1].set_xlabel("x (m)")
+        self.element_canvas = FigureCanvas(self.element_figure)
+        self.element_canvas.setMinimumSize(250, 250)
+        layout = QVBoxLayout(self.ui.widget)
+        layout.addWidget(self.element_canvas)
+
+        if self.element_model.rowCount() > 0:
+            table.selectRow(0)
+
+    def filter_elements(self, text):
+        # An element ID, or a node ID to list the elements connected to that node
+        text = text.strip()
+        connectivity = np.asarray(self.elements, dtype=np.int64).reshape(-1, 2)
+        rows = np.arange(connectivity.shape[0])
+        if text.isdigit():
+            number = int(text)
+            rows = rows[(rows + 1 == number) | (connectivity[:, 0] == number) | (connectivity[:, 1] == number)]
+        self.element_model.setRows(rows)
+        if rows.shape[0] > 0:
+            self.ui.table_Elements.selectRow(0)
+
+    def on_element_selected(self, current, previous=None):
+        if not current.isValid():
+            return
+        self.show_element(self.element_model.arrayRow(current.row()))
+
+    def show_element(self, i):
+        n1, n2 = (int(n) for n in self.elements[i])
+        forces = self.results.element_end_forces[self.case_index, i]
+        displacements = self.results.nodal_displacements[self.case_index] * 1000
+
+        def displacement(node):
+            ux, uy, rz = displacements[node - 1]
+            return f"{ux:.3f} mm, {uy:.3f} mm, {rz:.3f} mrad"
+
+        self.ui.label_Element.setText(f"Element {i+1} (nodes {n1}-{n2})")
+        self.ui.label_StartNodeDisp.setText(f"Start Node Displacement: {displacement(n1)}")
+        self.ui.label_EndNodeDisp.setText(f"End Node Displacement: {displacement(n2)}")
+        self.ui.label_StartNodeFx.setText(f"Start Node Fx: {forces[0]:.2f} kN")
+        self.ui.label_StartNodeFy.setText(f"Start Node Fy: {forces[1]:.2f} kN")
+        self.ui.label_StartNodeM.setText(f"Start Node M: {forces[2]:.2f} kNm")
+        self.ui.label_EndNodeFx.setText(f"End Node Fx: {forces[3]:.2f} kN")
+        self.ui.label_EndNodeFy.setText(f"End Node Fy: {forces[4]:.2f} kN")
+        self.ui.label_EndNodeM.setText(f"End Node M: {forces[5]:.2f} kNm")
+
+        # Every station of the one element is drawn
+        length = np.hypot(*(self.coords[n2 - 1] - self.coords[n1 - 1]))
+        x = self.stations * length
+        for ax, line, (k, _, _) in zip(self.element_axes, self.element_lines, DIAGRAMS):
+            line.set_data(x, self.diagrams[i, :, k])
+            ax.relim()
+            ax.autoscale_view()
+        self.element_axes[0].set_title(f"Element {i+1}")
+        self.element_canvas.draw_idle()
+
+    def create_diagram_tab(self):
+        # N, V or M of the whole frame, drawn across the members, one quantity at a time
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        self.diagram_choice = QComboBox(tab)
+        self.diagram_choice.addItems([label for _, label, _ in DIAGRAMS])
+        layout.addWidget(self.diagram_choice)
+
+        self.diagram_figure = Figure()
+        ax = self.diagram_axes = self.diagram_figure.add_subplot(111)
+        ax.set_aspect('equal')
+        ax.axis('off')
+
+        coords = np.asarray(self.coords, dtype=float)
+        connectivity = np.asarray(self.elements, dtype=np.int64).reshape(-1, 2)
+        self.diagram_nodes = connectivity[:, 0] - 1, connectivity[:, 1] - 1
+        members = np.full((connectivity.shape[0], 3, 2), np.nan)
+        members[:, 0], members[:, 1] = coords[self.diagram_nodes[0]], coords[self.diagram_nodes[1]]
+        ax.plot(members[:, :, 0].ravel(), members[:, :, 1].ravel(), color='gray', linewidth=1)
+        self.diagram_line, = ax.plot([], [], color='tab:red', linewidth=1)
+
+        # Stations are thinned out on large frames so the whole diagram stays a few hundred thousand points
+        self.diagram_stations = display_stations(*self.diagrams.shape[:2])
+        extent = np.ptp(coords, axis=0).max() if coords.shape[0] else 0.0
+        self.diagram_extent = extent if extent > 0 else 1.0
+
+        self.diagram_canvas = FigureCanvas(self.diagram_figure)
+        layout.addWidget(self.diagram_canvas)
+        self.ui.tabs_Results.addTab(tab, "Diagrams")
+
+        self.diagram_choice.currentIndexChanged.connect(self.show_diagram)
+        self.show_diagram(0)
+
+    def show_diagram(self, index):
+        k, label, unit = DIAGRAMS[index]
+        values = self.diagrams[:, self.diagram_stations, k]
+        if k == 2:
+            values = -values  # moments are drawn on the tension side
+        largest = np.abs(values).max(initial=0.0)
+        scale = DIAGRAM_SIZE * self.diagram_extent / largest if largest > 0 else 0.0
+
+        x, y = diagram_polylines(self.coords, *self.diagram_nodes, values, self.stations[self.diagram_stations], scale)
+        self.diagram_line.set_data(x, y)
+        self.diagram_axes.set_title(f"{label}, largest {largest:.2f} {unit}")
+        self.diagram_axes.relim()
+        self.diagram_axes.autoscale_view()
+        self.diagram_canvas.draw_idle()
@@ -0,0 +1,127 @@
+import cProfile
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+logger = logging.getLogger(__name__)
+
+# Solver phases in the order FrameSolver.run() executes them; defined here so the GUI
+# can show progress without importing the solver
+PHASES = ("validation", "numbering", "assembly", "loads", "solve", "recovery")
+
+
+class AnalysisCancelled(Exception):
+    # Raised at the start of a phase once the cancel_event of the instrumentation is set
+    pass
+
+
+@dataclass
+class PhaseRecord:
+    """
+    Measurements of one solver phase.
+    peak_memory is the peak traced allocation in bytes above the level at the
+    start of the phase, or None when memory tracking is off.
+    sizes holds matrix shapes, nnz and byte counts reported by the phase.
+    """
+
+    name: str
+    seconds: float = 0.0
+    peak_memory: int = None
+    sizes: dict = field(default_factory=dict)
+
+    def describe(self):
+        memory = "" if self.peak_memory is None else f", peak {self.peak_memory / 2**20:.2f} MiB"
+        sizes = ", ".join(f"{key}={value}" for key, value in self.sizes.items())
+        return f"{self.name}: {self.seconds * 1000:.3f} ms{memory}" + (f" ({sizes})" if sizes else "")
+
+
+class SolverInstrumentation:
+    """
+    Records wall time, peak memory and matrix sizes for each solver phase and
+    emits one log record per phase at log_level.
+
+    track_memory: trace allocations with tracemalloc (slows the solve down)
+    profile:      run the whole analysis under cProfile; True keeps the text
+                  report in profile_report, a path also dumps the raw stats there
+    progress:     callable(name, record), called with record None when a phase
+                  starts and with its PhaseRecord when it finishes
+    cancel_event: threading.Event; once set, the next phase raises AnalysisCancelled
+    """
+
+    def __init__(self, log_level=logging.INFO, track_memory=False, profile=False, progress=None, cancel_event=None):
+        self.log_level = log_level
+        self.track_memory = track_memory
+        self.profile = profile
+        self.progress = progress
+        self.cancel_event = cancel_event
+        self.phases = []
+        self.profile_report = None
+        self._profiler = None
+
+    def reset(self):
+        self.phases = []
+        self.profile_report = None
+
+    @contextmanager
+    def phase(self, name):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise AnalysisCancelled(f"Analysis cancelled before the {name} phase")
+        if self.progress is not None:
+            self.progress(name, None)
+
+        record = PhaseRecord(name)
+        started_tracing = False
+
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            if self.track_memory:
+                record.peak_memory = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+                if started_tracing:
+                    tracemalloc.stop()
+
+            self.phases.append(record)
+            logger.log(self.log_level, "Phase %s", record.describe())
+            if self.progress is not None:
+                self.progress(name, record)
+
+    @contextmanager
+    def profiled(self):
+        # Opt-in cProfile hook around a complete analysis
+        if not self.profile:
+            yield
+            return
+
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+        try:
+            yield
+        finally:
+            self._profiler.disable()
+
+            report = io.StringIO()
+            stats = pstats.Stats(self._profiler, stream=report)
+            stats.sort_stats("cumulative").print_stats(25)
+            self.profile_report = report.getvalue()
+
+            if isinstance(self.profile, str):
+                stats.dump_stats(self.profile)
+            logger.log(self.log_level, "Profile:\n%s", self.profile_report)
+            self._profiler = None
+
+    def total_seconds(self):
+        return sum(record.seconds for record in self.phases)
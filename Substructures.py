@@ -0,0 +1,233 @@
+"""
+Substructuring by static condensation.
+
+A substructure is a named group of elements, model.addSubstructure("storey 3", element_ids).
+Its interior nodes, the nodes connected to its own elements only, are condensed out of
+the global system: the substructure acts as one superelement with a dense stiffness on
+its boundary DOFs, and K_global only holds the boundary DOFs and the DOFs of elements
+outside any substructure. After the reduced solve the interior displacements are
+recovered, so the results cover every node and element as in an ordinary analysis.
+
+Substructures that match up to a translation (same element pattern, relative geometry,
+properties and restraints) share one Superelement, which is condensed only once. The
+distinct superelements are condensed on a thread pool; the dense LAPACK and BLAS calls
+release the GIL, so they run on all cores.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+
+GEOMETRY_DECIMALS = 9  # relative coordinates are rounded before comparing, so translated copies match
+
+
+class Superelement:
+    """
+    Condensed stiffness of one substructure pattern, with local DOFs numbered interior first.
+
+    stiffness: (n_b, n_b) K_bb - K_bi K_ii^-1 K_ib on the boundary DOFs
+    transfer:  (n_i, n_b) K_ii^-1 K_ib, minus the interior displacements per unit boundary displacement
+    """
+
+    def __init__(self, k_elements, local_dofs, interior_count):
+        size = int(local_dofs.max())
+        ni = interior_count
+
+        # Row and column 0 collect the entries of restrained DOFs, as equation number 0 does globally
+        K = np.zeros((size + 1, size + 1))
+        np.add.at(K, (np.repeat(local_dofs, 6, axis=1), np.tile(local_dofs, (1, 6))), k_elements.reshape(-1, 36))
+        K = K[1:, 1:]
+
+        self.interior_factor = cho_factor(K[:ni, :ni], lower=False)
+        self.transfer = cho_solve(self.interior_factor, K[:ni, ni:])
+        stiffness = K[ni:, ni:] - K[ni:, :ni] @ self.transfer
+        self.stiffness = (stiffness + stiffness.T) / 2
+
+    @property
+    def interior_count(self):
+        return self.transfer.shape[0]
+
+    @property
+    def boundary_count(self):
+        return self.transfer.shape[1]
+
+    @property
+    def nnz(self):
+        return self.interior_factor[0].size + self.transfer.size + self.stiffness.size
+
+    def interior_solve(self, F):
+        # K_ii^-1 F for a (copies, n_i, n_cases) block of interior loads
+        copies, ni, cases = F.shape
+        X = cho_solve(self.interior_factor, F.transpose(1, 0, 2).reshape(ni, -1))
+        return X.reshape(ni, copies, cases).transpose(1, 0, 2)
+
+
+@dataclass
+class SuperelementGroup:
+    # All copies of one substructure pattern; equation arrays are zero-based, one row per copy
+    names: list
+    elements: np.ndarray  # element indices of the first copy
+    local_dofs: np.ndarray  # (n_elem, 6) local equation numbers of the first copy, 0 for restrained DOFs
+    interior_count: int
+    interior: list = field(default_factory=list)  # full equation numbers of the interior DOFs
+    boundary: list = field(default_factory=list)  # full equation numbers of the boundary DOFs
+    reduced_boundary: np.ndarray = None  # boundary equation numbers in K_global
+    superelement: Superelement = None
+
+
+class StaticCondensation:
+    """
+    Finds the substructures of a model, condenses every distinct one and maps between the
+    full equation numbering E and the reduced numbering of K_global.
+
+    free_elements: element indices outside any substructure, assembled into K_global as usual
+    retained:      full equation numbers (zero-based) that stay in K_global, in reduced order
+    """
+
+    def __init__(self, model, kernels, E, workers=None):
+        coords = np.asarray(model.node_coordinates, dtype=float)
+        properties = np.asarray(model.element_properties, dtype=float).reshape(-1, 3)
+        num_eq = int(E.max()) if E.size else 0
+
+        names = list(model.substructures)
+        owner = np.full(kernels.count, -1)
+        for k, name in enumerate(names):
+            owner[np.asarray(model.substructures[name], dtype=int) - 1] = k
+
+        # Interior nodes are connected to elements of a single substructure only
+        topology = model.topology()
+        lowest = topology.reduce_at_nodes(np.minimum, owner, -1)
+        highest = topology.reduce_at_nodes(np.maximum, owner, -1)
+        interior_node = (lowest == highest) & (highest >= 0)
+
+        order = np.argsort(owner, kind="stable")
+        bounds = np.searchsorted(owner[order], np.arange(len(names) + 1))
+        free = [order[:bounds[0]]]
+
+        groups = {}
+        for k, name in enumerate(names):
+            elements = order[bounds[k]:bounds[k + 1]]
+            n1, n2 = kernels.n1[elements], kernels.n2[elements]
+            nodes = np.unique(np.concatenate((n1, n2)))
+            local_nodes = np.concatenate((nodes[interior_node[nodes]], nodes[~interior_node[nodes]]))
+
+            numbered = E[local_nodes] != 0
+            local_E = np.cumsum(numbered.ravel()).reshape(numbered.shape) * numbered
+            interior_count = int(numbered[:np.count_nonzero(interior_node[nodes])].sum())
+            if interior_count == 0:
+                # Nothing to condense; the elements are assembled as ordinary ones
+                free.append(elements)
+                continue
+
+            sorter = np.argsort(local_nodes)
+            p1 = sorter[np.searchsorted(local_nodes, n1, sorter=sorter)]
+            p2 = sorter[np.searchsorted(local_nodes, n2, sorter=sorter)]
+            local_dofs = np.hstack((local_E[p1], local_E[p2]))
+
+            relative = np.round(coords[local_nodes] - coords[local_nodes[0]], GEOMETRY_DECIMALS) + 0.0
+            key = (interior_count, local_nodes.shape[0], elements.shape[0], p1.tobytes(), p2.tobytes(),
+                   local_dofs.tobytes(), relative.tobytes(), properties[elements].tobytes())
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = SuperelementGroup([], elements, local_dofs, interior_count)
+
+            equations = E[local_nodes][numbered] - 1
+            group.names.append(name)
+            group.interior.append(equations[:interior_count])
+            group.boundary.append(equations[interior_count:])
+
+        self.groups = list(groups.values())
+        self.free_elements = np.sort(np.concatenate(free))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            superelements = list(pool.map(lambda group: self._condense(kernels, group), self.groups))
+        for group, superelement in zip(self.groups, superelements):
+            group.superelement = superelement
+            group.interior = np.array(group.interior, dtype=np.int64).reshape(len(group.names), -1)
+            group.boundary = np.array(group.boundary, dtype=np.int64).reshape(len(group.names), -1)
+
+        keep = np.ones(num_eq, dtype=bool)
+        for group in self.groups:
+            keep[group.interior.ravel()] = False
+        self.num_eq = num_eq
+        self.retained = np.flatnonzero(keep)
+        self.reduced_index = np.full(num_eq, -1)
+        self.reduced_index[self.retained] = np.arange(self.retained.shape[0])
+        for group in self.groups:
+            group.reduced_boundary = self.reduced_index[group.boundary]
+
+    @staticmethod
+    def _condense(kernels, group):
+        try:
+            return Superelement(kernels.global_stiffness_matrices(group.elements), group.local_dofs,
+                                group.interior_count)
+        except LinAlgError:
+            raise ValueError(f"substructure '{group.names[0]}' is unstable with its boundary nodes fixed") from None
+
+    @property
+    def reduced_size(self):
+        return self.retained.shape[0]
+
+    def sizes(self):
+        # Counts for the assembly phase record
+        return {"substructures": sum(len(group.names) for group in self.groups),
+                "superelements": len(self.groups),
+                "condensed_eq": self.num_eq - self.reduced_size}
+
+    def reduce(self, rows, cols, vals):
+        """
+        Maps COO triplets of the free elements (full zero-based numbering) to the reduced
+        numbering and appends the condensed stiffness of every substructure copy.
+        """
+        rows, cols, vals = [self.reduced_index[rows]], [self.reduced_index[cols]], [vals]
+        for group in self.groups:
+            boundary = group.reduced_boundary
+            nb = boundary.shape[1]
+            rows.append(np.repeat(boundary, nb, axis=1).ravel())
+            cols.append(np.tile(boundary, (1, nb)).ravel())
+            vals.append(np.tile(group.superelement.stiffness.ravel(), boundary.shape[0]))
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(vals)
+
+    def factorization(self, reduced):
+        return CondensedFactorization(self, reduced)
+
+
+class CondensedFactorization:
+    """
+    Solves the full system K U = F with the factorization of the reduced K_global:
+    interior loads are condensed onto the boundary, the reduced system is solved and
+    the interior displacements are recovered, copy by copy in batches per superelement.
+    """
+
+    def __init__(self, condensation, reduced):
+        self.condensation = condensation
+        self.reduced = reduced
+        self.method = reduced.method
+        self.size = condensation.num_eq
+
+    @property
+    def nnz(self):
+        return self.reduced.nnz + sum(group.superelement.nnz for group in self.condensation.groups)
+
+    def solve(self, F):
+        F = np.asarray(F, dtype=float)
+        F_full = F.reshape(self.size, -1)
+        condensation = self.condensation
+
+        F_reduced = F_full[condensation.retained]
+        interior_loads = []
+        for group in condensation.groups:
+            F_i = F_full[group.interior]  # (copies, n_i, n_cases)
+            interior_loads.append(F_i)
+            np.subtract.at(F_reduced, group.reduced_boundary,
+                           np.einsum('ib,mic->mbc', group.superelement.transfer, F_i))
+
+        U = np.zeros(F_full.shape)
+        U[condensation.retained] = self.reduced.solve(F_reduced).reshape(condensation.reduced_size, -1)
+        for group, F_i in zip(condensation.groups, interior_loads):
+            superelement = group.superelement
+            U[group.interior] = (superelement.interior_solve(F_i)
+                                 - np.einsum('ib,mbc->mic', superelement.transfer, U[group.boundary]))
+        return U.reshape(F.shape)
@@ -0,0 +1,48 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+
+
+class ValidationPanel(QWidget):
+    """
+    Non-modal window listing every problem of a ValidationReport.
+    With table views given as {table name: QTableView}, double-clicking a problem selects its row.
+    """
+
+    def __init__(self, tables=None, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.tables = tables or {}
+        self.setWindowTitle("Model Check")
+        self.resize(520, 360)
+
+        layout = QVBoxLayout(self)
+        self.label_Summary = QLabel()
+        self.list_Issues = QListWidget()
+        self.list_Issues.setUniformItemSizes(True)
+        self.list_Issues.itemDoubleClicked.connect(self.select_row)
+        layout.addWidget(self.label_Summary)
+        layout.addWidget(self.list_Issues)
+
+    def show_report(self, report):
+        self.list_Issues.clear()
+        shown = len(report.issues)
+        more = f" (first {shown} listed)" if report.issue_count > shown else ""
+        self.label_Summary.setText(f"The model has {report.issue_count} problem(s){more}. "
+                                   f"Fix them and run again; double-click a problem to go to its row.")
+
+        for issue in report.issues:
+            item = QListWidgetItem(str(issue))
+            item.setData(Qt.UserRole, (issue.table, issue.row))
+            self.list_Issues.addItem(item)
+
+        self.show()
+        self.raise_()
+
+    def select_row(self, item):
+        table, row = item.data(Qt.UserRole)
+        view = self.tables.get(table)
+        if view is None or row == 0:
+            return
+        index = view.model().index(row - 1, 0)
+        view.selectRow(row - 1)
+        view.scrollTo(index)
+        view.window().activateWindow()
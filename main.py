@@ -1,9 +1,29 @@
+import time
+
+STARTED = time.perf_counter()  # startup is measured from here; interpreter start-up comes before it
+
+import argparse
+import importlib
+import logging
 import sys
+import threading
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox
 from MenuWindow import Ui_MenuWindow
 
-# Import the two new windows
-from PreFrameProperties import PreFrameProperties
+# The frame calculator windows, matplotlib and the solver are imported on first use,
+# so the menu appears after PyQt5 alone has loaded. Once it is shown they are warmed up
+# on a background thread, in this order, unless --no-warm-up is given.
+WARM_UP_MODULES = (
+    "PreFrameProperties",
+    "MainFrameProperties",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_qt5agg",
+    "FrameSolver",
+    "ShowResults",
+)
+
+logger = logging.getLogger(__name__)
 
 
 class MainApp(QMainWindow):
@@ -22,6 +42,8 @@ class MainApp(QMainWindow):
         self.ui.button_Exit.clicked.connect(self.close)
 
     def open_frame_calculator(self):
+        from PreFrameProperties import PreFrameProperties
+
         if self.frame_window is None:
             self.frame_window = PreFrameProperties()
         self.frame_window.show()
@@ -36,8 +58,81 @@ class MainApp(QMainWindow):
         " accurate and efficient results. Please stay tuned for upcoming updates. ", QMessageBox.Ok)
 
 
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
+def import_modules(names):
+    """
+    Imports the modules in order and returns (name, seconds, newly loaded module count)
+    for each. A module that is already loaded costs nothing, so the times add up to the
+    cost of loading them all.
+    """
+    timings = []
+    for name in names:
+        loaded = len(sys.modules)
+        start = time.perf_counter()
+        importlib.import_module(name)
+        timings.append((name, time.perf_counter() - start, len(sys.modules) - loaded))
+    return timings
+
+
+def warm_up():
+    # Daemon thread: an unfinished warm-up never keeps the application from exiting
+    def run():
+        try:
+            timings = import_modules(WARM_UP_MODULES)
+        except Exception:
+            logger.exception("Warm-up import failed")
+        else:
+            logger.debug("Warm-up finished in %.0f ms", sum(seconds for _, seconds, _ in timings) * 1000)
+
+    threading.Thread(target=run, name="warm-up", daemon=True).start()
+
+
+def report_startup(stages, app):
+    """
+    Prints the time to each startup stage, then imports the deferred modules one by one
+    on the main thread and prints what each adds, and quits. For the full per-module tree
+    run the same command under python -X importtime.
+    """
+    print(f"{'stage':<36} {'ms':>9}")
+    for name, seconds in stages:
+        print(f"{name:<36} {seconds * 1000:>9.1f}")
+
+    print()
+    print(f"{'deferred import':<36} {'ms':>9} {'modules':>8}")
+    timings = import_modules(WARM_UP_MODULES)
+    for name, seconds, count in timings:
+        print(f"{name:<36} {seconds * 1000:>9.1f} {count:>8}")
+    print(f"{'total':<36} {sum(seconds for _, seconds, _ in timings) * 1000:>9.1f}")
+    app.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Structure solver study application.")
+    parser.add_argument("--startup-time", action="store_true",
+                        help="print the startup time of each stage and deferred import, then exit")
+    parser.add_argument("--no-warm-up", action="store_true",
+                        help="do not import the calculator modules in the background after the menu appears")
+    args, qt_args = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+
+    # Solver phase timings are reported through logging
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+
+    stages = [("imports", time.perf_counter() - STARTED)]
+    app = QApplication(sys.argv[:1] + qt_args)
+    stages.append(("application", time.perf_counter() - STARTED))
     window = MainApp()
+    stages.append(("menu window", time.perf_counter() - STARTED))
     window.show()
-    sys.exit(app.exec_())
+
+    # A zero timer fires once the event loop runs, after the menu has been shown
+    if args.startup_time:
+        def shown():
+            stages.append(("menu shown", time.perf_counter() - STARTED))
+            report_startup(stages, app)
+        QTimer.singleShot(0, shown)
+    elif not args.no_warm_up:
+        QTimer.singleShot(0, warm_up)
+    return app.exec_()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,25 @@
+import os
+
+import numpy as np
+
+from BatchRunner import model_names, run_batch
+from FrameGenerators import frame_of_size
+from ModelIO import save_model
+
+
+def test_models_with_the_same_stem_keep_separate_results(tmp_path):
+    model = frame_of_size("portal", 20)
+    files = [tmp_path / "in" / "m.json", tmp_path / "in" / "m.npz", tmp_path / "other" / "m.json"]
+    for path in files:
+        path.parent.mkdir(exist_ok=True)
+        save_model(model, str(path))
+
+    assert model_names([str(path) for path in files]) == ["in/m.json", "in/m.npz", "other/m.json"]
+
+    rows, _ = run_batch([str(path) for path in files], str(tmp_path / "out"), workers=2)
+    assert [row["model"] for row in rows] == ["in/m.json", "in/m.npz", "other/m.json"]
+    assert all(row["status"] == "ok" for row in rows)
+    outputs = [row["output"] for row in rows]
+    assert len(set(outputs)) == 3 and all(os.path.exists(output) for output in outputs)
+    assert outputs[1].endswith(os.path.join("in", "m.npz.results.npz"))
+    np.testing.assert_array_equal(np.load(outputs[0])["nodal_displacements"], np.load(outputs[2])["nodal_displacements"])
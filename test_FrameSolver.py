@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from FrameGenerators import frame_of_size
+from FrameModelData import FrameModelData
+from FrameSolver import FrameSolver
+from IterativeSolver import PRECONDITIONERS, PCGSolver
+
+
+def fixed_beam(length=6.0, load=-10.0):
+    # Both ends fully restrained, so the model has no equations; only the member load acts
+    model = FrameModelData(2, 1, 2, 0)
+    model.node_coordinates[:] = [[0.0, 0.0], [length, 0.0]]
+    model.element_connectivity[:] = [[1, 2]]
+    model.element_properties[:] = [[0.02, 2e-4, 2e8]]
+    model.support_conditions[:] = [[1, 1, 1, 1], [2, 1, 1, 1]]
+    model.addUniformLoad([1], load)
+    return model
+
+
+@pytest.mark.parametrize("method", FrameSolver.METHODS)
+def test_fully_restrained(method):
+    solver = FrameSolver(fixed_beam(), method=method)
+    results = solver.run()
+
+    assert solver.num_eq == 0
+    assert solver.displacements.shape == (0, 1)
+    # Fixed-end forces of a uniform load: V = wL/2, M = wL^2/12
+    np.testing.assert_allclose(results.element_end_forces[0, 0], [0.0, 30.0, 30.0, 0.0, 30.0, -30.0])
+    np.testing.assert_allclose(results.reactions[0, 0], [0.0, 30.0, 30.0])
+
+    # Further cases reuse the empty factorization
+    rows = fixed_beam(load=-20.0).member_loads["Default"]
+    U, forces = solver.solve_load_cases({"Twice": np.zeros((0, 4))}, {"Twice": rows})
+    assert U.shape == (0, 1)
+    np.testing.assert_allclose(forces[0, 0], [0.0, 60.0, 60.0, 0.0, 60.0, -60.0])
+
+
+@pytest.mark.parametrize("preconditioner", PRECONDITIONERS)
+@pytest.mark.parametrize("matrix_free", [False, True])
+def test_pcg_fully_restrained(preconditioner, matrix_free):
+    solver = FrameSolver(fixed_beam(), method="pcg", preconditioner=preconditioner, matrix_free=matrix_free)
+    results = solver.run()
+
+    assert solver.displacements.shape == (0, 1)
+    np.testing.assert_allclose(results.element_end_forces[0, 0], [0.0, 30.0, 30.0, 0.0, 30.0, -30.0])
+
+
+def update_path(results):
+    return next(record.sizes["path"] for record in results.phases if record.name == "update")
+
+
+def assert_same_results(results, expected, method="sparse"):
+    # Two PCG solves agree only to about their convergence tolerance
+    rtol = 1e-5 if method == "pcg" else 1e-8
+    np.testing.assert_allclose(results.nodal_displacements, expected.nodal_displacements, rtol=rtol, atol=1e-12)
+    np.testing.assert_allclose(results.element_end_forces, expected.element_end_forces, rtol=rtol, atol=1e-8)
+
+
+@pytest.mark.parametrize("method", ["sparse", "dense", "banded"])
+def test_reanalyze_low_rank(method):
+    solver = FrameSolver(frame_of_size("portal", 200), method=method)
+    solver.run()
+    solver.factor_seconds = float("inf")  # the Woodbury update always looks cheaper than a new factorization
+
+    solver.model.element_properties[[3, 40], 1] *= 3.0
+    results = solver.reanalyze()
+    assert update_path(results) == "low-rank"
+    assert_same_results(results, FrameSolver(solver.model.copy(), method=method).run(), method)
+
+    # A second edit is accumulated onto the same base factorization
+    solver.model.element_properties[[7], 2] *= 0.5
+    results = solver.reanalyze()
+    assert update_path(results) == "low-rank"
+    assert_same_results(results, FrameSolver(solver.model.copy(), method=method).run(), method)
+
+
+@pytest.mark.parametrize("method", FrameSolver.METHODS)
+def test_reanalyze_refactor(method):
+    solver = FrameSolver(frame_of_size("portal", 200), method=method)
+    solver.run()
+
+    solver.model.element_properties[[3, 40, 41], 0] *= 2.0
+    results = solver.reanalyze(max_update_rank=0)
+    assert update_path(results) == "refactor"
+    assert_same_results(results, FrameSolver(solver.model.copy(), method=method).run(), method)
+
+
+@pytest.mark.parametrize("method", FrameSolver.METHODS)
+def test_reanalyze_loads(method):
+    solver = FrameSolver(frame_of_size("portal", 200), method=method)
+    solver.run()
+
+    solver.model.force_conditions[:, 1] += 5.0
+    solver.model.addUniformLoad([1, 2, 3], -4.0)
+    results = solver.reanalyze()
+    assert update_path(results) == "loads"
+    assert_same_results(results, FrameSolver(solver.model.copy(), method=method).run(), method)
+
+
+def test_reanalyze_unchanged_and_full():
+    solver = FrameSolver(frame_of_size("portal", 200))
+    first = solver.run()
+    assert update_path(solver.reanalyze()) == "unchanged"
+
+    solver.model.node_coordinates[-1, 0] += 0.5
+    results = solver.reanalyze()
+    assert update_path(results) == "full"
+    assert_same_results(results, FrameSolver(solver.model.copy()).run())
+    assert not np.allclose(results.nodal_displacements, first.nodal_displacements)
+
+
+@pytest.mark.parametrize("preconditioner", PRECONDITIONERS)
+def test_preconditioners_are_symmetric_positive_definite(preconditioner):
+    solver = FrameSolver(frame_of_size("random", 300))
+    solver.run()
+    groups = np.where(solver.E > 0, solver.E - 1, -1)
+    M = PCGSolver(solver.K_global, preconditioner, groups=groups).precondition(np.eye(solver.num_eq))
+    np.testing.assert_allclose(M, M.T, rtol=0, atol=1e-12 * np.abs(M).max())
+    assert np.linalg.eigvalsh((M + M.T) / 2).min() > 0
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+import LoadCombinations
+from FrameGenerators import portal_frame
+from FrameSolver import FrameSolver
+from LoadCombinations import combine, envelope
+
+
+COMBINATIONS = {
+    "1.4D": {"D": 1.4},
+    "1.2D+1.6L": {"D": 1.2, "L": 1.6},
+    "1.2D+1.0W": {"D": 1.2, "W": 1.0},
+    "0.9D-1.0W": {"D": 0.9, "W": -1.0},
+}
+
+
+def three_case_model():
+    model = portal_frame(3, 2)
+    beam_nodes = model.force_conditions[:, 0]
+    model.addLoadCase("D", np.column_stack((beam_nodes, 0 * beam_nodes, -20.0 + 0 * beam_nodes, 0 * beam_nodes)))
+    model.addLoadCase("L", np.column_stack((beam_nodes, 0 * beam_nodes, -12.0 + 0 * beam_nodes, 0 * beam_nodes)))
+    model.addLoadCase("W", [[4, 15.0, 0.0, 0.0], [7, 15.0, 0.0, 0.0], [10, 15.0, 0.0, 0.0]])
+    model.addUniformLoad([10, 11], -5.0, "global Y", case="L")
+    for name, factors in COMBINATIONS.items():
+        model.addLoadCombination(name, factors)
+    return model
+
+
+def test_combination_equals_solving_the_factored_loads():
+    model = three_case_model()
+    combined = combine(FrameSolver(model).run(), model.load_combinations)
+
+    # 1.2D + 1.6L solved directly as one load case, member loads included
+    direct = model.copy()
+    direct.load_cases = {"1.2D+1.6L": np.vstack((direct.load_cases["D"] * [1, 1.2, 1.2, 1.2],
+                                                  direct.load_cases["L"] * [1, 1.6, 1.6, 1.6]))}
+    direct.member_loads = {"1.2D+1.6L": direct.member_loads["L"] * [1, 1, 1, 1.6, 1.6, 1, 1]}
+    direct.load_combinations = {}
+    expected = FrameSolver(direct).run()
+
+    k = combined.combination_index("1.2D+1.6L")
+    np.testing.assert_allclose(combined.nodal_displacements[k], expected.nodal_displacements[0], rtol=1e-10, atol=1e-14)
+    np.testing.assert_allclose(combined.element_end_forces[k], expected.element_end_forces[0], rtol=1e-10, atol=1e-9)
+
+
+@pytest.mark.parametrize("chunk_bytes", [LoadCombinations.CHUNK_BYTES, 1])
+def test_envelope_matches_every_combination(monkeypatch, chunk_bytes):
+    monkeypatch.setattr(LoadCombinations, "CHUNK_BYTES", chunk_bytes)  # 1 byte: one combination per chunk
+    model = three_case_model()
+    results = FrameSolver(model).run()
+    combined = combine(results, model.load_combinations)
+    names = np.array(list(COMBINATIONS), dtype=object)
+
+    for quantity, bounds in envelope(results, model.load_combinations).items():
+        values = getattr(combined, quantity)
+        np.testing.assert_allclose(bounds.maximum, values.max(axis=0), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(bounds.minimum, values.min(axis=0), rtol=1e-12, atol=1e-12)
+
+        # The governing combination of every value is one that reaches the bound
+        at_max = np.take_along_axis(values, bounds.max_combination[None], axis=0)[0]
+        at_min = np.take_along_axis(values, bounds.min_combination[None], axis=0)[0]
+        np.testing.assert_allclose(at_max, values.max(axis=0), rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(at_min, values.min(axis=0), rtol=1e-12, atol=1e-12)
+        np.testing.assert_array_equal(bounds.governing("max"), names[bounds.max_combination])
+        np.testing.assert_array_equal(bounds.governing("min"), names[bounds.min_combination])
+        assert len(set(bounds.governing("max").ravel())) > 1  # the cases really compete
+
+
+def test_envelope_ties_go_to_the_earlier_combination():
+    model = three_case_model()
+    model.load_combinations = {}
+    model.addLoadCombination("first", {"D": 1.0})
+    model.addLoadCombination("same", {"D": 1.0})
+    forces = envelope(FrameSolver(model).run(), model.load_combinations)["element_end_forces"]
+    assert (forces.governing("max") == "first").all() and (forces.governing("min") == "first").all()
+
+
+def test_envelope_errors():
+    model = three_case_model()
+    results = FrameSolver(model).run()
+    with pytest.raises(ValueError, match="no load combinations"):
+        envelope(results, {})
+    with pytest.raises(ValueError, match="load case 'S'"):
+        envelope(results, {"snow": {"S": 1.0}})
+    with pytest.raises(ValueError, match="Unknown extreme"):
+        envelope(results, model.load_combinations)["reactions"].governing("largest")
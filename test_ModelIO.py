@@ -0,0 +1,93 @@
+import mmap
+
+import numpy as np
+import pytest
+
+from FrameGenerators import storey_frame
+from FrameSolver import FrameSolver
+from ModelIO import load_model, save_model, save_results
+
+
+def full_model():
+    # Every part a model file stores: arrays, named load cases, member loads, combinations, substructures
+    model = storey_frame(3, 2)
+    model.addLoadCase("D", model.force_conditions)
+    model.addLoadCase("W", [[4, 12.5, 0.0, 0.0], [7, 12.5, 0.0, -3.0]])
+    model.addUniformLoad([1, 2, 3], -4.0, "global Y", case="D")
+    model.addPointLoad([5], 7.0, 0.25, case="W")
+    model.addLoadCombination("1.2D+1.0W", {"D": 1.2, "W": 1.0})
+    model.addLoadCombination("0.9D", {"D": 0.9})
+    return model
+
+
+def is_memory_mapped(array):
+    while array is not None and not isinstance(array, mmap.mmap):
+        array = getattr(array, "base", None)
+    return array is not None
+
+
+def assert_same_model(loaded, model):
+    for name in ("node_coordinates", "element_connectivity", "element_properties",
+                 "support_conditions", "force_conditions"):
+        expected = getattr(model, name)
+        actual = getattr(loaded, name)
+        assert actual.dtype == expected.dtype, name
+        np.testing.assert_array_equal(actual, expected, err_msg=name)
+    for mapping in ("load_cases", "member_loads", "substructures"):
+        actual, expected = getattr(loaded, mapping), getattr(model, mapping)
+        assert list(actual) == list(expected), mapping
+        for name in expected:
+            np.testing.assert_array_equal(actual[name], expected[name], err_msg=f"{mapping}[{name}]")
+    assert loaded.load_combinations == model.load_combinations
+
+
+@pytest.mark.parametrize("file_name, mmap_mode", [("m.frame", True), ("m.frame", False), ("m.npz", None),
+                                                  ("m.json", None)])
+def test_round_trip(tmp_path, file_name, mmap_mode):
+    model = full_model()
+    path = str(tmp_path / file_name)
+    save_model(model, path)
+
+    loaded = load_model(path, mmap=mmap_mode) if mmap_mode is not None else load_model(path)
+    assert_same_model(loaded, model)
+
+    expected = FrameSolver(model).run()
+    results = FrameSolver(loaded).run()
+    assert results.load_case_names == expected.load_case_names
+    np.testing.assert_array_equal(results.nodal_displacements, expected.nodal_displacements)
+    np.testing.assert_array_equal(results.element_end_forces, expected.element_end_forces)
+
+
+@pytest.mark.parametrize("file_name", ["m.frame", "m.npz"])
+def test_float32_properties_stay_float32(tmp_path, file_name):
+    model = full_model()
+    model.element_properties = model.element_properties.astype(np.float32)
+    path = str(tmp_path / file_name)
+    save_model(model, path)
+    assert_same_model(load_model(path), model)
+
+
+def test_frame_directory_is_memory_mapped_copy_on_write(tmp_path):
+    model = full_model()
+    path = str(tmp_path / "m.frame")
+    save_model(model, path)
+
+    loaded = load_model(path)
+    assert is_memory_mapped(loaded.node_coordinates) and is_memory_mapped(loaded.element_properties)
+    assert not is_memory_mapped(load_model(path, mmap=False).node_coordinates)
+    loaded.node_coordinates[0, 0] = 99.0  # edits stay in memory
+    np.testing.assert_array_equal(load_model(path).node_coordinates, model.node_coordinates)
+
+
+def test_results_with_envelopes(tmp_path):
+    model = full_model()
+    results = FrameSolver(model).run()
+    path = str(tmp_path / "m.results.npz")
+    save_results(results, path, model.load_combinations)
+
+    with np.load(path) as archive:
+        np.testing.assert_array_equal(archive["nodal_displacements"], results.nodal_displacements)
+        assert archive["combination_names"].tolist() == ["1.2D+1.0W", "0.9D"]
+        combined = 1.2 * results.element_end_forces[0] + 1.0 * results.element_end_forces[1]
+        np.testing.assert_allclose(archive["element_end_forces_max"],
+                                   np.maximum(combined, 0.9 * results.element_end_forces[0]), rtol=1e-12, atol=1e-12)
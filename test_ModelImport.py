@@ -0,0 +1,16 @@
+import numpy as np
+
+from ModelImport import ImportReport, read_table
+
+
+def test_jsonl_record_without_a_column_in_a_later_chunk(tmp_path):
+    path = tmp_path / "nodes.jsonl"
+    path.write_text('{"x":0,"y":0}\n{"x":1,"y":0}\n{"x":2}\n{"x":3,"y":1}\n')
+    report = ImportReport()
+
+    nodes = read_table(str(path), "nodes", report, chunk_size=2)
+
+    np.testing.assert_array_equal(nodes["x"], [0, 1, 2, 3])
+    np.testing.assert_array_equal(nodes["y"], [0, 0, np.nan, 1])
+    assert [(issue.table, issue.row, issue.column, issue.message) for issue in report.issues] == \
+        [("nodes", 3, "y", "missing value")]
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from FrameGenerators import storey_frame
+from FrameSolver import FrameSolver
+
+
+def assert_same_results(results, expected):
+    np.testing.assert_allclose(results.nodal_displacements, expected.nodal_displacements, rtol=1e-8, atol=1e-12)
+    np.testing.assert_allclose(results.element_end_forces, expected.element_end_forces, rtol=1e-8, atol=1e-8)
+    np.testing.assert_allclose(results.reactions, expected.reactions, rtol=1e-8, atol=1e-8)
+
+
+def plain_results(model, method="sparse"):
+    plain = model.copy()
+    plain.substructures = {}
+    return FrameSolver(plain, method=method).run()
+
+
+@pytest.mark.parametrize("method", ["sparse", "dense", "banded"])
+def test_condensed_model_matches_the_plain_model(method):
+    model = storey_frame(6, 3)
+    solver = FrameSolver(model, method=method)
+    results = solver.run()
+
+    # The four middle storeys are identical and share one superelement
+    sizes = solver.condensation.sizes()
+    assert sizes["substructures"] == 6 and sizes["superelements"] == 3
+    assert solver.K_global.shape[0] < solver.num_eq
+    assert_same_results(results, plain_results(model, method))
+
+
+def test_changed_member_gets_its_own_superelement():
+    model = storey_frame(6, 3)
+    storey = model.substructures["storey 3"]
+
+    model.element_properties[storey[0] - 1, 1] *= 2.0
+    solver = FrameSolver(model)
+    results = solver.run()
+    assert solver.condensation.sizes()["superelements"] == 4
+    assert_same_results(results, plain_results(model))
+
+    # An interior node moved within one storey separates it from the others as well
+    moved = storey_frame(6, 3)
+    interior = moved.element_connectivity[moved.substructures["storey 4"][0] - 1, 1]
+    moved.node_coordinates[interior - 1, 0] += 0.01
+    solver = FrameSolver(moved)
+    results = solver.run()
+    assert solver.condensation.sizes()["superelements"] == 4
+    assert_same_results(results, plain_results(moved))
+
+
+def test_reanalyze_condenses_again_after_a_member_changes():
+    solver = FrameSolver(storey_frame(6, 3))
+    solver.run()
+
+    solver.model.element_properties[solver.model.substructures["storey 2"] - 1, 2] *= 1.5
+    results = solver.reanalyze()
+    path = next(record.sizes["path"] for record in results.phases if record.name == "update")
+    assert path == "full"
+    assert solver.condensation.sizes()["superelements"] == 4
+    assert_same_results(results, plain_results(solver.model))